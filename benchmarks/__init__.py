@@ -0,0 +1,6 @@
+"""
+    Benchmarks for the text-on-path pipeline.
+
+    Run with ``python -m benchmarks``. Every workload is generated
+    synthetically, so no network access or data files are needed.
+"""
@@ -0,0 +1,109 @@
+import argparse
+import fnmatch
+import sys
+
+from benchmarks import baselines, harness
+from benchmarks.harness import BenchmarkResult
+from benchmarks.suite import get_benchmarks, REGRESSION_BENCHMARKS
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    return '%-48s %12.1f µs %14.0f %-10s %10.1f KiB %10d' % (
+        result.benchmark.name,
+        result.seconds_per_call * 1e6,
+        result.items_per_second,
+        result.benchmark.unit + '/s',
+        result.peak_memory / 1024,
+        result.retained_blocks
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Runs the benchmarks for the text-on-path pipeline.'
+    )
+    parser.add_argument(
+        'patterns',
+        nargs='*',
+        default=['*'],
+        help='glob patterns of the benchmark names to run'
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.2,
+        help='the minimum duration in seconds of each round of calls'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='the number of rounds, of which the fastest is reported'
+    )
+    parser.add_argument(
+        '--regressions',
+        action='store_true',
+        help='only run the benchmarks that have stored baselines'
+    )
+    parser.add_argument(
+        '--save-baselines',
+        action='store_true',
+        help='record the results as the stored baselines'
+    )
+    parser.add_argument(
+        '--compare',
+        action='store_true',
+        help='compare the results against the stored baselines, and exit '
+             'with an error if any of them regressed'
+    )
+    args = parser.parse_args()
+
+    benchmarks = [
+        benchmark for benchmark in get_benchmarks()
+        if any(
+            fnmatch.fnmatchcase(benchmark.name, pattern)
+            for pattern in args.patterns
+        )
+        and (not args.regressions or benchmark.name in REGRESSION_BENCHMARKS)
+    ]
+    if len(benchmarks) == 0:
+        parser.error('no benchmarks match the given patterns')
+
+    print('%-48s %15s %25s %14s %10s' % (
+        'benchmark', 'time per call', 'throughput', 'peak memory', 'retained'
+    ))
+
+    def report(result: BenchmarkResult):
+        print(_format_result(result))
+        sys.stdout.flush()
+
+    results = harness.run(benchmarks, args.min_time, args.repeat, report)
+    if not args.save_baselines and not args.compare:
+        return
+
+    calibration_time = baselines.measure_calibration_time(
+        args.min_time,
+        args.repeat
+    )
+    if args.save_baselines:
+        baselines.save_baselines(results, calibration_time)
+        print('Saved the baselines to %s' % baselines.BASELINES_PATH)
+    if args.compare:
+        stored_baselines = baselines.load_baselines()
+        regressions = []
+        for result in results:
+            if result.benchmark.name in stored_baselines:
+                regressions += baselines.compare(
+                    result,
+                    stored_baselines[result.benchmark.name],
+                    calibration_time
+                )
+        for regression in regressions:
+            print('Regression: %s' % regression)
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+    Stored baselines of the regression benchmarks, and the comparison of new
+    results against them.
+
+    Timings depend on the machine that records them, so they are stored
+    relative to the time of a fixed pure-Python calibration workload, measured
+    at the same time. Peak memory is stored in bytes, and retained memory as
+    the number of memory blocks that each call leaves allocated. Temporary
+    allocations are only covered by the peak memory.
+"""
+import json
+import os
+from typing import Dict, List
+
+from benchmarks import harness
+from benchmarks.harness import BenchmarkResult
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+DEFAULT_TIME_TOLERANCE = 1.0
+"""The allowed relative slowdown before a benchmark is a regression."""
+
+DEFAULT_MEMORY_TOLERANCE = 0.25
+"""
+The allowed relative growth of peak memory and retained blocks before it is a
+regression.
+"""
+
+Baseline = Dict[str, float]
+
+
+def _calibration_workload():
+    total = 0
+    for i in range(10000):
+        total += i * i % 7
+    return total
+
+
+def measure_calibration_time(min_time: float = 0.2, repeat: int = 3) -> float:
+    """
+    :param min_time:
+        the minimum duration of each round of calls
+    :param repeat:
+        the number of rounds
+    :return:
+        the seconds per call of the calibration workload on this machine
+    """
+    _, seconds_per_call = harness.measure_time(
+        _calibration_workload,
+        min_time,
+        repeat
+    )
+    return seconds_per_call
+
+
+def load_baselines(path: str = BASELINES_PATH) -> Dict[str, Baseline]:
+    """
+    :param path:
+        the path of the baselines file
+    :return:
+        the baselines indexed by the benchmark name, or an empty dictionary
+        if the file does not exist
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file)['benchmarks']
+
+
+def save_baselines(
+        results: List[BenchmarkResult],
+        calibration_time: float,
+        path: str = BASELINES_PATH
+):
+    """
+    Records the results as the new baselines. Existing baselines of
+    benchmarks that are not in ``results`` are kept, as are their tolerances.
+
+    :param results:
+        the results to record
+    :param calibration_time:
+        the result of :func:`measure_calibration_time` on the machine the
+        results were measured on
+    :param path:
+        the path of the baselines file
+    """
+    baselines = load_baselines(path)
+    for result in results:
+        baseline = baselines.setdefault(result.benchmark.name, {})
+        baseline['relative_time'] = result.seconds_per_call / calibration_time
+        baseline['peak_memory'] = result.peak_memory
+        baseline['retained_blocks'] = result.retained_blocks
+    with open(path, 'w') as file:
+        json.dump(
+            {'benchmarks': baselines},
+            file,
+            indent=2,
+            sort_keys=True
+        )
+        file.write('\n')
+
+
+def compare(
+        result: BenchmarkResult,
+        baseline: Baseline,
+        calibration_time: float,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE
+) -> List[str]:
+    """
+    :param result:
+        the new result of a benchmark
+    :param baseline:
+        the stored baseline of the benchmark. A ``time_tolerance`` or
+        ``memory_tolerance`` in the baseline overrides the given tolerances.
+    :param calibration_time:
+        the result of :func:`measure_calibration_time` on this machine
+    :param time_tolerance:
+        the allowed relative slowdown, for example ``1.0`` allows the
+        benchmark to take twice as long as its baseline
+    :param memory_tolerance:
+        the allowed relative growth of peak memory and retained blocks
+    :return:
+        a description of each regression, or an empty list if there are none
+    """
+    regressions = []
+    time_tolerance = baseline.get('time_tolerance', time_tolerance)
+    memory_tolerance = baseline.get('memory_tolerance', memory_tolerance)
+
+    relative_time = result.seconds_per_call / calibration_time
+    if relative_time > baseline['relative_time'] * (1 + time_tolerance):
+        regressions.append(
+            '%s takes %.1fx as long as its baseline (tolerance %.0f%%)' % (
+                result.benchmark.name,
+                relative_time / baseline['relative_time'],
+                time_tolerance * 100
+            )
+        )
+
+    # Allow a small absolute slack, so that tiny workloads do not fail on
+    # the noise of the interpreter's own allocations.
+    memory_limit = baseline['peak_memory'] * (1 + memory_tolerance) + 1024
+    if result.peak_memory > memory_limit:
+        regressions.append(
+            '%s allocates %d bytes, up from %d (tolerance %.0f%%)' % (
+                result.benchmark.name,
+                result.peak_memory,
+                baseline['peak_memory'],
+                memory_tolerance * 100
+            )
+        )
+
+    # Allow a few blocks of slack, for the interpreter's own allocations.
+    if 'retained_blocks' in baseline:
+        blocks_limit = \
+            baseline['retained_blocks'] * (1 + memory_tolerance) + 16
+        if result.retained_blocks > blocks_limit:
+            regressions.append(
+                '%s leaves %d blocks allocated, up from %d '
+                '(tolerance %.0f%%)' % (
+                    result.benchmark.name,
+                    result.retained_blocks,
+                    baseline['retained_blocks'],
+                    memory_tolerance * 100
+                )
+            )
+    return regressions
+
+
+def get_tolerance(name: str, default: float) -> float:
+    """
+    :param name:
+        the name of the environment variable that overrides the tolerance
+    :param default:
+        the tolerance to use if the environment variable is not set
+    :return:
+        the tolerance
+    """
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    return float(value)
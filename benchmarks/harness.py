@@ -0,0 +1,168 @@
+import gc
+import time
+import tracemalloc
+from typing import Callable, Tuple, List, Optional
+
+Workload = Tuple[Callable[[], object], int]
+"""A callable to measure, and the number of items it processes per call."""
+
+
+class Benchmark:
+    """
+    A named workload. ``setup`` is only called when the benchmark is run, so
+    that expensive inputs are not generated for benchmarks that are skipped.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            setup: Callable[[], Workload],
+            unit: str = 'items'
+    ):
+        """
+        :param name:
+            the name of the benchmark
+        :param setup:
+            returns the callable to measure and the number of items it
+            processes per call
+        :param unit:
+            the name of the items that are processed, for example ``glyphs``
+        """
+        self.name = name
+        self.setup = setup
+        self.unit = unit
+
+
+class BenchmarkResult:
+
+    def __init__(
+            self,
+            benchmark: Benchmark,
+            calls: int,
+            seconds_per_call: float,
+            items_per_call: int,
+            peak_memory: int,
+            retained_blocks: int = 0
+    ):
+        self.benchmark = benchmark
+        self.calls = calls
+        self.seconds_per_call = seconds_per_call
+        self.items_per_call = items_per_call
+        self.peak_memory = peak_memory
+        self.retained_blocks = retained_blocks
+
+    @property
+    def items_per_second(self) -> float:
+        if self.seconds_per_call == 0:
+            return float('inf')
+        return self.items_per_call / self.seconds_per_call
+
+
+def measure_time(
+        function: Callable[[], object],
+        min_time: float = 0.2,
+        repeat: int = 3
+) -> Tuple[int, float]:
+    """
+    :param function:
+        the function to measure
+    :param min_time:
+        the minimum duration of each round of calls
+    :param repeat:
+        the number of rounds. The fastest round is used, as slower rounds are
+        usually caused by other processes.
+    :return:
+        the number of calls per round, and the seconds per call of the
+        fastest round
+    """
+    # Find how many calls are needed to fill ``min_time``.
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        duration = time.perf_counter() - start
+        if duration >= min_time:
+            break
+        calls *= 2 if duration == 0 else \
+            max(2, min(10, int(min_time / duration) + 1))
+
+    best = duration / calls
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(calls):
+                function()
+            best = min(best, (time.perf_counter() - start) / calls)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return calls, best
+
+
+def measure_memory(function: Callable[[], object]) -> Tuple[int, int]:
+    """
+    :param function:
+        the function to measure
+    :return:
+        the peak number of bytes allocated by Python during one call, and the
+        number of memory blocks that the call retains: blocks allocated
+        during the call that are still allocated when it returns, including
+        its result and anything it adds to caches. Blocks that are allocated
+        and freed during the call are not counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak_size = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+    retained_blocks = sum(
+        statistic.count
+        for statistic in snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__)
+        ]).statistics('filename')
+    )
+    return peak_size, retained_blocks
+
+
+def run(
+        benchmarks: List[Benchmark],
+        min_time: float = 0.2,
+        repeat: int = 3,
+        report: Optional[Callable[[BenchmarkResult], None]] = None
+) -> List[BenchmarkResult]:
+    """
+    :param benchmarks:
+        the benchmarks to run
+    :param min_time:
+        the minimum duration of each round of calls
+    :param repeat:
+        the number of rounds for each benchmark
+    :param report:
+        called with each result as soon as it is available
+    :return:
+        the results of each benchmark
+    """
+    results = []
+    for benchmark in benchmarks:
+        function, items_per_call = benchmark.setup()
+        calls, seconds_per_call = measure_time(function, min_time, repeat)
+        peak_memory, retained_blocks = measure_memory(function)
+        result = BenchmarkResult(
+            benchmark,
+            calls,
+            seconds_per_call,
+            items_per_call,
+            peak_memory,
+            retained_blocks
+        )
+        if report is not None:
+            report(result)
+        results.append(result)
+    return results
@@ -0,0 +1,421 @@
+"""
+    The benchmarks for the hot paths of the text-on-path pipeline.
+"""
+import subprocess
+import sys
+from typing import List
+
+from benchmarks import workloads
+from benchmarks.harness import Benchmark, Workload
+
+LINE_VERTEX_COUNTS = [10, 1000, 100000]
+# The line string helpers are quadratic in the number of vertices, so
+# they are measured on smaller lines to keep the suite fast.
+HELPER_LINE_VERTEX_COUNTS = [10, 100, 1000]
+
+# Each statement is run in a new interpreter, to measure the cost of importing
+# the package in short-lived processes. ``pass`` measures the startup of the
+# interpreter itself.
+STARTUP_STATEMENTS = [
+    'pass',
+    'import pangocairohelpers',
+    'from pangocairohelpers import Side, line_helper',
+    'from pangocairohelpers.text_path import TextPath',
+]
+
+# Only benchmarks with a baseline stored in ``benchmarks/baselines.json`` are
+# listed, as a benchmark without a baseline fails the regression tests.
+REGRESSION_BENCHMARKS = [
+    'substring[1000]',
+    'parallel_offset_with_matching_direction[1000]',
+    'left_to_right_length[1000]',
+    'angles_at_offsets[1000]',
+    'next_offset_from_offset_in_line_string[1000]',
+]
+"""The benchmarks that are compared against the stored baselines."""
+
+
+def _layout_clusters(text_length: int) -> Workload:
+    from pangocairohelpers import LayoutClusters
+
+    layout, _ = workloads.layout(workloads.text(text_length))
+    return lambda: LayoutClusters(layout), text_length
+
+
+def _svg_generate_text_path_glyph_items(vertex_count: int) -> Workload:
+    from pangocffi import Alignment
+    from pangocairohelpers import LayoutClusters
+    from pangocairohelpers.text_path.layout_engines import Svg
+
+    layout, _ = workloads.layout(workloads.text(60))
+    layout_clusters = LayoutClusters(layout)
+    line_string = workloads.meandering_line_string(vertex_count)
+    engine = Svg(line_string, layout_clusters)
+    engine.alignment = Alignment.CENTER
+    return engine.generate_text_path_glyph_items, vertex_count
+
+
+def _substring(vertex_count: int) -> Workload:
+    from pangocairohelpers import line_string_helper
+
+    line_string = workloads.meandering_line_string(vertex_count)
+    start = line_string.length * 0.25
+    end = line_string.length * 0.75
+    return (
+        lambda: line_string_helper.substring(line_string, start, end),
+        vertex_count
+    )
+
+
+def _parallel_offset(vertex_count: int) -> Workload:
+    from pangocairohelpers import line_string_helper, Side
+
+    line_string = workloads.meandering_line_string(vertex_count)
+    return (
+        lambda: line_string_helper.parallel_offset_with_matching_direction(
+            line_string,
+            3,
+            side=Side.LEFT
+        ),
+        vertex_count
+    )
+
+
+def _polyline_parallel_offset(vertex_count: int) -> Workload:
+    import numpy as np
+    from pangocairohelpers import polyline_helper
+
+    line_string = workloads.meandering_line_string(vertex_count)
+    coords = np.asarray(line_string.coords)
+    return (
+        lambda: polyline_helper.parallel_offset(coords, 3),
+        vertex_count
+    )
+
+
+def _path_project(vertex_count: int) -> Workload:
+    from pangocairohelpers.path import PolylinePath
+
+    import numpy as np
+
+    line_string = workloads.meandering_line_string(vertex_count)
+    coords = np.asarray(line_string.coords)
+    coord = line_string.interpolate(line_string.length / 3).coords[0]
+    # Each call projects onto a new path, like the paths that text paths
+    # reverse, offset or simplify, so the segment index of large paths is
+    # built every time.
+    return lambda: PolylinePath(coords).project(coord), vertex_count
+
+
+def _line_string_helper(function_name: str, vertex_count: int) -> Workload:
+    from pangocairohelpers import line_string_helper
+
+    line_string = workloads.meandering_line_string(vertex_count)
+    function = getattr(line_string_helper, function_name)
+    return lambda: function(line_string), vertex_count
+
+
+def _next_offset_from_offset(vertex_count: int) -> Workload:
+    from pangocairohelpers import line_string_helper
+
+    line_string = workloads.meandering_line_string(vertex_count)
+    current_offset = line_string.length / 2
+    return (
+        lambda: line_string_helper.next_offset_from_offset_in_line_string(
+            line_string,
+            current_offset,
+            10
+        ),
+        vertex_count
+    )
+
+
+def _upright_text_path_compute_baseline(vertex_count: int) -> Workload:
+    from pangocffi import Alignment
+    from pangocairohelpers.text_path import UprightTextPath
+
+    layout, _ = workloads.layout(workloads.text(30))
+    line_string = workloads.meandering_line_string(vertex_count, 400)
+
+    def run():
+        text_path = UprightTextPath(line_string, layout)
+        text_path.alignment = Alignment.CENTER
+        return text_path.compute_baseline()
+
+    return run, 1
+
+
+def _upright_text_path(vertex_count: int) -> Workload:
+    from pangocffi import Alignment
+    from pangocairohelpers.text_path import UprightTextPath
+
+    layout, context = workloads.layout(workloads.text(30))
+    line_string = workloads.meandering_line_string(vertex_count, 400)
+
+    def run():
+        text_path = UprightTextPath(line_string, layout)
+        text_path.alignment = Alignment.CENTER
+        text_path.vertical_offset = 3
+        text_path.draw(context)
+
+    return run, 1
+
+
+def _fit_font_size(vertex_count: int) -> Workload:
+    from pangocffi import Alignment
+    from pangocairohelpers.text_path import fit_font_size
+
+    layout, _ = workloads.layout(workloads.text(30))
+    line_string = workloads.meandering_line_string(vertex_count, 400)
+
+    def run():
+        return fit_font_size(
+            layout,
+            line_string,
+            'Sans',
+            4,
+            40,
+            alignment=Alignment.CENTER,
+            max_curvature=1
+        )
+
+    return run, 1
+
+
+def _text_path_animation(vertex_count: int) -> Workload:
+    from pangocairohelpers.text_path import TextPath, TextPathAnimation
+
+    layout, _ = workloads.layout(workloads.text(30))
+    line_string = workloads.meandering_line_string(vertex_count, 10000)
+    text_path = TextPath(line_string, layout)
+    text_path.vertical_offset = 3
+    animation = TextPathAnimation(text_path)
+    start_offsets = range(0, 1000, 10)
+
+    def run():
+        for _ in animation.generate_frames(start_offsets):
+            pass
+
+    return run, len(start_offsets)
+
+
+def _transformed_text_path(vertex_count: int) -> Workload:
+    from pangocairohelpers.offset_cache import OffsetCache
+    from pangocairohelpers.text_path import TextPath
+
+    layout, _ = workloads.layout(workloads.text(30))
+    line_string = workloads.meandering_line_string(vertex_count, 10000)
+    # Panning at a single zoom level, which shares the offset of the line
+    transforms = [(1, 0, 0, 1, -x, 0) for x in range(0, 1000, 100)]
+    offset_cache = OffsetCache()
+
+    def run():
+        text_path = TextPath(line_string, layout)
+        text_path.vertical_offset = 3
+        text_path.offset_cache = offset_cache
+        for transform in transforms:
+            text_path.transform = transform
+            text_path.compute_glyph_arrays()
+
+    return run, len(transforms)
+
+
+def _shared_path(label_count: int) -> Workload:
+    from pangocairohelpers.text_path import SharedPath
+
+    layouts = [
+        workloads.layout(workloads.text(10))[0]
+        for _ in range(label_count)
+    ]
+    line_string = workloads.meandering_line_string(1000, 10000)
+
+    def run():
+        shared_path = SharedPath(line_string)
+        for index, layout in enumerate(layouts):
+            label = shared_path.add_label(layout)
+            label.start_offset = index * 100
+            label.vertical_offset = 3
+        shared_path.compute_glyph_arrays()
+
+    return run, label_count
+
+
+def _text_path_draw(text_length: int) -> Workload:
+    from pangocairohelpers.text_path import TextPath
+
+    layout, context = workloads.layout(workloads.text(text_length))
+    line_string = workloads.meandering_line_string(100, 10000)
+    text_path = TextPath(line_string, layout)
+    return lambda: text_path.draw(context), text_length
+
+
+def _render_tiles(max_workers: int) -> Workload:
+    from shapely.affinity import translate
+    from pangocairohelpers import TileRenderer
+    from pangocairohelpers.text_path import LabelSpec
+    from pangocairohelpers.text_path.batch_placement import compute_placement
+
+    # Spread 200 labels over a grid of 8 by 8 tiles
+    placements = []
+    for i in range(200):
+        line_string = translate(
+            workloads.meandering_line_string(20, 200, seed=i),
+            (i % 8) * 256,
+            (i // 8 % 8) * 256 + 100
+        )
+        placements.append(compute_placement(LabelSpec(
+            workloads.text(20, seed=i),
+            'Sans 10',
+            list(line_string.coords)
+        )))
+    renderer = TileRenderer(placements, max_workers=max_workers)
+    tiles = renderer.get_tiles()
+    return lambda: list(renderer.render_tiles(tiles)), len(tiles)
+
+
+def _pick_index_query_point(glyph_count: int) -> Workload:
+    import math
+    import numpy as np
+    from pangocairohelpers import GlyphExtent, PickIndex
+    from pangocairohelpers.text_path import PlacedCluster, TextPathPlacement
+
+    # Labels of 20 glyphs, scattered with random rotations
+    generator = np.random.default_rng(0)
+    placements = []
+    for _ in range(glyph_count // 20):
+        x, y = generator.uniform(0, 4000, 2)
+        rotation = generator.uniform(-1, 1)
+        placements.append(TextPathPlacement('', [], [
+            PlacedCluster(
+                i, i, i + 1, 0, [],
+                x + i * 8 * math.cos(rotation),
+                y + i * 8 * math.sin(rotation),
+                rotation,
+                GlyphExtent(0, 0, 8, 12, 9)
+            )
+            for i in range(20)
+        ]))
+    index = PickIndex(placements)
+    points = generator.uniform(0, 4000, (1000, 2)).tolist()
+
+    def run():
+        for x, y in points:
+            index.query_point(x, y)
+
+    return run, len(points)
+
+
+def _startup(statement: str) -> Workload:
+    command = [sys.executable, '-c', statement]
+    return lambda: subprocess.run(command, check=True), 1
+
+
+def get_benchmarks() -> List[Benchmark]:
+    """
+    :return:
+        every benchmark in the suite
+    """
+    benchmarks = [
+        Benchmark(
+            'layout_clusters[%d]' % text_length,
+            lambda text_length=text_length: _layout_clusters(text_length),
+            'characters'
+        )
+        for text_length in [12, 10000]
+    ]
+    for vertex_count in LINE_VERTEX_COUNTS:
+        benchmarks.append(Benchmark(
+            'svg_generate_text_path_glyph_items[%d]' % vertex_count,
+            lambda vertex_count=vertex_count:
+                _svg_generate_text_path_glyph_items(vertex_count),
+            'vertices'
+        ))
+    for vertex_count in LINE_VERTEX_COUNTS:
+        benchmarks.append(Benchmark(
+            'path_project[%d]' % vertex_count,
+            lambda vertex_count=vertex_count: _path_project(vertex_count),
+            'vertices'
+        ))
+    for vertex_count in HELPER_LINE_VERTEX_COUNTS:
+        benchmarks.append(Benchmark(
+            'substring[%d]' % vertex_count,
+            lambda vertex_count=vertex_count: _substring(vertex_count),
+            'vertices'
+        ))
+    for vertex_count in HELPER_LINE_VERTEX_COUNTS:
+        benchmarks.append(Benchmark(
+            'parallel_offset_with_matching_direction[%d]' % vertex_count,
+            lambda vertex_count=vertex_count: _parallel_offset(vertex_count),
+            'vertices'
+        ))
+        benchmarks.append(Benchmark(
+            'polyline_parallel_offset[%d]' % vertex_count,
+            lambda vertex_count=vertex_count:
+                _polyline_parallel_offset(vertex_count),
+            'vertices'
+        ))
+    for function_name in ['left_to_right_length', 'angles_at_offsets']:
+        benchmarks.append(Benchmark(
+            '%s[1000]' % function_name,
+            lambda function_name=function_name:
+                _line_string_helper(function_name, 1000),
+            'vertices'
+        ))
+    benchmarks.append(Benchmark(
+        'next_offset_from_offset_in_line_string[1000]',
+        lambda: _next_offset_from_offset(1000),
+        'vertices'
+    ))
+    benchmarks.append(Benchmark(
+        'upright_text_path_compute_baseline[100]',
+        lambda: _upright_text_path_compute_baseline(100),
+        'labels'
+    ))
+    benchmarks.append(Benchmark(
+        'upright_text_path[100]',
+        lambda: _upright_text_path(100),
+        'labels'
+    ))
+    benchmarks.append(Benchmark(
+        'fit_font_size[100]',
+        lambda: _fit_font_size(100),
+        'labels'
+    ))
+    benchmarks.append(Benchmark(
+        'text_path_animation[1000]',
+        lambda: _text_path_animation(1000),
+        'frames'
+    ))
+    benchmarks.append(Benchmark(
+        'transformed_text_path[1000]',
+        lambda: _transformed_text_path(1000),
+        'transforms'
+    ))
+    benchmarks.append(Benchmark(
+        'shared_path[100]',
+        lambda: _shared_path(100),
+        'labels'
+    ))
+    benchmarks.append(Benchmark(
+        'text_path_draw[1000]',
+        lambda: _text_path_draw(1000),
+        'characters'
+    ))
+    benchmarks.append(Benchmark(
+        'pick_index_query_point[100000]',
+        lambda: _pick_index_query_point(100000),
+        'queries'
+    ))
+    for max_workers in [1, 4]:
+        benchmarks.append(Benchmark(
+            'render_tiles[workers=%d]' % max_workers,
+            lambda max_workers=max_workers: _render_tiles(max_workers),
+            'tiles'
+        ))
+    for statement in STARTUP_STATEMENTS:
+        benchmarks.append(Benchmark(
+            'startup[%s]' % statement,
+            lambda statement=statement: _startup(statement),
+            'processes'
+        ))
+    return benchmarks
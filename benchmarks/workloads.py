@@ -0,0 +1,88 @@
+"""
+    Synthetic inputs for the benchmarks. Everything is generated from a fixed
+    seed, so that runs are comparable with each other.
+"""
+import math
+import random
+from typing import Tuple
+
+from shapely.geometry import LineString
+
+WORDS = [
+    'Street', 'Road', 'Avenue', 'Lane', 'Hi', 'from', 'Παν語', 'North',
+    'Bridge', 'Market', 'Old', 'Mill', 'Harbour', 'Way'
+]
+
+
+def text(length: int, seed: int = 0) -> str:
+    """
+    :param length:
+        the number of characters in the text
+    :param seed:
+        the seed for choosing words
+    :return:
+        a text of words separated by spaces
+    """
+    generator = random.Random(seed)
+    words = []
+    word_length = 0
+    while word_length < length:
+        word = generator.choice(WORDS)
+        words.append(word)
+        word_length += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+def meandering_line_string(
+        vertex_count: int,
+        length: float = 1000,
+        amplitude: float = 20,
+        seed: int = 0
+) -> LineString:
+    """
+    :param vertex_count:
+        the number of vertices in the line
+    :param length:
+        the horizontal length of the line
+    :param amplitude:
+        the maximum vertical distance of the line from ``y = 0``
+    :param seed:
+        the seed for the random noise added to the line
+    :return:
+        a line going left to right that never intersects itself, as x always
+        increases
+    """
+    generator = random.Random(seed)
+    coords = []
+    for i in range(vertex_count):
+        x = length * i / max(1, vertex_count - 1)
+        y = amplitude * math.sin(x / length * math.pi * 4) + \
+            generator.uniform(-1, 1) * amplitude * 0.05
+        coords.append((x, y))
+    return LineString(coords)
+
+
+def layout(content: str, font: str = 'Sans 10') -> Tuple:
+    """
+    :param content:
+        the text of the layout
+    :param font:
+        the Pango font description for the text
+    :return:
+        a layout on a context of an SVG surface that discards its output, and
+        the context itself
+    """
+    from cairocffi import Context, SVGSurface
+    import pangocairocffi
+    from pangocffi import FontDescription, units_from_double
+
+    surface = SVGSurface(None, 1000, 1000)
+    context = Context(surface)
+    pango_layout = pangocairocffi.create_layout(context)
+    family, size = font.rsplit(' ', 1)
+    font_description = FontDescription()
+    font_description.set_family(family)
+    font_description.set_size(units_from_double(float(size)))
+    pango_layout.set_font_description(font_description)
+    pango_layout.set_text(content)
+    return pango_layout, context
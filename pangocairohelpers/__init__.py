@@ -1,7 +1,49 @@
-from .side import Side  # noqa
-from .extent import Extent  # noqa
-from .glyph_extent import GlyphExtent  # noqa
-from . import point_helper  # noqa
-from . import line_helper  # noqa
-from . import line_string_helper  # noqa
-from .layout_clusters import LayoutClusters  # noqa
+"""
+    Helper modules for rendering text using pango and cairo.
+
+    Submodules, and the classes exported here, are imported on first access,
+    so that ``import pangocairohelpers`` does not load Shapely, NumPy or the
+    pango and cairo bindings until they are needed.
+"""
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .side import Side  # noqa
+    from .extent import Extent  # noqa
+    from .glyph_extent import GlyphExtent  # noqa
+    from . import instrumentation  # noqa
+    from . import point_helper  # noqa
+    from . import line_helper  # noqa
+    from . import line_string_helper  # noqa
+    from .layout_clusters import LayoutClusters  # noqa
+    from .tile_renderer import TileRenderer  # noqa
+    from .collision_index import CollisionIndex  # noqa
+    from .pick_index import PickIndex  # noqa
+
+_lazy_attributes = {
+    'Side': '.side',
+    'Extent': '.extent',
+    'GlyphExtent': '.glyph_extent',
+    'LayoutClusters': '.layout_clusters',
+    'TileRenderer': '.tile_renderer',
+    'CollisionIndex': '.collision_index',
+    'PickIndex': '.pick_index',
+}
+
+_lazy_submodules = [
+    'instrumentation',
+    'point_helper',
+    'line_helper',
+    'line_string_helper',
+]
+
+__all__ = list(_lazy_attributes) + _lazy_submodules
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    _lazy_attributes,
+    _lazy_submodules
+)
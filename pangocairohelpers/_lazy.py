@@ -0,0 +1,49 @@
+"""
+    Imports the exports of a package on first access, so that importing the
+    package does not load its dependencies until they are needed.
+"""
+import importlib
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+        package_name: str,
+        package_globals: Dict[str, Any],
+        attributes: Dict[str, str],
+        submodules: Sequence[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    :param package_name:
+        the ``__name__`` of the package
+    :param package_globals:
+        the ``globals()`` of the package, which each value is cached in once
+        it has been imported
+    :param attributes:
+        the name of each exported attribute, and the relative name of the
+        module it is imported from
+    :param submodules:
+        the names of the submodules that are exported
+    :return:
+        the ``__getattr__`` and ``__dir__`` functions of the package
+    """
+    exported_names = set(attributes) | set(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            module = importlib.import_module(attributes[name], package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module('.' + name, package_name)
+        else:
+            raise AttributeError(
+                'module %r has no attribute %r' % (package_name, name)
+            )
+        # Cache the value, so that this function is only called once per
+        # name.
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | exported_names)
+
+    return __getattr__, __dir__
@@ -0,0 +1,66 @@
+import math
+from typing import Iterator, Tuple
+
+from pangocairohelpers import Extent
+
+
+class CollisionIndex:
+    """
+    A grid of extents that have already been occupied, for example by the
+    glyphs of labels that have been placed, used to reject new extents that
+    would overlap them.
+
+    Each extent is stored in every cell of the grid it covers, so that only
+    the extents in nearby cells need to be compared.
+    """
+
+    def __init__(self, cell_size: float = 64):
+        """
+        :param cell_size:
+            the width and height of each cell of the grid. Cells that are a
+            few times larger than a typical extent work best.
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_cells(self, extent: Extent) -> Iterator[Tuple[int, int]]:
+        min_x = math.floor(extent.x / self.cell_size)
+        min_y = math.floor(extent.y / self.cell_size)
+        max_x = math.floor((extent.x + extent.width) / self.cell_size)
+        max_y = math.floor((extent.y + extent.height) / self.cell_size)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                yield cell_x, cell_y
+
+    def intersects(self, extent: Extent) -> bool:
+        """
+        :param extent:
+            the extent to test
+        :return:
+            ``True`` if the extent overlaps or touches any extent in the index
+        """
+        for cell in self._get_cells(extent):
+            for other in self._cells.get(cell, ()):
+                if extent.intersects(other):
+                    return True
+        return False
+
+    def insert(self, extent: Extent):
+        """
+        :param extent:
+            the extent to add to the index
+        """
+        for cell in self._get_cells(extent):
+            self._cells.setdefault(cell, []).append(extent)
+        self._count += 1
+
+    def clear(self):
+        """
+        Removes every extent from the index.
+        """
+        self._cells.clear()
+        self._count = 0
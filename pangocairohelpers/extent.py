@@ -1,4 +1,12 @@
+from typing import Optional, Tuple, Any
+
+
 class Extent:
+    """
+    An immutable axis-aligned rectangle
+    """
+
+    __slots__ = ('x', 'y', 'width', 'height')
 
     def __init__(
             self,
@@ -7,7 +15,65 @@ class Extent:
             width: float = 0,
             height: float = 0
     ):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'width', width)
+        object.__setattr__(self, 'height', height)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return self.x, self.y, self.width, self.height
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            "'%s' object is immutable" % type(self).__name__
+        )
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            "'%s' object is immutable" % type(self).__name__
+        )
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return '%s%r' % (type(self).__name__, self._values())
+
+    def intersects(self, other: 'Extent') -> bool:
+        """
+        :param other:
+            the extent to compare against
+        :return:
+            ``True`` if the two extents overlap or touch each other
+        """
+        return self.x <= other.x + other.width and \
+            other.x <= self.x + self.width and \
+            self.y <= other.y + other.height and \
+            other.y <= self.y + self.height
+
+    def union(self, other: Optional['Extent']) -> 'Extent':
+        """
+        :param other:
+            the extent to combine with. If ``None``, a copy of this extent is
+            returned.
+        :return:
+            the smallest extent that covers both extents
+        """
+        if other is None:
+            return Extent(self.x, self.y, self.width, self.height)
+        x = min(self.x, other.x)
+        y = min(self.y, other.y)
+        return Extent(
+            x,
+            y,
+            max(self.x + self.width, other.x + other.width) - x,
+            max(self.y + self.height, other.y + other.height) - y
+        )
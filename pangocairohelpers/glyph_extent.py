@@ -1,7 +1,14 @@
+from typing import Tuple, Any
+
 from pangocairohelpers import Extent
 
 
 class GlyphExtent(Extent):
+    """
+    An immutable extent of a glyph, including the position of the baseline
+    """
+
+    __slots__ = ('baseline',)
 
     def __init__(
             self,
@@ -12,4 +19,7 @@ class GlyphExtent(Extent):
             baseline: float = 0
     ):
         super().__init__(x, y, width, height)
-        self.baseline = baseline
+        object.__setattr__(self, 'baseline', baseline)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return self.x, self.y, self.width, self.height, self.baseline
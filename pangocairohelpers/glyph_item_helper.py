@@ -0,0 +1,255 @@
+"""
+    Functions to help with pango's ``GlyphItem`` class.
+
+    pangocffi does not expose the glyphs or the font of a ``GlyphItem``, so
+    the (public and stable) Pango structures are declared here in order to
+    read them.
+"""
+from typing import List, Tuple, Optional
+
+import cffi
+import cairocffi
+import pangocairocffi
+import pangocffi
+from pangocffi import GlyphItem, units_to_double
+
+Glyph = Tuple[int, float, float]
+
+ffi = cffi.FFI()
+ffi.cdef("""
+    typedef uint32_t PangoGlyph;
+
+    typedef struct {
+        int32_t width;
+        int32_t x_offset;
+        int32_t y_offset;
+    } PangoGlyphGeometry;
+
+    typedef struct {
+        unsigned int is_cluster_start : 1;
+        unsigned int is_color : 1;
+    } PangoGlyphVisAttr;
+
+    typedef struct {
+        PangoGlyph glyph;
+        PangoGlyphGeometry geometry;
+        PangoGlyphVisAttr attr;
+    } PangoGlyphInfo;
+
+    typedef struct {
+        int num_glyphs;
+        PangoGlyphInfo *glyphs;
+        int *log_clusters;
+        int space;
+    } PangoGlyphString;
+
+    typedef struct {
+        void *shape_engine;
+        void *lang_engine;
+        void *font;
+        uint8_t level;
+        uint8_t gravity;
+        uint8_t flags;
+        uint8_t script;
+        void *language;
+        void *extra_attrs;
+    } PangoAnalysis;
+
+    typedef struct {
+        int offset;
+        int length;
+        int num_chars;
+        PangoAnalysis analysis;
+    } PangoItem;
+
+    typedef struct {
+        PangoItem *item;
+        PangoGlyphString *glyphs;
+    } PangoGlyphItem;
+""")
+
+PANGO_GLYPH_EMPTY = 0x0FFFFFFF
+PANGO_GLYPH_UNKNOWN_FLAG = 0x10000000
+
+
+def _get_glyph_item_struct(glyph_item: GlyphItem) -> ffi.CData:
+    return ffi.cast('PangoGlyphItem *', glyph_item.get_pointer())
+
+
+def _get_font_pointer(glyph_item: GlyphItem) -> ffi.CData:
+    font_pointer = _get_glyph_item_struct(glyph_item).item.analysis.font
+    if font_pointer == ffi.NULL:
+        raise ValueError('glyph item has no font')
+    return font_pointer
+
+
+def get_glyphs(glyph_item: GlyphItem) -> List[Glyph]:
+    """
+    :param glyph_item:
+        the glyph item to read the glyphs from
+    :return:
+        a list of ``(glyph, x, y)`` tuples, where ``x`` and ``y`` are the
+        position of the glyph's origin relative to the origin of the glyph
+        item. Empty and unknown glyphs (which pango renders as hex boxes) are
+        omitted.
+    """
+    glyph_string = _get_glyph_item_struct(glyph_item).glyphs
+    glyphs = []
+    x = 0
+    for i in range(glyph_string.num_glyphs):
+        glyph_info = glyph_string.glyphs[i]
+        glyph = glyph_info.glyph
+        geometry = glyph_info.geometry
+        if glyph != PANGO_GLYPH_EMPTY and \
+                not glyph & PANGO_GLYPH_UNKNOWN_FLAG:
+            glyphs.append((
+                glyph,
+                units_to_double(x + geometry.x_offset),
+                units_to_double(geometry.y_offset)
+            ))
+        x += geometry.width
+    return glyphs
+
+
+def get_scaled_font(glyph_item: GlyphItem) -> cairocffi.ScaledFont:
+    """
+    :param glyph_item:
+        a glyph item that was shaped by a pangocairo font map
+    :return:
+        the cairo scaled font that pango uses to render the glyph item
+    """
+    pango_cairo_font_pointer = pangocairocffi.ffi.cast(
+        'PangoCairoFont *',
+        _get_font_pointer(glyph_item)
+    )
+    scaled_font_pointer = pangocairocffi.pangocairo.\
+        pango_cairo_font_get_scaled_font(pango_cairo_font_pointer)
+    # noinspection PyProtectedMember
+    return cairocffi.ScaledFont._from_pointer(  # noqa
+        cairocffi.ffi.cast('cairo_scaled_font_t *', scaled_font_pointer),
+        incref=True
+    )
+
+
+def get_scaled_font_key(scaled_font: cairocffi.ScaledFont) -> int:
+    """
+    :param scaled_font:
+        the scaled font to identify
+    :return:
+        a key identifying the scaled font. The key is only unique for as long
+        as a reference to ``scaled_font`` is kept.
+    """
+    # noinspection PyProtectedMember
+    return int(cairocffi.ffi.cast('uintptr_t', scaled_font._pointer))  # noqa
+
+
+def get_font_description_string(glyph_item: GlyphItem) -> str:
+    """
+    :param glyph_item:
+        the glyph item to describe the font of
+    :return:
+        the description of the font used by the glyph item, in the format
+        understood by ``pango_font_description_from_string()``
+    """
+    font_pointer = pangocffi.ffi.cast(
+        'PangoFont *',
+        _get_font_pointer(glyph_item)
+    )
+    description_pointer = pangocffi.pango.pango_font_describe(font_pointer)
+    string_pointer = pangocffi.pango.pango_font_description_to_string(
+        description_pointer
+    )
+    description = pangocffi.ffi.string(string_pointer).decode('utf-8')
+    pangocffi.glib.g_free(string_pointer)
+    pangocffi.pango.pango_font_description_free(description_pointer)
+    return description
+
+
+def scale_font_description_string(
+        font_description_string: str,
+        scale: float
+) -> str:
+    """
+    :param font_description_string:
+        the description of a font, as returned by
+        :func:`get_font_description_string`
+    :param scale:
+        the factor to scale the size of the font by
+    :return:
+        the description of the same font, with its size scaled
+    """
+    if scale == 1:
+        return font_description_string
+    description_pointer = pangocffi.pango.pango_font_description_from_string(
+        font_description_string.encode('utf-8')
+    )
+    size = pangocffi.pango.pango_font_description_get_size(
+        description_pointer
+    )
+    if pangocffi.pango.pango_font_description_get_size_is_absolute(
+            description_pointer
+    ):
+        pangocffi.pango.pango_font_description_set_absolute_size(
+            description_pointer,
+            size * scale
+        )
+    else:
+        pangocffi.pango.pango_font_description_set_size(
+            description_pointer,
+            int(round(size * scale))
+        )
+    string_pointer = pangocffi.pango.pango_font_description_to_string(
+        description_pointer
+    )
+    description = pangocffi.ffi.string(string_pointer).decode('utf-8')
+    pangocffi.glib.g_free(string_pointer)
+    pangocffi.pango.pango_font_description_free(description_pointer)
+    return description
+
+
+def load_scaled_font(
+        context: cairocffi.Context,
+        font_description_string: str,
+        pango_context: Optional[pangocffi.Context] = None
+) -> cairocffi.ScaledFont:
+    """
+    :param context:
+        the context that the font will be used on
+    :param font_description_string:
+        the description of the font, as returned by
+        :func:`get_font_description_string`
+    :param pango_context:
+        the pango context to load the font with. If not set, a pango context
+        is created for ``context``.
+    :return:
+        the cairo scaled font that pango would use to render text in the
+        described font on ``context``
+    """
+    if pango_context is None:
+        pango_context = pangocairocffi.create_context(context)
+    font_map_pointer = pangocairocffi.pangocairo.\
+        pango_cairo_font_map_get_default()
+    description_pointer = pangocffi.pango.pango_font_description_from_string(
+        font_description_string.encode('utf-8')
+    )
+    font_pointer = pangocffi.pango.pango_font_map_load_font(
+        pangocffi.ffi.cast('PangoFontMap *', font_map_pointer),
+        pango_context.get_pointer(),
+        description_pointer
+    )
+    pangocffi.pango.pango_font_description_free(description_pointer)
+    if font_pointer == pangocffi.ffi.NULL:
+        raise ValueError(
+            'Failed to load font "%s"' % font_description_string
+        )
+    scaled_font_pointer = pangocairocffi.pangocairo.\
+        pango_cairo_font_get_scaled_font(
+            pangocairocffi.ffi.cast('PangoCairoFont *', font_pointer)
+        )
+    # noinspection PyProtectedMember
+    scaled_font = cairocffi.ScaledFont._from_pointer(  # noqa
+        cairocffi.ffi.cast('cairo_scaled_font_t *', scaled_font_pointer),
+        incref=True
+    )
+    pangocffi.gobject.g_object_unref(font_pointer)
+    return scaled_font
@@ -0,0 +1,112 @@
+from threading import Lock
+from typing import List, Tuple, Any
+
+from cairocffi import Context, ImageSurface, ScaledFont, FORMAT_A8
+from pangocffi import GlyphItem
+
+from pangocairohelpers import glyph_item_helper, instrumentation
+from pangocairohelpers.lru_cache import LruCache
+
+Path = List[Tuple[Any, Tuple[float, ...]]]
+
+
+def _get_path_size(entry: Tuple[Path, ScaledFont]) -> int:
+    path, _ = entry
+    return sum(len(points) for _, points in path) + len(path)
+
+
+class GlyphOutlineCache:
+    """
+    A cache of glyph outlines, as returned by cairo's ``copy_path()``, keyed
+    by the scaled font and the glyph id.
+
+    The cache is bounded by the number of path operations and coordinates it
+    holds, and evicts the least recently used outlines first.
+    """
+
+    def __init__(self, max_size: int = 1000000):
+        """
+        :param max_size:
+            the maximum number of path operations and coordinates to keep in
+            the cache
+        """
+        # The scaled font is kept alive by each entry, which guarantees that
+        # the key of the scaled font is not reused by another font for as
+        # long as it is in the cache.
+        self._outlines = LruCache(max_size, _get_path_size)
+        self._context = None
+        self._context_lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        return self._outlines.hits
+
+    @property
+    def misses(self) -> int:
+        return self._outlines.misses
+
+    def __len__(self) -> int:
+        return len(self._outlines)
+
+    def _extract_outline(self, scaled_font: ScaledFont, glyph: int) -> Path:
+        with self._context_lock:
+            if self._context is None:
+                self._context = Context(ImageSurface(FORMAT_A8, 0, 0))
+            self._context.new_path()
+            self._context.set_scaled_font(scaled_font)
+            self._context.glyph_path([(glyph, 0, 0)])
+            path = self._context.copy_path()
+            self._context.new_path()
+        return path
+
+    def get_outline(self, scaled_font: ScaledFont, glyph: int) -> Path:
+        """
+        :param scaled_font:
+            the scaled font to read the glyph from
+        :param glyph:
+            the id of the glyph
+        :return:
+            the outline of the glyph with its origin at ``(0, 0)``, in the
+            format of cairo's ``copy_path()``
+        """
+        key = (glyph_item_helper.get_scaled_font_key(scaled_font), glyph)
+        entry = self._outlines.get(key)
+        if entry is not None:
+            instrumentation.count(instrumentation.GLYPH_OUTLINE_CACHE_HITS)
+            path, _ = entry
+            return path
+        instrumentation.count(instrumentation.GLYPH_OUTLINE_CACHE_MISSES)
+        path = self._extract_outline(scaled_font, glyph)
+        self._outlines.put(key, (path, scaled_font))
+        return path
+
+    def append_glyph_item_path(self, context: Context, glyph_item: GlyphItem):
+        """
+        Appends the outlines of every glyph in a glyph item to the current
+        path of the context, relative to the context's current transformation
+        matrix.
+
+        :param context:
+            the context to append the path to
+        :param glyph_item:
+            the glyph item to append the outlines of
+        """
+        glyphs = glyph_item_helper.get_glyphs(glyph_item)
+        if len(glyphs) == 0:
+            return
+        scaled_font = glyph_item_helper.get_scaled_font(glyph_item)
+        for glyph, x, y in glyphs:
+            outline = self.get_outline(scaled_font, glyph)
+            context.translate(x, y)
+            context.append_path(outline)
+            context.translate(-x, -y)
+
+    def clear(self):
+        """
+        Removes every outline from the cache.
+        """
+        self._outlines.clear()
+
+
+default_glyph_outline_cache = GlyphOutlineCache()
+"""The cache used by text paths unless another one is provided."""
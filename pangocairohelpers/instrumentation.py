@@ -0,0 +1,258 @@
+"""
+    Opt-in instrumentation of the text-on-path pipeline.
+
+    While a :class:`Recorder` is active, the pipeline records the wall time
+    spent in each stage and counts Shapely calls, drawn glyphs and cache hits.
+    For example, to find out where the time goes when rendering a tile:
+
+    .. code-block:: python
+
+        with instrumentation.recording() as recorder:
+            for text_path in text_paths:
+                text_path.draw(context)
+        print(recorder.stage_times, recorder.counters)
+
+    Statistics are also recorded for each text path, and passed to the
+    ``callback`` of the recorder after each call to one of its methods.
+
+    When no recorder is active, each instrumented point only checks a module
+    global, so the instrumentation costs next to nothing.
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Callable, Iterator
+
+SHAPING = 'shaping'
+"""The stage where the layout is decomposed into clusters."""
+SIMPLIFYING = 'simplifying'
+"""The stage where the line string is simplified."""
+OFFSETTING = 'offsetting'
+"""The stage where the line string is offset from the text path."""
+PLACEMENT = 'placement'
+"""The stage where the layout engine positions the clusters."""
+DRAWING = 'drawing'
+"""The stage where the glyphs are drawn or appended to a path."""
+
+SHAPELY_INTERPOLATE = 'shapely.interpolate'
+SHAPELY_PROJECT = 'shapely.project'
+SHAPELY_INTERSECTION = 'shapely.intersection'
+SHAPELY_PARALLEL_OFFSET = 'shapely.parallel_offset'
+GLYPHS = 'glyphs'
+"""The number of clusters that were drawn or appended to a path."""
+GLYPH_OUTLINE_CACHE_HITS = 'glyph_outline_cache.hits'
+GLYPH_OUTLINE_CACHE_MISSES = 'glyph_outline_cache.misses'
+OFFSET_CACHE_HITS = 'offset_cache.hits'
+OFFSET_CACHE_MISSES = 'offset_cache.misses'
+
+
+class Statistics:
+    """
+    The wall time in seconds spent in each stage, and the value of each
+    counter, keyed by their names.
+    """
+
+    def __init__(self):
+        self.stage_times = {}
+        self.counters = {}
+
+    def add_stage_time(self, stage: str, seconds: float):
+        """
+        :param stage:
+            the name of the stage
+        :param seconds:
+            the wall time spent in the stage
+        """
+        self.stage_times[stage] = self.stage_times.get(stage, 0) + seconds
+
+    def increment(self, counter: str, amount: int = 1):
+        """
+        :param counter:
+            the name of the counter
+        :param amount:
+            how much to increment the counter by
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def __repr__(self):
+        return '%s(stage_times=%r, counters=%r)' % (
+            type(self).__name__,
+            self.stage_times,
+            self.counters
+        )
+
+
+class Recorder(Statistics):
+    """
+    Records the statistics of the whole pipeline while it is active, and the
+    statistics of each text path separately.
+
+    Recorders can be shared by several threads.
+    """
+
+    def __init__(
+            self,
+            callback: Optional[Callable[[object, Statistics], None]] = None
+    ):
+        """
+        :param callback:
+            called with the text path and the statistics of the call, after
+            each call to a method of a text path
+        """
+        super().__init__()
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_text_path_statistics(self) -> Optional[Statistics]:
+        return getattr(self._local, 'text_path_statistics', None)
+
+    def add_stage_time(self, stage: str, seconds: float):
+        with self._lock:
+            super().add_stage_time(stage, seconds)
+        text_path_statistics = self._get_text_path_statistics()
+        if text_path_statistics is not None:
+            text_path_statistics.add_stage_time(stage, seconds)
+
+    def increment(self, counter: str, amount: int = 1):
+        with self._lock:
+            super().increment(counter, amount)
+        text_path_statistics = self._get_text_path_statistics()
+        if text_path_statistics is not None:
+            text_path_statistics.increment(counter, amount)
+
+    @contextmanager
+    def text_path(self, text_path: object) -> Iterator[Statistics]:
+        """
+        Records the statistics of the calls made within the context
+        separately for ``text_path``, and passes them to the callback when
+        the context exits. Calls to other text paths within the context, for
+        example by ``UprightTextPath``, are attributed to ``text_path``.
+
+        :param text_path:
+            the text path being called
+        :return:
+            the statistics of the text path
+        """
+        text_path_statistics = self._get_text_path_statistics()
+        if text_path_statistics is not None:
+            yield text_path_statistics
+            return
+
+        text_path_statistics = Statistics()
+        self._local.text_path_statistics = text_path_statistics
+        try:
+            yield text_path_statistics
+        finally:
+            self._local.text_path_statistics = None
+        if self.callback is not None:
+            self.callback(text_path, text_path_statistics)
+
+
+_recorder = None  # type: Optional[Recorder]
+
+
+def get_recorder() -> Optional[Recorder]:
+    """
+    :return:
+        the active recorder, or ``None`` if instrumentation is disabled
+    """
+    return _recorder
+
+
+@contextmanager
+def recording(
+        callback: Optional[Callable[[object, Statistics], None]] = None
+) -> Iterator[Recorder]:
+    """
+    Enables instrumentation within the context.
+
+    :param callback:
+        called with the text path and the statistics of the call, after each
+        call to a method of a text path
+    :return:
+        the recorder of the statistics
+    """
+    global _recorder
+    previous_recorder = _recorder
+    recorder = Recorder(callback)
+    _recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _recorder = previous_recorder
+
+
+def count(counter: str, amount: int = 1):
+    """
+    Increments a counter of the active recorder, if there is one.
+
+    :param counter:
+        the name of the counter
+    :param amount:
+        how much to increment the counter by
+    """
+    if _recorder is not None:
+        _recorder.increment(counter, amount)
+
+
+class _Stage:
+
+    def __init__(self, recorder: Recorder, name: str):
+        self._recorder = recorder
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._recorder.add_stage_time(
+            self._name,
+            time.perf_counter() - self._start
+        )
+
+
+class _NullStage:
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_null_stage = _NullStage()
+
+
+def stage(name: str):
+    """
+    :param name:
+        the name of the stage
+    :return:
+        a context manager that adds the wall time spent within it to the
+        stage of the active recorder, if there is one
+    """
+    if _recorder is None:
+        return _null_stage
+    return _Stage(_recorder, name)
+
+
+def text_path_method(method: Callable) -> Callable:
+    """
+    Decorates a method of a text path, so that the statistics of each call
+    are recorded for the text path.
+
+    :param method:
+        the method to decorate
+    :return:
+        the decorated method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _recorder is None:
+            return method(self, *args, **kwargs)
+        with _recorder.text_path(self):
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,363 @@
+"""
+    A command line tool that places labels along line features, and renders
+    them to an SVG, PDF or PNG file.
+
+    Features are read one line at a time from a newline-delimited file, and
+    each label is drawn and written to the placements file as soon as it is
+    placed, so the features themselves are never held in memory. The extents
+    of the labels that were placed are kept, to reject labels that would
+    collide with them.
+
+    The memory used by the output depends on its format. A PNG is drawn to
+    an image of a fixed size, but SVG and PDF surfaces keep every label that
+    was drawn until the document is finished, so their memory grows with the
+    number of labels placed.
+
+    Two input formats are supported:
+
+    ``geojson``
+        one GeoJSON ``Feature`` per line, with a ``LineString`` or
+        ``MultiLineString`` geometry, and the label text in one of its
+        properties.
+
+    ``wkt``
+        one ``LineString`` or ``MultiLineString`` in WKT per line, followed by
+        a tab character and the label text.
+
+    For example::
+
+        pangocairohelpers-labels roads.ndjson map.png --width 1024 \\
+            --height 1024 --placements placements.ndjson
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from cairocffi import Context, ImageSurface, PDFSurface, SVGSurface, \
+    Surface, FORMAT_ARGB32
+from pangocffi import Alignment
+from shapely import wkt
+from shapely.errors import ShapelyError
+from shapely.geometry import shape, LineString, MultiLineString
+
+from pangocairohelpers import Extent, CollisionIndex
+from pangocairohelpers.text_path import LabelSpec, TextPathPlacement
+from pangocairohelpers.text_path.batch_placement import compute_placement
+
+Coordinates = List[Tuple[float, float]]
+
+# The errors raised by malformed lines, like invalid JSON or WKT, or a line
+# string with a single coordinate
+_FEATURE_ERRORS = (
+    ValueError,
+    TypeError,
+    KeyError,
+    AttributeError,
+    ShapelyError
+)
+
+_alignments = {
+    'left': Alignment.LEFT,
+    'center': Alignment.CENTER,
+    'right': Alignment.RIGHT,
+}
+
+
+def _get_line_coords(geometry) -> Optional[Coordinates]:
+    """
+    :return:
+        the coordinates of a line string, or of the longest line string in a
+        multi line string, or ``None`` for other geometries
+    """
+    if isinstance(geometry, MultiLineString):
+        if geometry.is_empty:
+            return None
+        geometry = max(geometry.geoms, key=lambda line: line.length)
+    if not isinstance(geometry, LineString) or geometry.is_empty:
+        return None
+    return list(geometry.coords)
+
+
+def read_geojson_features(
+        lines: Iterator[str],
+        text_property: str
+) -> Iterator[Optional[Tuple[str, Coordinates]]]:
+    """
+    :param lines:
+        lines that each contain a GeoJSON feature
+    :param text_property:
+        the property of each feature that contains the label text
+    :return:
+        the label text and line coordinates of each feature, or ``None`` for
+        features without a line geometry or label text, and for lines that
+        cannot be parsed
+    """
+    for line in lines:
+        if line.strip() == '':
+            continue
+        try:
+            feature = json.loads(line)
+            text = (feature.get('properties') or {}).get(text_property)
+            geometry = feature.get('geometry')
+            if not text or geometry is None:
+                yield None
+                continue
+            coords = _get_line_coords(shape(geometry))
+        except _FEATURE_ERRORS:
+            yield None
+            continue
+        yield None if coords is None else (str(text), coords)
+
+
+def read_wkt_features(
+        lines: Iterator[str]
+) -> Iterator[Optional[Tuple[str, Coordinates]]]:
+    """
+    :param lines:
+        lines that each contain a WKT geometry, a tab and the label text
+    :return:
+        the label text and line coordinates of each line, or ``None`` for
+        lines without a line geometry or label text, and for lines that
+        cannot be parsed
+    """
+    for line in lines:
+        if line.strip() == '':
+            continue
+        geometry_text, _, text = line.rstrip('\r\n').partition('\t')
+        if text == '':
+            yield None
+            continue
+        try:
+            coords = _get_line_coords(wkt.loads(geometry_text))
+        except _FEATURE_ERRORS:
+            yield None
+            continue
+        yield None if coords is None else (text, coords)
+
+
+def _expand_extent(extent: Extent, margin: float) -> Extent:
+    return Extent(
+        extent.x - margin,
+        extent.y - margin,
+        extent.width + margin * 2,
+        extent.height + margin * 2
+    )
+
+
+def place_without_collisions(
+        placement: TextPathPlacement,
+        collision_index: CollisionIndex,
+        margin: float = 0
+) -> bool:
+    """
+    Adds the extents of the clusters of a placement to the collision index,
+    unless any of them collides with an extent already in the index.
+
+    :param placement:
+        the placement of a label
+    :param collision_index:
+        the extents that are already occupied
+    :param margin:
+        the minimum distance between the clusters of different labels
+    :return:
+        ``True`` if the placement did not collide and was added to the index
+    """
+    extents = [
+        _expand_extent(extent, margin / 2)
+        for extent in placement.compute_cluster_extents()
+    ]
+    if any(collision_index.intersects(extent) for extent in extents):
+        return False
+    for extent in extents:
+        collision_index.insert(extent)
+    return True
+
+
+def _create_surface(
+        output: str,
+        output_format: str,
+        width: int,
+        height: int
+) -> Surface:
+    if output_format == 'svg':
+        return SVGSurface(output, width, height)
+    if output_format == 'pdf':
+        return PDFSurface(output, width, height)
+    return ImageSurface(FORMAT_ARGB32, width, height)
+
+
+class _Progress:
+
+    def __init__(self, stream: TextIO, interval: float = 1):
+        self.stream = stream
+        self.interval = interval
+        self.features = 0
+        self.placed = 0
+        self.rejected = 0
+        self.skipped = 0
+        self._start = time.perf_counter()
+        self._last_report = self._start
+
+    def report(self, final: bool = False):
+        now = time.perf_counter()
+        if not final and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        duration = now - self._start
+        rate = self.features / duration if duration > 0 else 0
+        self.stream.write(
+            '%d features, %d placed, %d rejected, %d skipped, '
+            '%.0f features/s%s' % (
+                self.features,
+                self.placed,
+                self.rejected,
+                self.skipped,
+                rate,
+                '\n' if final else '\r'
+            )
+        )
+        self.stream.flush()
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='pangocairohelpers-labels',
+        description='Places labels along line features, and renders them.'
+    )
+    parser.add_argument(
+        'input',
+        help='the newline-delimited file of features, or - for stdin'
+    )
+    parser.add_argument(
+        'output',
+        help='the SVG, PDF or PNG file to render the labels to'
+    )
+    parser.add_argument('--width', type=int, required=True)
+    parser.add_argument('--height', type=int, required=True)
+    parser.add_argument(
+        '--format',
+        choices=['geojson', 'wkt'],
+        help='the format of the input. Defaults to wkt for files ending in '
+             '.wkt or .tsv, and geojson otherwise.'
+    )
+    parser.add_argument(
+        '--text-property',
+        default='name',
+        help='the GeoJSON property with the label text'
+    )
+    parser.add_argument('--font', default='Sans 10')
+    parser.add_argument(
+        '--alignment',
+        choices=sorted(_alignments.keys()),
+        default='center'
+    )
+    parser.add_argument('--vertical-offset', type=float, default=0)
+    parser.add_argument(
+        '--margin',
+        type=float,
+        default=2,
+        help='the minimum distance between labels'
+    )
+    parser.add_argument(
+        '--placements',
+        help='a file to write the placement of each label to, as '
+             'newline-delimited JSON'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='do not report progress'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    input_format = args.format
+    if input_format is None:
+        is_wkt = args.input.endswith('.wkt') or args.input.endswith('.tsv')
+        input_format = 'wkt' if is_wkt else 'geojson'
+
+    output_format = args.output.rsplit('.', 1)[-1].lower()
+    if output_format not in ['svg', 'pdf', 'png']:
+        parser.error('the output must end in .svg, .pdf or .png')
+
+    input_file = sys.stdin if args.input == '-' else \
+        open(args.input, encoding='utf-8')
+    placements_file = None
+    if args.placements is not None:
+        placements_file = open(args.placements, 'w', encoding='utf-8')
+
+    # SVG and PDF surfaces hold the drawn labels until ``finish()``.
+    surface = _create_surface(
+        args.output,
+        output_format,
+        args.width,
+        args.height
+    )
+    context = Context(surface)
+    context.set_source_rgb(0, 0, 0)
+    font_cache = {}
+    collision_index = CollisionIndex()
+    progress = _Progress(sys.stderr)
+
+    if input_format == 'wkt':
+        features = read_wkt_features(input_file)
+    else:
+        features = read_geojson_features(input_file, args.text_property)
+
+    try:
+        for feature_index, feature in enumerate(features):
+            progress.features += 1
+            placement = None
+            if feature is not None:
+                text, coords = feature
+                try:
+                    placement = compute_placement(LabelSpec(
+                        text,
+                        args.font,
+                        coords,
+                        alignment=_alignments[args.alignment],
+                        vertical_offset=args.vertical_offset
+                    ))
+                except ValueError:
+                    # For example, text that spans several lines
+                    placement = None
+
+            if placement is None:
+                progress.skipped += 1
+            elif not place_without_collisions(
+                    placement,
+                    collision_index,
+                    args.margin
+            ):
+                progress.rejected += 1
+            else:
+                progress.placed += 1
+                placement.draw(context, font_cache=font_cache)
+                if placements_file is not None:
+                    data = placement.to_dict()
+                    data['feature_index'] = feature_index
+                    placements_file.write(json.dumps(data) + '\n')
+
+            if not args.quiet:
+                progress.report()
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if placements_file is not None:
+            placements_file.close()
+        if output_format == 'png':
+            surface.write_to_png(args.output)
+        surface.finish()
+
+    if not args.quiet:
+        progress.report(final=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
+import numpy as np
 from pangocffi import Layout, GlyphItem, units_to_double
 from typing import List, Optional
 
-from pangocairohelpers import GlyphExtent, Extent
+from pangocairohelpers import GlyphExtent, Extent, instrumentation
 
 
 class LayoutClusters:
@@ -26,8 +27,11 @@ class LayoutClusters:
         self.clusters = []
         self.logical_extents = []
         self.max_logical_extent = None
-        self._extract_logical_extents_from_layout()
-        self._extract_max_logical_extent()
+        self._logical_extents_array = None
+        self._cluster_texts = None
+        with instrumentation.stage(instrumentation.SHAPING):
+            self._extract_logical_extents_from_layout()
+            self._extract_max_logical_extent()
 
     def _extract_logical_extents_from_layout(self):
         """
@@ -144,6 +148,22 @@ class LayoutClusters:
         """
         return self.clusters
 
+    def get_cluster_texts(self) -> List[str]:
+        """
+        :return:
+            the text of each cluster in the layout
+        """
+        if self._cluster_texts is None:
+            text_bytes = self.text.encode('utf-8')
+            self._cluster_texts = [
+                text_bytes[
+                    cluster.item.offset:
+                    cluster.item.offset + cluster.item.length
+                ].decode('utf-8')
+                for cluster in self.clusters
+            ]
+        return self._cluster_texts
+
     def get_logical_extents(self) -> List[GlyphExtent]:
         """
         :return:
@@ -151,6 +171,22 @@ class LayoutClusters:
         """
         return self.logical_extents
 
+    def get_logical_extents_array(self) -> np.ndarray:
+        """
+        :return:
+            an ``(N, 5)`` array with the ``x``, ``y``, ``width``, ``height``
+            and ``baseline`` of the ``GlyphExtent`` of each cluster
+        """
+        if self._logical_extents_array is None:
+            self._logical_extents_array = np.array(
+                [
+                    [e.x, e.y, e.width, e.height, e.baseline]
+                    for e in self.logical_extents
+                ],
+                dtype=float
+            ).reshape((-1, 5))
+        return self._logical_extents_array
+
     def get_max_logical_extent(self) -> Optional[Extent]:
         """
         :return:
@@ -7,7 +7,7 @@ from shapely.geometry import LineString, Point, LinearRing, MultiPoint, \
     JOIN_STYLE
 from typing import Dict, Optional, List, Tuple
 
-from pangocairohelpers import Side
+from pangocairohelpers import Side, instrumentation
 from pangocairohelpers.line_helper import coords_are_left_to_right
 from pangocairohelpers.line_helper import coords_length
 
@@ -92,6 +92,7 @@ def interpolated_distance_of_point(
         the interpolation distance to calculate the position of the point on
         the line string
     """
+    instrumentation.count(instrumentation.SHAPELY_PROJECT)
     return line_string.project(point)
 
 
@@ -112,6 +113,7 @@ def points_at_distance_from_point_on_line_string(
         circle at ``point`` with the radius ``distance``
     """
     circle = LinearRing(point.buffer(distance).exterior.coords)
+    instrumentation.count(instrumentation.SHAPELY_INTERSECTION)
     intersections = line_string.intersection(circle)
 
     if isinstance(intersections, Point):
@@ -143,6 +145,7 @@ def next_offset_from_offset_in_line_string(
         the next offset that is ``distance`` units away from the current
         offset on the ``line_string``
     """
+    instrumentation.count(instrumentation.SHAPELY_INTERPOLATE)
     current_offset_point = line_string.interpolate(current_offset)
     points_at_distance = points_at_distance_from_point_on_line_string(
         line_string,
@@ -233,8 +236,6 @@ def substring(
     :param end:
     :return:
     """
-    print(line_string, start, end)
-
     total_length = line_string.length
     if start >= total_length:
         return None
@@ -251,12 +252,14 @@ def substring(
             end_index = None
             break
 
+        instrumentation.count(instrumentation.SHAPELY_PROJECT)
         pd = line_string.project(Point(p))
 
         if start_index is None:
             if pd == start:
                 start_index = i
             elif pd > start:
+                instrumentation.count(instrumentation.SHAPELY_INTERPOLATE)
                 start_coord = line_string.interpolate(start)
                 start_index = i
 
@@ -265,23 +268,17 @@ def substring(
                 end_index = i + 1
                 break
             elif pd > end:
+                instrumentation.count(instrumentation.SHAPELY_INTERPOLATE)
                 end_coord = line_string.interpolate(end)
                 end_index = i
                 break
 
-    print(start_index)
-    print(start_coord)
-    print(end_index)
-    print(end_coord)
-
     new_coords = []
     if start_coord is not None:
         new_coords.append([start_coord.x, start_coord.y])
-    print(coords[start_index:end_index])
     new_coords.extend(coords[start_index:end_index])
     if end_coord is not None:
         new_coords.append([end_coord.x, end_coord.y])
-    print(new_coords)
 
     return LineString(new_coords)
 
@@ -297,6 +294,7 @@ def parallel_offset_with_matching_direction(
 ) -> Tuple[Optional[LineString], bool]:
     if is_flipped:
         side = side.flipped
+    instrumentation.count(instrumentation.SHAPELY_PARALLEL_OFFSET)
     result = line_string.parallel_offset(
         distance,
         side=side.value,
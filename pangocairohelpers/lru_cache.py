@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+
+class LruCache:
+    """
+    A thread-safe least-recently-used cache, bounded by the combined size of
+    its values.
+
+    By default every value has a size of ``1``, which bounds the cache by the
+    number of entries. A ``size_function`` can be provided to bound the cache
+    by an approximation of memory instead.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            size_function: Callable[[Any], int] = lambda value: 1
+    ):
+        """
+        :param max_size:
+            the maximum combined size of the values in the cache. Values
+            larger than this are never cached.
+        :param size_function:
+            computes the size of a value
+        """
+        self._max_size = max_size
+        self._size_function = size_function
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """
+        :return:
+            the combined size of the values in the cache
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        :param key:
+            the key of the value to look up
+        :param default:
+            the value to return if ``key`` is not in the cache
+        :return:
+            the cached value, which is marked as the most recently used
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Stores a value in the cache, evicting the least recently used values
+        until the cache is within its size limit.
+
+        :param key:
+            the key to store the value under
+        :param value:
+            the value to store
+        """
+        size = self._size_function(value)
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            if size > self._max_size:
+                return
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self._max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def get_or_compute(
+            self,
+            key: Hashable,
+            compute: Callable[[], Any]
+    ) -> Any:
+        """
+        :param key:
+            the key of the value to look up
+        :param compute:
+            called to create the value if ``key`` is not in the cache
+        :return:
+            the cached or newly computed value
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """
+        Removes every value from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,106 @@
+import hashlib
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pangocairohelpers import polyline_helper, instrumentation
+from pangocairohelpers.lru_cache import LruCache
+
+
+def _get_offset_size(offset_coords: Optional[np.ndarray]) -> int:
+    return 1 if offset_coords is None else len(offset_coords)
+
+
+def get_fingerprint(coords: np.ndarray) -> Tuple[Tuple[int, ...], bytes]:
+    """
+    :param coords:
+        the ``(N, 2)`` coordinates of a polyline
+    :return:
+        a key that identifies the coordinates, and their order
+    """
+    coords = np.ascontiguousarray(coords, dtype=float)
+    digest = hashlib.blake2b(coords.tobytes(), digest_size=16).digest()
+    return coords.shape, digest
+
+
+class OffsetCache:
+    """
+    A cache of polylines offset by ``polyline_helper.parallel_offset()``,
+    keyed by a fingerprint of the coordinates, the distance, and the join
+    options.
+
+    The fingerprint depends on the order of the coordinates, so the offsets
+    of either side of a path are cached separately.
+
+    The cache is bounded by the number of coordinates it holds, and evicts
+    the least recently used offsets first. Cached coordinates are read-only,
+    as they are shared by every text path that uses them.
+    """
+
+    def __init__(self, max_size: int = 1000000):
+        """
+        :param max_size:
+            the maximum number of coordinates to keep in the cache
+        """
+        self._offsets = LruCache(max_size, _get_offset_size)
+
+    @property
+    def hits(self) -> int:
+        return self._offsets.hits
+
+    @property
+    def misses(self) -> int:
+        return self._offsets.misses
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def get_offset(
+            self,
+            coords: np.ndarray,
+            distance: float,
+            join_style: int = polyline_helper.JOIN_STYLE_ROUND,
+            resolution: int = 16,
+            mitre_limit: float = 5
+    ) -> Optional[np.ndarray]:
+        """
+        See ``polyline_helper.parallel_offset()`` for the parameters.
+
+        :return:
+            the coordinates of the offset polyline, or ``None`` if it could
+            not be offset
+        """
+        key = (
+            get_fingerprint(coords),
+            float(distance),
+            join_style,
+            resolution,
+            float(mitre_limit)
+        )
+        missing = object()
+        offset_coords = self._offsets.get(key, missing)
+        if offset_coords is not missing:
+            instrumentation.count(instrumentation.OFFSET_CACHE_HITS)
+            return offset_coords
+        instrumentation.count(instrumentation.OFFSET_CACHE_MISSES)
+        offset_coords = polyline_helper.parallel_offset(
+            coords,
+            distance,
+            join_style=join_style,
+            resolution=resolution,
+            mitre_limit=mitre_limit
+        )
+        if offset_coords is not None:
+            offset_coords.setflags(write=False)
+        self._offsets.put(key, offset_coords)
+        return offset_coords
+
+    def clear(self):
+        """
+        Removes every offset from the cache.
+        """
+        self._offsets.clear()
+
+
+default_offset_cache = OffsetCache()
+"""The cache used by text paths unless another one is provided."""
@@ -0,0 +1,31 @@
+"""
+    Paths for text to follow.
+
+    The classes exported here are imported on first access. See
+    :mod:`pangocairohelpers`.
+"""
+from typing import TYPE_CHECKING
+
+from pangocairohelpers._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .path_abstract import PathAbstract  # noqa
+    from .polyline_path import PolylinePath, as_path  # noqa
+    from .segment_index import SegmentIndex  # noqa
+    from .bezier_path import BezierPath  # noqa
+    from .arc_path import ArcPath  # noqa
+    from .transformed_path import TransformedPath  # noqa
+
+_lazy_attributes = {
+    'PathAbstract': '.path_abstract',
+    'PolylinePath': '.polyline_path',
+    'as_path': '.polyline_path',
+    'SegmentIndex': '.segment_index',
+    'BezierPath': '.bezier_path',
+    'ArcPath': '.arc_path',
+    'TransformedPath': '.transformed_path',
+}
+
+__all__ = list(_lazy_attributes)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _lazy_attributes)
@@ -0,0 +1,172 @@
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pangocairohelpers.path import PathAbstract
+
+
+class ArcPath(PathAbstract):
+    """
+    A path along an arc of a circle, which is evaluated in closed form.
+
+    Angles are in radians, and increase clockwise when ``y`` points down,
+    like in cairo. The path goes from ``start_angle`` to ``end_angle``, so it
+    goes clockwise when ``end_angle`` is greater than ``start_angle``.
+    """
+
+    def __init__(
+            self,
+            center: Tuple[float, float],
+            radius: float,
+            start_angle: float,
+            end_angle: float,
+            resolution: int = 16
+    ):
+        """
+        :param center:
+            the ``(x, y)`` of the center of the circle
+        :param radius:
+            the radius of the circle
+        :param start_angle:
+            the angle of the start of the path from the center
+        :param end_angle:
+            the angle of the end of the path from the center
+        :param resolution:
+            the number of segments per quarter circle of the polyline returned
+            by :meth:`to_coords`
+        """
+        if radius <= 0:
+            raise ValueError('radius must be greater than 0')
+        self.center = (float(center[0]), float(center[1]))
+        self.radius = float(radius)
+        self.start_angle = float(start_angle)
+        self.end_angle = float(end_angle)
+        self.resolution = resolution
+
+    @classmethod
+    def circle(
+            cls,
+            center: Tuple[float, float],
+            radius: float,
+            start_angle: float = -math.pi / 2,
+            clockwise: bool = True,
+            resolution: int = 16
+    ) -> 'ArcPath':
+        """
+        :param center:
+            the ``(x, y)`` of the center of the circle
+        :param radius:
+            the radius of the circle
+        :param start_angle:
+            the angle where the path starts and ends. Defaults to the top of
+            the circle.
+        :param clockwise:
+            whether the path goes clockwise, with the text on the outside of
+            the circle, or anticlockwise, with the text on the inside
+        :param resolution:
+            see :meth:`__init__`
+        :return:
+            a path around the whole circle
+        """
+        sweep = 2 * math.pi if clockwise else -2 * math.pi
+        return cls(
+            center,
+            radius,
+            start_angle,
+            start_angle + sweep,
+            resolution
+        )
+
+    @property
+    def sweep(self) -> float:
+        """
+        :return:
+            the angle from the start to the end of the path, which is negative
+            for anticlockwise paths
+        """
+        return self.end_angle - self.start_angle
+
+    @property
+    def _direction(self) -> float:
+        return 1.0 if self.sweep >= 0 else -1.0
+
+    def _get_angles(self, offsets: np.ndarray) -> np.ndarray:
+        offsets = np.clip(np.asarray(offsets, dtype=float), 0, self.length)
+        return self.start_angle + self._direction * offsets / self.radius
+
+    @property
+    def length(self) -> float:
+        return abs(self.sweep) * self.radius
+
+    def interpolate(self, offsets: np.ndarray) -> np.ndarray:
+        angles = self._get_angles(offsets)
+        return np.column_stack((
+            self.center[0] + np.cos(angles) * self.radius,
+            self.center[1] + np.sin(angles) * self.radius
+        ))
+
+    def angles_at(self, offsets: np.ndarray) -> np.ndarray:
+        angles = self._get_angles(offsets) + self._direction * math.pi / 2
+        # Normalize the angles to the range of ``arctan2()``, like the
+        # angles of other paths.
+        return np.arctan2(np.sin(angles), np.cos(angles))
+
+    def project(self, coord: np.ndarray) -> float:
+        angle = math.atan2(
+            coord[1] - self.center[1],
+            coord[0] - self.center[0]
+        )
+        # The angle travelled from the start, between 0 and a full turn
+        travelled = ((angle - self.start_angle) * self._direction) % \
+            (2 * math.pi)
+        if travelled <= abs(self.sweep):
+            return travelled * self.radius
+        # Points beyond the end of the arc project onto the nearest end.
+        remaining = 2 * math.pi - travelled
+        if remaining < travelled - abs(self.sweep):
+            return 0.0
+        return self.length
+
+    def reversed(self) -> 'ArcPath':
+        return ArcPath(
+            self.center,
+            self.radius,
+            self.end_angle,
+            self.start_angle,
+            self.resolution
+        )
+
+    def substring(self, start: float, end: float) -> 'ArcPath':
+        start_angle, end_angle = self._get_angles([start, max(start, end)])
+        return ArcPath(
+            self.center,
+            self.radius,
+            start_angle,
+            end_angle,
+            self.resolution
+        )
+
+    def offset(self, distance: float) -> Optional['ArcPath']:
+        """
+        Arcs are offset exactly, by changing their radius.
+        """
+        radius = self.radius + self._direction * distance
+        if radius <= 0:
+            return None
+        return ArcPath(
+            self.center,
+            radius,
+            self.start_angle,
+            self.end_angle,
+            self.resolution
+        )
+
+    def to_coords(self) -> np.ndarray:
+        segment_count = max(
+            1,
+            math.ceil(abs(self.sweep) * 2 * self.resolution / math.pi)
+        )
+        return self.interpolate(
+            np.linspace(0, self.length, segment_count + 1)
+        )
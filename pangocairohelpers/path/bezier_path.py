@@ -0,0 +1,280 @@
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+from pangocairohelpers import polyline_helper
+from pangocairohelpers.path import PathAbstract
+
+# The path operations of cairo's ``copy_path()``
+_PATH_MOVE_TO = 0
+_PATH_LINE_TO = 1
+_PATH_CURVE_TO = 2
+_PATH_CLOSE_PATH = 3
+
+
+def _to_cubic(control_points: Any) -> np.ndarray:
+    """
+    :param control_points:
+        the 2, 3 or 4 control points of a line, a quadratic or a cubic curve
+    :return:
+        the 4 control points of the same curve as a cubic curve
+    """
+    points = np.asarray(control_points, dtype=float)
+    if points.ndim != 2 or points.shape[1] != 2 or \
+            not 2 <= len(points) <= 4:
+        raise ValueError(
+            'each curve must have 2, 3 or 4 control points of (x, y)'
+        )
+    if len(points) == 2:
+        start, end = points
+        return np.array([
+            start,
+            start + (end - start) / 3,
+            start + (end - start) * 2 / 3,
+            end
+        ])
+    if len(points) == 3:
+        start, control, end = points
+        return np.array([
+            start,
+            start + (control - start) * 2 / 3,
+            end + (control - end) * 2 / 3,
+            end
+        ])
+    return points
+
+
+def _evaluate(curves: np.ndarray, ts: np.ndarray) -> np.ndarray:
+    """
+    :param curves:
+        an ``(M, 4, 2)`` array of the control points of a cubic curve for
+        each ``t``
+    :param ts:
+        an array of ``M`` parameters between ``0`` and ``1``
+    :return:
+        an ``(M, 2)`` array of the points of the curves at each ``t``
+    """
+    ts = ts[:, np.newaxis]
+    inverse = 1 - ts
+    return curves[:, 0] * inverse ** 3 + \
+        curves[:, 1] * 3 * inverse ** 2 * ts + \
+        curves[:, 2] * 3 * inverse * ts ** 2 + \
+        curves[:, 3] * ts ** 3
+
+
+def _evaluate_derivative(curves: np.ndarray, ts: np.ndarray) -> np.ndarray:
+    ts = ts[:, np.newaxis]
+    inverse = 1 - ts
+    return (curves[:, 1] - curves[:, 0]) * 3 * inverse ** 2 + \
+        (curves[:, 2] - curves[:, 1]) * 6 * inverse * ts + \
+        (curves[:, 3] - curves[:, 2]) * 3 * ts ** 2
+
+
+def _split(curve: np.ndarray, t: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :return:
+        the control points of the parts of a cubic curve before and after
+        ``t``, using de Casteljau's algorithm
+    """
+    p01 = curve[0] + (curve[1] - curve[0]) * t
+    p12 = curve[1] + (curve[2] - curve[1]) * t
+    p23 = curve[2] + (curve[3] - curve[2]) * t
+    p012 = p01 + (p12 - p01) * t
+    p123 = p12 + (p23 - p12) * t
+    p0123 = p012 + (p123 - p012) * t
+    return (
+        np.array([curve[0], p01, p012, p0123]),
+        np.array([p0123, p123, p23, curve[3]])
+    )
+
+
+class BezierPath(PathAbstract):
+    """
+    A path of connected lines and quadratic or cubic Bézier curves.
+
+    Positions and angles are evaluated on the curves themselves. Only the
+    mapping from a distance along the path to the parameter of a curve is
+    approximated, using a table of the lengths between points sampled at
+    regular parameters of each curve.
+    """
+
+    def __init__(
+            self,
+            curves: Sequence[Any],
+            samples_per_curve: int = 16
+    ):
+        """
+        :param curves:
+            the control points of each curve, where each curve starts at the
+            end of the previous curve. Curves with 2 control points are lines,
+            3 are quadratic curves, and 4 are cubic curves.
+        :param samples_per_curve:
+            the number of parts each curve is divided into to measure its
+            length. More samples make the positions of the text more
+            accurate, but take longer to compute and more memory to store.
+        """
+        if len(curves) == 0:
+            raise ValueError('a path must have at least one curve')
+        self._curves = np.array([_to_cubic(curve) for curve in curves])
+        self.samples_per_curve = samples_per_curve
+
+        curve_count = len(self._curves)
+        # The parameter ``u`` of each sample is the index of the curve plus
+        # the ``t`` of the sample on that curve.
+        self._sample_us = np.arange(curve_count * samples_per_curve + 1) / \
+            samples_per_curve
+        self._sample_coords = self._evaluate_us(self._sample_us)
+        self._sample_lengths = polyline_helper.cumulative_lengths(
+            self._sample_coords
+        )
+
+    @classmethod
+    def from_cairo_path(
+            cls,
+            path: List[Tuple[int, Tuple[float, ...]]],
+            samples_per_curve: int = 16
+    ) -> 'BezierPath':
+        """
+        :param path:
+            a path in the format of cairo's ``copy_path()``, with a single
+            sub-path. The move to that cairo adds after closing a path, and
+            a move to at the end of the path, are ignored.
+        :param samples_per_curve:
+            see :meth:`__init__`
+        :return:
+            the path of the lines and curves of ``path``
+        """
+        curves = []
+        current_point = None
+        start_point = None
+        previous_operation = None
+        starts_sub_path = False
+        for operation, points in path:
+            if operation == _PATH_MOVE_TO:
+                point = tuple(points[:2])
+                # Cairo moves back to the start of a sub-path after closing
+                # it, which does not start a new sub-path unless it is
+                # followed by a different move to.
+                if len(curves) > 0 and not (
+                        previous_operation == _PATH_CLOSE_PATH and
+                        point == start_point
+                ):
+                    starts_sub_path = True
+                if len(curves) == 0:
+                    start_point = point
+                current_point = point
+                previous_operation = operation
+                continue
+            if current_point is None:
+                raise ValueError('the path must start with a move to')
+            if starts_sub_path:
+                raise ValueError(
+                    'paths with more than one sub-path are not supported'
+                )
+            if operation == _PATH_LINE_TO:
+                end_point = tuple(points[:2])
+                curves.append([current_point, end_point])
+            elif operation == _PATH_CURVE_TO:
+                end_point = tuple(points[4:6])
+                curves.append([
+                    current_point,
+                    points[0:2],
+                    points[2:4],
+                    end_point
+                ])
+            elif operation == _PATH_CLOSE_PATH:
+                end_point = start_point
+                if end_point != current_point:
+                    curves.append([current_point, end_point])
+            else:
+                raise ValueError('unknown path operation %r' % operation)
+            current_point = end_point
+            previous_operation = operation
+        return cls(curves, samples_per_curve)
+
+    @property
+    def curves(self) -> np.ndarray:
+        """
+        :return:
+            an ``(N, 4, 2)`` array of the control points of each curve, as a
+            cubic curve
+        """
+        return self._curves
+
+    def _get_curve_indexes_and_ts(
+            self,
+            us: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        indexes = np.clip(np.floor(us).astype(int), 0, len(self._curves) - 1)
+        return indexes, us - indexes
+
+    def _evaluate_us(self, us: np.ndarray) -> np.ndarray:
+        indexes, ts = self._get_curve_indexes_and_ts(us)
+        return _evaluate(self._curves[indexes], ts)
+
+    def _get_us(self, offsets: np.ndarray) -> np.ndarray:
+        offsets = np.asarray(offsets, dtype=float)
+        return np.interp(offsets, self._sample_lengths, self._sample_us)
+
+    @property
+    def length(self) -> float:
+        return float(self._sample_lengths[-1])
+
+    def interpolate(self, offsets: np.ndarray) -> np.ndarray:
+        return self._evaluate_us(self._get_us(offsets))
+
+    def angles_at(self, offsets: np.ndarray) -> np.ndarray:
+        us = self._get_us(offsets)
+        indexes, ts = self._get_curve_indexes_and_ts(us)
+        derivatives = _evaluate_derivative(self._curves[indexes], ts)
+        # Where a control point is on the end of a curve, its derivative at
+        # that end is zero, so the direction between the samples is used.
+        stationary = np.all(np.abs(derivatives) < 1e-12, axis=1)
+        if np.any(stationary):
+            sample_indexes = np.clip(
+                np.floor(us[stationary] * self.samples_per_curve).astype(int),
+                0,
+                len(self._sample_coords) - 2
+            )
+            derivatives[stationary] = \
+                self._sample_coords[sample_indexes + 1] - \
+                self._sample_coords[sample_indexes]
+        return np.arctan2(derivatives[:, 1], derivatives[:, 0])
+
+    def project(self, coord: np.ndarray) -> float:
+        return polyline_helper.project(
+            self._sample_coords,
+            self._sample_lengths,
+            coord
+        )
+
+    def reversed(self) -> 'BezierPath':
+        return BezierPath(self._curves[::-1, ::-1], self.samples_per_curve)
+
+    def substring(self, start: float, end: float) -> 'BezierPath':
+        start = min(max(start, 0.0), self.length)
+        end = min(max(end, start), self.length)
+        (start_index, end_index), (start_t, end_t) = \
+            self._get_curve_indexes_and_ts(self._get_us([start, end]))
+        if end_index > start_index and end_t == 0:
+            # An end on the boundary between two curves is the end of the
+            # first, rather than a curve of no length at the start of the
+            # second.
+            end_index -= 1
+            end_t = 1
+        if start_index == end_index:
+            _, curve = _split(self._curves[start_index], start_t)
+            if start_t < 1:
+                curve, _ = _split(curve, (end_t - start_t) / (1 - start_t))
+            return BezierPath([curve], self.samples_per_curve)
+        _, first_curve = _split(self._curves[start_index], start_t)
+        last_curve, _ = _split(self._curves[end_index], end_t)
+        return BezierPath(
+            [first_curve] +
+            list(self._curves[start_index + 1:end_index]) +
+            [last_curve],
+            self.samples_per_curve
+        )
+
+    def to_coords(self) -> np.ndarray:
+        return self._sample_coords
@@ -0,0 +1,113 @@
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+import numpy as np
+from shapely.geometry import LineString
+
+
+class PathAbstract(object, metaclass=ABCMeta):
+    """
+    A path for text to follow, parameterized by the distance along it.
+
+    Paths are immutable. Methods that modify the path return a new path.
+    """
+
+    @property
+    @abstractmethod
+    def length(self) -> float:
+        """
+        :return:
+            the length of the path
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def interpolate(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        :param offsets:
+            the distances along the path to find positions for. Offsets
+            outside the path are clamped to its ends.
+        :return:
+            an ``(M, 2)`` array of positions for each offset
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def angles_at(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        :param offsets:
+            the distances along the path to find angles for
+        :return:
+            an array containing the angle of the direction of the path at each
+            offset
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def project(self, coord: np.ndarray) -> float:
+        """
+        :param coord:
+            the ``(x, y)`` coordinate to project onto the path
+        :return:
+            the distance along the path to the point on the path that is
+            nearest to ``coord``
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def reversed(self) -> 'PathAbstract':
+        """
+        :return:
+            the same path, going in the opposite direction
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def substring(self, start: float, end: float) -> 'PathAbstract':
+        """
+        :param start:
+            the distance along the path where the substring starts
+        :param end:
+            the distance along the path where the substring ends
+        :return:
+            the part of the path between ``start`` and ``end``
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def to_coords(self) -> np.ndarray:
+        """
+        :return:
+            the ``(N, 2)`` coordinates of a polyline that follows the path
+        """
+        pass  # pragma: no cover
+
+    def offset(self, distance: float) -> Optional['PathAbstract']:
+        """
+        :param distance:
+            the distance to offset the path by. Positive distances offset the
+            path to its left, when ``y`` points down, like in cairo.
+        :return:
+            the exact offset of the path, or ``None`` if the path cannot be
+            offset exactly, in which case the coordinates returned by
+            :meth:`to_coords` are offset instead
+        """
+        return None
+
+    def simplified(self, tolerance: float) -> 'PathAbstract':
+        """
+        :param tolerance:
+            the maximum distance between the path and the simplified path
+        :return:
+            a path with fewer vertices that follows this path within
+            ``tolerance``. Paths without vertices return themselves.
+        """
+        return self
+
+    def to_line_string(self) -> LineString:
+        """
+        :return:
+            a ``LineString`` that follows the path, for operations that need
+            Shapely, like offsetting the path
+        """
+        return LineString(self.to_coords())
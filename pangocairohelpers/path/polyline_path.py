@@ -0,0 +1,172 @@
+from typing import Any, Tuple
+
+import numpy as np
+from shapely.geometry import LineString
+
+from pangocairohelpers import polyline_helper
+from pangocairohelpers.lru_cache import LruCache
+from pangocairohelpers.path import PathAbstract
+from pangocairohelpers.path.segment_index import SegmentIndex
+
+SEGMENT_INDEX_THRESHOLD = 1000
+"""
+The number of segments above which paths are projected onto with a
+``SegmentIndex``, instead of comparing every segment.
+"""
+
+SIMPLIFIED_CACHE_SIZE = 8
+"""The number of simplified paths that each path keeps."""
+
+
+class PolylinePath(PathAbstract):
+    """
+    A path of straight segments between coordinates.
+
+    The coordinates are used without copying them when they are already an
+    array of floats, so paths can be created from NumPy arrays, or any object
+    supporting the buffer protocol, without building a Shapely geometry.
+    """
+
+    def __init__(self, coords: Any):
+        """
+        :param coords:
+            an ``(N, 2)`` array-like of at least two coordinates. Any further
+            columns, like ``z`` values, are ignored.
+        """
+        coords = np.asarray(coords, dtype=float)
+        if coords.ndim != 2 or coords.shape[0] < 2 or coords.shape[1] < 2:
+            raise ValueError(
+                'coords must be an (N, 2) array of at least two coordinates'
+            )
+        self._coords = coords[:, :2]
+        self._lengths = None
+        self._angles = None
+        self._segment_index = None
+        # The path that this path is the reverse of, if it was created by
+        # ``reversed()``
+        self._reversed_path = None
+        # The simplified paths, which are created the first time a path is
+        # simplified
+        self._simplified = None
+
+    @property
+    def coords(self) -> np.ndarray:
+        return self._coords
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        :return:
+            the distance along the path to each coordinate
+        """
+        if self._lengths is None:
+            self._lengths = polyline_helper.cumulative_lengths(self._coords)
+        return self._lengths
+
+    @property
+    def angles(self) -> np.ndarray:
+        """
+        :return:
+            the angle of each segment
+        """
+        if self._angles is None:
+            self._angles = polyline_helper.segment_angles(self._coords)
+        return self._angles
+
+    @property
+    def segment_index(self) -> SegmentIndex:
+        """
+        :return:
+            a spatial index of the segments of the path, which is created
+            the first time it is used
+        """
+        if self._segment_index is None:
+            self._segment_index = SegmentIndex(self._coords)
+        return self._segment_index
+
+    @property
+    def length(self) -> float:
+        return float(self.lengths[-1])
+
+    def interpolate(self, offsets: np.ndarray) -> np.ndarray:
+        return polyline_helper.interpolate(self._coords, self.lengths, offsets)
+
+    def angles_at(self, offsets: np.ndarray) -> np.ndarray:
+        return polyline_helper.angles_at(self.angles, self.lengths, offsets)
+
+    def _nearest(self, coord: np.ndarray) -> Tuple[int, float]:
+        """
+        :return:
+            the index of the nearest segment to ``coord``, and the ratio
+            along the segment of the nearest point on it
+        """
+        if self._segment_index is None and self._reversed_path is not None:
+            # A reversed path has the same segments in the opposite order, so
+            # the index of the path it was reversed from is shared by both.
+            segment, ratio, _ = self._reversed_path.segment_index.nearest(
+                coord
+            )
+            return len(self._coords) - 2 - segment, 1 - ratio
+        segment, ratio, _ = self.segment_index.nearest(coord)
+        return segment, ratio
+
+    def project(self, coord: np.ndarray) -> float:
+        if len(self._coords) - 1 <= SEGMENT_INDEX_THRESHOLD:
+            return polyline_helper.project(self._coords, self.lengths, coord)
+        segment, ratio = self._nearest(coord)
+        lengths = self.lengths
+        return float(
+            lengths[segment] +
+            (lengths[segment + 1] - lengths[segment]) * ratio
+        )
+
+    def reversed(self) -> 'PolylinePath':
+        if self._reversed_path is not None:
+            return self._reversed_path
+        path = PolylinePath(self._coords[::-1])
+        path._reversed_path = self
+        return path
+
+    def substring(self, start: float, end: float) -> 'PolylinePath':
+        return PolylinePath(polyline_helper.substring(
+            self._coords,
+            self.lengths,
+            start,
+            end
+        ))
+
+    def simplified(self, tolerance: float) -> 'PolylinePath':
+        """
+        The most recently used simplified paths are cached, so text paths
+        that share a path only simplify it once.
+        """
+        if self._simplified is None:
+            self._simplified = LruCache(SIMPLIFIED_CACHE_SIZE)
+        return self._simplified.get_or_compute(
+            float(tolerance),
+            lambda: self._simplify(tolerance)
+        )
+
+    def _simplify(self, tolerance: float) -> 'PolylinePath':
+        coords = polyline_helper.simplify(self._coords, tolerance)
+        if len(coords) == len(self._coords):
+            return self
+        return PolylinePath(coords)
+
+    def to_coords(self) -> np.ndarray:
+        return self._coords
+
+
+def as_path(value: Any) -> PathAbstract:
+    """
+    :param value:
+        a path, a Shapely ``LineString``, or an ``(N, 2)`` array-like of
+        coordinates
+    :return:
+        the value as a path
+    """
+    if isinstance(value, PathAbstract):
+        return value
+    if isinstance(value, LineString):
+        return PolylinePath(np.asarray(value.coords))
+    return PolylinePath(value)
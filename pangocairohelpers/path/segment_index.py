@@ -0,0 +1,330 @@
+from typing import Tuple
+
+import numpy as np
+
+from pangocairohelpers import Extent
+
+
+class SegmentIndex:
+    """
+    A static hierarchy of bounding boxes over the segments of a polyline,
+    for finding the segments near a point or inside an extent without
+    comparing every segment.
+
+    The segments of a polyline are usually next to the segments that follow
+    them, so the leaves of the hierarchy group consecutive segments, and each
+    level above groups consecutive boxes of the level below. Queries descend
+    the levels with NumPy, discarding the boxes that cannot contain a result.
+    """
+
+    def __init__(
+            self,
+            coords: np.ndarray,
+            leaf_size: int = 16,
+            branching: int = 16
+    ):
+        """
+        :param coords:
+            the ``(N, 2)`` coordinates of the polyline, with at least two
+            coordinates
+        :param leaf_size:
+            the number of consecutive segments in each leaf box
+        :param branching:
+            the number of boxes of the level below in each box
+        """
+        self._coords = coords
+        self._starts = coords[:-1]
+        self._vectors = coords[1:] - coords[:-1]
+        self._squared_lengths = np.einsum(
+            'ij,ij->i',
+            self._vectors,
+            self._vectors
+        )
+        self.leaf_size = leaf_size
+        self.branching = branching
+
+        segment_mins = np.minimum(coords[:-1], coords[1:])
+        segment_maxs = np.maximum(coords[:-1], coords[1:])
+        group_starts = np.arange(0, len(segment_mins), leaf_size)
+        mins = np.minimum.reduceat(segment_mins, group_starts)
+        maxs = np.maximum.reduceat(segment_maxs, group_starts)
+        # The levels of boxes, from the leaves up to a single root
+        self._levels = [(mins, maxs)]
+        while len(mins) > 1:
+            group_starts = np.arange(0, len(mins), branching)
+            mins = np.minimum.reduceat(mins, group_starts)
+            maxs = np.maximum.reduceat(maxs, group_starts)
+            self._levels.append((mins, maxs))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _get_children(
+            self,
+            nodes: np.ndarray,
+            group_size: int,
+            count: int
+    ) -> np.ndarray:
+        children = (
+            nodes[:, np.newaxis] * group_size + np.arange(group_size)
+        ).ravel()
+        return children[children < count]
+
+    def nearest(self, coord: np.ndarray) -> Tuple[int, float, float]:
+        """
+        :param coord:
+            the ``(x, y)`` coordinate to find the nearest segment to
+        :return:
+            the index of the nearest segment, the ratio along the segment of
+            the nearest point on it, and the distance to that point. If
+            several segments are equally near, the first is returned.
+        """
+        coord = np.asarray(coord, dtype=float)
+        nodes = np.zeros(1, dtype=int)
+        for level in range(len(self._levels) - 1, -1, -1):
+            mins, maxs = self._levels[level]
+            nearest_differences = np.maximum(
+                mins[nodes] - coord,
+                coord - maxs[nodes]
+            ).clip(0)
+            farthest_differences = np.maximum(
+                coord - mins[nodes],
+                maxs[nodes] - coord
+            )
+            nearest_distances = np.einsum(
+                'ij,ij->i',
+                nearest_differences,
+                nearest_differences
+            )
+            # Every segment in a box is at most as far as its farthest
+            # corner, so boxes nearer than the nearest farthest corner may
+            # contain the nearest segment.
+            bound = np.einsum(
+                'ij,ij->i',
+                farthest_differences,
+                farthest_differences
+            ).min()
+            nodes = nodes[nearest_distances <= bound]
+            if level > 0:
+                nodes = self._get_children(
+                    nodes,
+                    self.branching,
+                    len(self._levels[level - 1][0])
+                )
+
+        segments = self._get_children(nodes, self.leaf_size, len(self))
+        starts = self._starts[segments]
+        vectors = self._vectors[segments]
+        squared_lengths = self._squared_lengths[segments]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(
+                squared_lengths > 0,
+                np.einsum('ij,ij->i', coord - starts, vectors) /
+                squared_lengths,
+                0
+            )
+        ratios = np.clip(ratios, 0, 1)
+        differences = starts + vectors * ratios[:, np.newaxis] - coord
+        distances = np.einsum('ij,ij->i', differences, differences)
+        index = int(np.argmin(distances))
+        return (
+            int(segments[index]),
+            float(ratios[index]),
+            float(np.sqrt(distances[index]))
+        )
+
+    def query(self, extent: Extent) -> np.ndarray:
+        """
+        :param extent:
+            the extent to find segments in
+        :return:
+            the sorted indexes of the segments whose bounding boxes intersect
+            ``extent``
+        """
+        min_coord = np.array([extent.x, extent.y])
+        max_coord = min_coord + [extent.width, extent.height]
+        nodes = np.zeros(1, dtype=int)
+        for level in range(len(self._levels) - 1, -1, -1):
+            mins, maxs = self._levels[level]
+            intersecting = np.all(
+                (mins[nodes] <= max_coord) & (maxs[nodes] >= min_coord),
+                axis=1
+            )
+            nodes = nodes[intersecting]
+            if level > 0:
+                nodes = self._get_children(
+                    nodes,
+                    self.branching,
+                    len(self._levels[level - 1][0])
+                )
+
+        segments = self._get_children(nodes, self.leaf_size, len(self))
+        segment_mins = np.minimum(
+            self._coords[segments],
+            self._coords[segments + 1]
+        )
+        segment_maxs = np.maximum(
+            self._coords[segments],
+            self._coords[segments + 1]
+        )
+        intersecting = np.all(
+            (segment_mins <= max_coord) & (segment_maxs >= min_coord),
+            axis=1
+        )
+        return segments[intersecting]
+
+    @staticmethod
+    def _get_child_pairs(
+            pairs: np.ndarray,
+            group_size: int,
+            count: int
+    ) -> np.ndarray:
+        """
+        :return:
+            the pairs of children of each pair of boxes, with the first child
+            never after the second
+        """
+        children = np.arange(group_size)
+        firsts = (
+            pairs[:, 0, np.newaxis, np.newaxis] * group_size +
+            children[np.newaxis, :, np.newaxis]
+        )
+        seconds = (
+            pairs[:, 1, np.newaxis, np.newaxis] * group_size +
+            children[np.newaxis, np.newaxis, :]
+        )
+        firsts, seconds = np.broadcast_arrays(firsts, seconds)
+        child_pairs = np.column_stack((firsts.ravel(), seconds.ravel()))
+        return child_pairs[
+            (child_pairs[:, 0] <= child_pairs[:, 1]) &
+            (child_pairs[:, 1] < count)
+        ]
+
+    @staticmethod
+    def _get_orientations(
+            starts: np.ndarray,
+            ends: np.ndarray,
+            coords: np.ndarray
+    ) -> np.ndarray:
+        """
+        :return:
+            which side of each segment each coordinate is on, as ``1``,
+            ``-1``, or ``0`` if it is on the line through the segment
+        """
+        vectors = ends - starts
+        differences = coords - starts
+        return np.sign(
+            vectors[:, 0] * differences[:, 1] -
+            vectors[:, 1] * differences[:, 0]
+        )
+
+    def find_crossings(self) -> np.ndarray:
+        """
+        :return:
+            the ``(M, 2)`` array of the pairs of indexes of segments that
+            intersect or touch, but are not next to each other in the
+            polyline. The polyline is simple if there are none.
+        """
+        # Pairs of boxes are descended together, keeping only the pairs that
+        # overlap, starting from the root paired with itself.
+        pairs = np.zeros((1, 2), dtype=int)
+        for level in range(len(self._levels) - 1, -1, -1):
+            mins, maxs = self._levels[level]
+            overlapping = np.all(
+                (mins[pairs[:, 0]] <= maxs[pairs[:, 1]]) &
+                (maxs[pairs[:, 0]] >= mins[pairs[:, 1]]),
+                axis=1
+            )
+            pairs = pairs[overlapping]
+            if level > 0:
+                pairs = self._get_child_pairs(
+                    pairs,
+                    self.branching,
+                    len(self._levels[level - 1][0])
+                )
+            else:
+                pairs = self._get_child_pairs(pairs, self.leaf_size, len(self))
+
+        pairs = pairs[pairs[:, 1] > pairs[:, 0] + 1]
+        starts_a = self._starts[pairs[:, 0]]
+        ends_a = self._coords[pairs[:, 0] + 1]
+        starts_b = self._starts[pairs[:, 1]]
+        ends_b = self._coords[pairs[:, 1] + 1]
+        overlapping = np.all(
+            (np.minimum(starts_a, ends_a) <= np.maximum(starts_b, ends_b)) &
+            (np.maximum(starts_a, ends_a) >= np.minimum(starts_b, ends_b)),
+            axis=1
+        )
+        pairs = pairs[overlapping]
+        starts_a = starts_a[overlapping]
+        ends_a = ends_a[overlapping]
+        starts_b = starts_b[overlapping]
+        ends_b = ends_b[overlapping]
+
+        # Segments with overlapping boxes intersect if the ends of each are
+        # not both on the same side of the other. Collinear segments with
+        # overlapping boxes overlap.
+        crossing = (
+            self._get_orientations(starts_a, ends_a, starts_b) *
+            self._get_orientations(starts_a, ends_a, ends_b) <= 0
+        ) & (
+            self._get_orientations(starts_b, ends_b, starts_a) *
+            self._get_orientations(starts_b, ends_b, ends_a) <= 0
+        )
+        return pairs[crossing]
+
+    def query_extents(self, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """
+        :param mins:
+            the ``(M, 2)`` minimum coordinates of the extents to find
+            segments in
+        :param maxs:
+            the ``(M, 2)`` maximum coordinates of the extents, which can be
+            infinite
+        :return:
+            the ``(K, 2)`` array of the pairs of indexes of an extent and a
+            segment whose bounding box intersects it
+        """
+        # Each extent is paired with the root, and the pairs are descended
+        # together, like in :meth:`query`.
+        pairs = np.column_stack((
+            np.arange(len(mins)),
+            np.zeros(len(mins), dtype=int)
+        ))
+        for level in range(len(self._levels) - 1, -1, -1):
+            level_mins, level_maxs = self._levels[level]
+            intersecting = np.all(
+                (level_mins[pairs[:, 1]] <= maxs[pairs[:, 0]]) &
+                (level_maxs[pairs[:, 1]] >= mins[pairs[:, 0]]),
+                axis=1
+            )
+            pairs = pairs[intersecting]
+            if level > 0:
+                group_size = self.branching
+                count = len(self._levels[level - 1][0])
+            else:
+                group_size = self.leaf_size
+                count = len(self)
+            pairs = np.column_stack((
+                np.repeat(pairs[:, 0], group_size),
+                (
+                    pairs[:, 1, np.newaxis] * group_size +
+                    np.arange(group_size)
+                ).ravel()
+            ))
+            pairs = pairs[pairs[:, 1] < count]
+
+        segment_mins = np.minimum(
+            self._coords[pairs[:, 1]],
+            self._coords[pairs[:, 1] + 1]
+        )
+        segment_maxs = np.maximum(
+            self._coords[pairs[:, 1]],
+            self._coords[pairs[:, 1] + 1]
+        )
+        intersecting = np.all(
+            (segment_mins <= maxs[pairs[:, 0]]) &
+            (segment_maxs >= mins[pairs[:, 0]]),
+            axis=1
+        )
+        return pairs[intersecting]
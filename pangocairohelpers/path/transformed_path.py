@@ -0,0 +1,207 @@
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from pangocairohelpers.path import PathAbstract, PolylinePath
+
+Transform = Tuple[float, float, float, float, float, float]
+"""
+An affine transform ``(a, b, d, e, xoff, yoff)``, in the same order as
+``shapely.affinity.affine_transform()``, which maps ``(x, y)`` to
+``(a * x + b * y + xoff, d * x + e * y + yoff)``
+"""
+
+
+def get_similarity(
+        transform: Sequence[float]
+) -> Optional[Tuple[float, float, bool]]:
+    """
+    :param transform:
+        an affine transform
+    :return:
+        the scale and rotation of the transform, and whether it reflects
+        coordinates, if the transform is a similarity, which only moves,
+        rotates, reflects and uniformly scales coordinates. Otherwise
+        ``None``.
+    """
+    a, b, d, e = (float(value) for value in transform[:4])
+    scale = math.hypot(a, d)
+    if scale == 0 or \
+            not math.isclose(math.hypot(b, e), scale, rel_tol=1e-9) or \
+            not math.isclose(a * b + d * e, 0, abs_tol=1e-9 * scale ** 2):
+        return None
+    return scale, math.atan2(d, a), a * e - b * d < 0
+
+
+def apply_transform(
+        transform: Sequence[float],
+        coords: np.ndarray
+) -> np.ndarray:
+    """
+    :param transform:
+        an affine transform
+    :param coords:
+        an ``(N, 2)`` array of coordinates
+    :return:
+        the transformed coordinates, as a new array
+    """
+    a, b, d, e, x_offset, y_offset = transform
+    coords = np.asarray(coords, dtype=float).reshape((-1, 2))
+    return np.column_stack((
+        a * coords[:, 0] + b * coords[:, 1] + x_offset,
+        d * coords[:, 0] + e * coords[:, 1] + y_offset
+    ))
+
+
+class TransformedPath(PathAbstract):
+    """
+    A path with an affine transform applied to it, for example to follow a
+    line in world coordinates on a device.
+
+    The transform is applied lazily. Similarity transforms keep the shape of
+    the path, so distances along the transformed path are converted to
+    distances along the original path, and only the positions that are
+    looked up are transformed. This means the tables of the original path,
+    and its simplified and offset paths, are shared by every similarity
+    transform of it. Other transforms are applied to the coordinates of the
+    whole path at once, the first time the path is used.
+    """
+
+    def __init__(self, path: PathAbstract, transform: Sequence[float]):
+        """
+        :param path:
+            the path to transform
+        :param transform:
+            the affine transform, see :data:`Transform`
+        """
+        self.path = path
+        self.transform = tuple(float(value) for value in transform)
+        self._similarity = get_similarity(self.transform)
+        self._transformed_path = None
+        self._coords = None
+
+    @property
+    def is_similarity(self) -> bool:
+        """
+        :return:
+            whether the transform is a similarity, which keeps the shape of
+            the path
+        """
+        return self._similarity is not None
+
+    def _get_transformed_path(self) -> PathAbstract:
+        if self._transformed_path is None:
+            self._transformed_path = PolylinePath(
+                apply_transform(self.transform, self.path.to_coords())
+            )
+        return self._transformed_path
+
+    def _with_path(self, path: PathAbstract) -> 'TransformedPath':
+        return TransformedPath(path, self.transform)
+
+    def to_original_distance(self, distance: float) -> float:
+        """
+        :param distance:
+            a distance along the transformed path, or an offset from it
+        :return:
+            the same distance along the original path, if the transform is a
+            similarity
+        """
+        return distance / self._similarity[0]
+
+    def to_original_offset(self, distance: float) -> float:
+        """
+        :param distance:
+            an offset from the transformed path, to its left
+        :return:
+            the same offset from the original path, to its left, if the
+            transform is a similarity. Reflections swap the sides of the path.
+        """
+        distance = self.to_original_distance(distance)
+        if self._similarity[2]:
+            return -distance
+        return distance
+
+    @property
+    def length(self) -> float:
+        if self._similarity is None:
+            return self._get_transformed_path().length
+        return self.path.length * self._similarity[0]
+
+    def interpolate(self, offsets: np.ndarray) -> np.ndarray:
+        if self._similarity is None:
+            return self._get_transformed_path().interpolate(offsets)
+        offsets = np.asarray(offsets, dtype=float)
+        return apply_transform(
+            self.transform,
+            self.path.interpolate(offsets / self._similarity[0])
+        )
+
+    def angles_at(self, offsets: np.ndarray) -> np.ndarray:
+        if self._similarity is None:
+            return self._get_transformed_path().angles_at(offsets)
+        offsets = np.asarray(offsets, dtype=float)
+        angles = self.path.angles_at(offsets / self._similarity[0])
+        a, b, d, e = self.transform[:4]
+        cos = np.cos(angles)
+        sin = np.sin(angles)
+        return np.arctan2(d * cos + e * sin, a * cos + b * sin)
+
+    def project(self, coord: np.ndarray) -> float:
+        if self._similarity is None:
+            return self._get_transformed_path().project(coord)
+        # Similarities keep the nearest point, so the point is projected onto
+        # the original path.
+        a, b, d, e, x_offset, y_offset = self.transform
+        x = coord[0] - x_offset
+        y = coord[1] - y_offset
+        determinant = a * e - b * d
+        original_coord = np.array([
+            (e * x - b * y) / determinant,
+            (a * y - d * x) / determinant
+        ])
+        return self.path.project(original_coord) * self._similarity[0]
+
+    def reversed(self) -> PathAbstract:
+        if self._similarity is None:
+            return self._get_transformed_path().reversed()
+        return self._with_path(self.path.reversed())
+
+    def substring(self, start: float, end: float) -> PathAbstract:
+        if self._similarity is None:
+            return self._get_transformed_path().substring(start, end)
+        return self._with_path(self.path.substring(
+            self.to_original_distance(start),
+            self.to_original_distance(end)
+        ))
+
+    def offset(self, distance: float) -> Optional[PathAbstract]:
+        if self._similarity is None:
+            return self._get_transformed_path().offset(distance)
+        offset_path = self.path.offset(
+            self.to_original_offset(distance)
+        )
+        if offset_path is None:
+            return None
+        return self._with_path(offset_path)
+
+    def simplified(self, tolerance: float) -> PathAbstract:
+        if self._similarity is None:
+            return self._get_transformed_path().simplified(tolerance)
+        simplified_path = self.path.simplified(
+            self.to_original_distance(tolerance)
+        )
+        if simplified_path is self.path:
+            return self
+        return self._with_path(simplified_path)
+
+    def to_coords(self) -> np.ndarray:
+        if self._similarity is None:
+            return self._get_transformed_path().to_coords()
+        if self._coords is None:
+            self._coords = apply_transform(
+                self.transform,
+                self.path.to_coords()
+            )
+        return self._coords
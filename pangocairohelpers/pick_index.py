@@ -0,0 +1,271 @@
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from pangocairohelpers import Extent
+from pangocairohelpers.text_path import TextPathPlacement
+
+Pick = Tuple[int, int, int, int]
+"""
+The index of a placement, and the cluster index, start byte index and end
+byte index of a cluster in it
+"""
+
+# Cells are identified by a single integer, so that the cells of a column of
+# the grid are next to each other once sorted.
+_CELL_ROWS = 1 << 32
+
+
+class PickIndex:
+    """
+    A grid over the glyphs of placed labels, for finding the labels and
+    clusters under a point, like a cursor, or inside an extent.
+
+    Each cluster is stored in every cell of the grid that the bounding extent
+    of its rotated logical extent covers. Queries only test the clusters in
+    the cells they cover, against the rotated logical extents themselves.
+    The grid is built once, with NumPy, so placements cannot be added later.
+    """
+
+    def __init__(
+            self,
+            placements: Iterable[Optional[TextPathPlacement]],
+            cell_size: float = 32
+    ):
+        """
+        :param placements:
+            the placements of the labels. ``None`` placements, for labels
+            that could not be placed, are skipped, but still count towards the
+            indexes of the placements.
+        :param cell_size:
+            the width and height of each cell of the grid. Cells that are a
+            few times larger than a typical glyph work best.
+        """
+        self.cell_size = cell_size
+
+        rows = []
+        for placement_index, placement in enumerate(placements):
+            if placement is None:
+                continue
+            for cluster in placement.clusters:
+                extent = cluster.logical_extent
+                top = extent.y - extent.baseline
+                rows.append((
+                    cluster.x,
+                    cluster.y,
+                    cluster.rotation,
+                    extent.width,
+                    top,
+                    top + extent.height,
+                    placement_index,
+                    -1 if cluster.cluster_index is None
+                    else cluster.cluster_index,
+                    cluster.start_index,
+                    cluster.end_index
+                ))
+        values = np.array(rows, dtype=float).reshape((-1, 10))
+
+        self._origins = values[:, 0:2]
+        self._cos = np.cos(values[:, 2])
+        self._sin = np.sin(values[:, 2])
+        self._widths = values[:, 3]
+        self._tops = values[:, 4]
+        self._bottoms = values[:, 5]
+        self._picks = values[:, 6:10].astype(int)
+
+        # The bounding extents of the rotated logical extents
+        corner_xs, corner_ys = self._get_global_coords(
+            np.array([0, 1, 1, 0])[np.newaxis] * self._widths[:, np.newaxis],
+            np.column_stack((
+                self._tops,
+                self._tops,
+                self._bottoms,
+                self._bottoms
+            ))
+        )
+        self._mins = np.column_stack((
+            corner_xs.min(axis=1),
+            corner_ys.min(axis=1)
+        ))
+        self._maxs = np.column_stack((
+            corner_xs.max(axis=1),
+            corner_ys.max(axis=1)
+        ))
+        self._build_cells()
+
+    def __len__(self) -> int:
+        return len(self._picks)
+
+    def _get_global_coords(
+            self,
+            local_xs: np.ndarray,
+            local_ys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return:
+            the coordinates of points given relative to the origin and
+            rotation of each cluster, with a row of points for each cluster
+        """
+        cos = self._cos[:, np.newaxis]
+        sin = self._sin[:, np.newaxis]
+        return (
+            self._origins[:, 0, np.newaxis] + local_xs * cos - local_ys * sin,
+            self._origins[:, 1, np.newaxis] + local_xs * sin + local_ys * cos
+        )
+
+    def _get_cell(self, coords: np.ndarray) -> np.ndarray:
+        return np.floor(coords / self.cell_size).astype(np.int64)
+
+    @staticmethod
+    def _get_keys(cell_xs: np.ndarray, cell_ys: np.ndarray) -> np.ndarray:
+        return cell_xs * _CELL_ROWS + (cell_ys + _CELL_ROWS // 2)
+
+    def _build_cells(self):
+        min_cells = self._get_cell(self._mins)
+        max_cells = self._get_cell(self._maxs)
+        column_counts = max_cells[:, 0] - min_cells[:, 0] + 1
+        row_counts = max_cells[:, 1] - min_cells[:, 1] + 1
+        cell_counts = column_counts * row_counts
+
+        # Each cluster is repeated once for every cell it covers.
+        glyphs = np.repeat(np.arange(len(self)), cell_counts)
+        cell_indexes = np.arange(len(glyphs)) - np.repeat(
+            np.cumsum(cell_counts) - cell_counts,
+            cell_counts
+        )
+        repeated_row_counts = np.repeat(row_counts, cell_counts)
+        keys = self._get_keys(
+            np.repeat(min_cells[:, 0], cell_counts) +
+            cell_indexes // repeated_row_counts,
+            np.repeat(min_cells[:, 1], cell_counts) +
+            cell_indexes % repeated_row_counts
+        )
+
+        # A stable sort keeps the clusters of each cell in the order of the
+        # placements.
+        order = np.argsort(keys, kind='stable')
+        self._cell_keys, starts = np.unique(keys[order], return_index=True)
+        self._cell_starts = starts
+        self._cell_ends = np.append(starts[1:], len(keys))
+        self._cell_glyphs = glyphs[order]
+
+    def _get_glyphs_in_key_range(
+            self,
+            min_key: int,
+            max_key: int
+    ) -> np.ndarray:
+        first = np.searchsorted(self._cell_keys, min_key, side='left')
+        last = np.searchsorted(self._cell_keys, max_key, side='right')
+        if first >= last:
+            return np.zeros(0, dtype=int)
+        return self._cell_glyphs[
+            self._cell_starts[first]:self._cell_ends[last - 1]
+        ]
+
+    def _get_local_coords(
+            self,
+            glyphs: np.ndarray,
+            x: np.ndarray,
+            y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return:
+            the coordinates of points relative to the origin and rotation of
+            each cluster in ``glyphs``, with a row of points for each cluster
+        """
+        dx = x - self._origins[glyphs, 0, np.newaxis]
+        dy = y - self._origins[glyphs, 1, np.newaxis]
+        cos = self._cos[glyphs, np.newaxis]
+        sin = self._sin[glyphs, np.newaxis]
+        return dx * cos + dy * sin, dy * cos - dx * sin
+
+    def _to_picks(self, glyphs: np.ndarray) -> List[Pick]:
+        return [tuple(pick) for pick in self._picks[glyphs].tolist()]
+
+    def query_point(self, x: float, y: float) -> List[Pick]:
+        """
+        :param x:
+            the x coordinate of the point
+        :param y:
+            the y coordinate of the point
+        :return:
+            the clusters whose rotated logical extents contain the point, in
+            the order of the placements
+        """
+        if len(self) == 0:
+            return []
+        cell_x, cell_y = self._get_cell(np.array([x, y]))
+        key = int(self._get_keys(cell_x, cell_y))
+        glyphs = self._get_glyphs_in_key_range(key, key)
+        local_xs, local_ys = self._get_local_coords(
+            glyphs,
+            np.array([x]),
+            np.array([y])
+        )
+        local_xs = local_xs[:, 0]
+        local_ys = local_ys[:, 0]
+        inside = (local_xs >= 0) & (local_xs <= self._widths[glyphs]) & \
+            (local_ys >= self._tops[glyphs]) & \
+            (local_ys <= self._bottoms[glyphs])
+        return self._to_picks(glyphs[inside])
+
+    def pick(self, x: float, y: float) -> Optional[Pick]:
+        """
+        :param x:
+            the x coordinate of the point
+        :param y:
+            the y coordinate of the point
+        :return:
+            the cluster under the point that is drawn last, and so on top,
+            or ``None`` if there is no cluster under the point
+        """
+        picks = self.query_point(x, y)
+        if len(picks) == 0:
+            return None
+        return picks[-1]
+
+    def query_extent(self, extent: Extent) -> List[Pick]:
+        """
+        :param extent:
+            the extent to find clusters in
+        :return:
+            the clusters whose rotated logical extents overlap or touch the
+            extent, in the order of the placements
+        """
+        if len(self) == 0:
+            return []
+        min_coord = np.array([extent.x, extent.y])
+        max_coord = min_coord + [extent.width, extent.height]
+        (min_cell_x, min_cell_y), (max_cell_x, max_cell_y) = \
+            self._get_cell(np.array([min_coord, max_coord]))
+
+        # The cells of each column of the extent have consecutive keys.
+        glyphs = np.unique(np.concatenate([
+            self._get_glyphs_in_key_range(
+                int(self._get_keys(cell_x, min_cell_y)),
+                int(self._get_keys(cell_x, max_cell_y))
+            )
+            for cell_x in range(int(min_cell_x), int(max_cell_x) + 1)
+        ] + [np.zeros(0, dtype=int)]))
+
+        # The rotated logical extents and the extent are rectangles, so they
+        # overlap unless they are separated along an axis of either of them.
+        overlapping = np.all(
+            (self._mins[glyphs] <= max_coord) &
+            (self._maxs[glyphs] >= min_coord),
+            axis=1
+        )
+        glyphs = glyphs[overlapping]
+        corner_xs = np.array([min_coord[0], max_coord[0]] * 2)
+        corner_ys = np.repeat([min_coord[1], max_coord[1]], 2)
+        local_xs, local_ys = self._get_local_coords(
+            glyphs,
+            corner_xs,
+            corner_ys
+        )
+        overlapping = \
+            (local_xs.max(axis=1) >= 0) & \
+            (local_xs.min(axis=1) <= self._widths[glyphs]) & \
+            (local_ys.max(axis=1) >= self._tops[glyphs]) & \
+            (local_ys.min(axis=1) <= self._bottoms[glyphs])
+        return self._to_picks(glyphs[overlapping])
@@ -1,12 +1,41 @@
 import math
+from typing import Tuple, Union
 
 from shapely.geometry import Point
 
+Coordinate = Tuple[float, float]
 
-def add_polar_vector(point: Point, angle: float, magnitude: float):
+
+def add_polar_vector_to_coords(
+        coord: Coordinate,
+        angle: float,
+        magnitude: float
+) -> Coordinate:
+    """
+    :param coord:
+        the coordinate to start from
+    :param angle:
+        the angle of the vector to apply to the coordinate
+    :param magnitude:
+        the length of the vector to apply to the coordinate
+    :return:
+        a new coordinate at the new position
+    """
+    return (
+        coord[0] + math.cos(angle) * magnitude,
+        coord[1] + math.sin(angle) * magnitude
+    )
+
+
+def add_polar_vector(
+        point: Union[Point, Coordinate],
+        angle: float,
+        magnitude: float
+) -> Union[Point, Coordinate]:
     """
     :param point:
-        the point to start from
+        the point to start from. If a coordinate tuple is given, a coordinate
+        tuple is returned and no ``Point`` is created.
     :param angle:
         the angle of the vector to apply to the point
     :param magnitude:
@@ -14,6 +43,10 @@ def add_polar_vector(point: Point, angle: float, magnitude: float):
     :return:
         a new point at the new position
     """
-    d_x = math.cos(angle) * magnitude
-    d_y = math.sin(angle) * magnitude
-    return Point(point.x + d_x, point.y + d_y)
+    if isinstance(point, Point):
+        return Point(add_polar_vector_to_coords(
+            (point.x, point.y),
+            angle,
+            magnitude
+        ))
+    return add_polar_vector_to_coords(point, angle, magnitude)
@@ -0,0 +1,712 @@
+"""
+    Functions to help with polylines stored as ``(N, 2)`` NumPy arrays of
+    coordinates.
+
+    Unlike the functions in :mod:`line_string_helper`, these operate on many
+    offsets at once, without creating a Python object for each result.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from pangocairohelpers.path.segment_index import SegmentIndex
+
+
+def cumulative_lengths(coords: np.ndarray) -> np.ndarray:
+    """
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :return:
+        an array of ``N`` values, containing the distance along the polyline
+        to each coordinate
+    """
+    segment_lengths = np.hypot(
+        np.diff(coords[:, 0]),
+        np.diff(coords[:, 1])
+    )
+    lengths = np.empty(len(coords))
+    lengths[:1] = 0
+    np.cumsum(segment_lengths, out=lengths[1:])
+    return lengths
+
+
+def segment_angles(coords: np.ndarray) -> np.ndarray:
+    """
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :return:
+        an array of ``N - 1`` values, containing the angle of each segment
+    """
+    return np.arctan2(np.diff(coords[:, 1]), np.diff(coords[:, 0]))
+
+
+def interpolate(
+        coords: np.ndarray,
+        lengths: np.ndarray,
+        offsets: np.ndarray
+) -> np.ndarray:
+    """
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :param lengths:
+        the cumulative lengths of the polyline, as returned by
+        :func:`cumulative_lengths`
+    :param offsets:
+        the distances along the polyline to find positions for. Offsets
+        outside the polyline are clamped to its ends.
+    :return:
+        an ``(M, 2)`` array of positions for each offset
+    """
+    offsets = np.asarray(offsets, dtype=float)
+    positions = np.empty((len(offsets), 2))
+    if len(coords) < 2:
+        positions[:] = coords[0] if len(coords) > 0 else np.nan
+        return positions
+    indexes = np.searchsorted(lengths, offsets, side='right') - 1
+    indexes = np.clip(indexes, 0, len(coords) - 2)
+    start_lengths = lengths[indexes]
+    segment_lengths = lengths[indexes + 1] - start_lengths
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(
+            segment_lengths > 0,
+            (offsets - start_lengths) / segment_lengths,
+            0
+        )
+    ratios = np.clip(ratios, 0, 1)[:, np.newaxis]
+    positions[:] = coords[indexes] + \
+        (coords[indexes + 1] - coords[indexes]) * ratios
+    return positions
+
+
+def angles_at(
+        angles: np.ndarray,
+        lengths: np.ndarray,
+        offsets: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized equivalent of ``line_string_helper.angle_at_offset()``.
+
+    :param angles:
+        the angles of each segment, as returned by :func:`segment_angles`
+    :param lengths:
+        the cumulative lengths of the polyline, as returned by
+        :func:`cumulative_lengths`
+    :param offsets:
+        the distances along the polyline to find angles for
+    :return:
+        an array containing the angle of the segment at each offset
+    """
+    indexes = np.searchsorted(lengths[:-1], offsets, side='right') - 1
+    return angles[np.clip(indexes, 0, len(angles) - 1)]
+
+
+def project(
+        coords: np.ndarray,
+        lengths: np.ndarray,
+        coord: np.ndarray
+) -> float:
+    """
+    Equivalent of Shapely's ``LineString.project()``.
+
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :param lengths:
+        the cumulative lengths of the polyline, as returned by
+        :func:`cumulative_lengths`
+    :param coord:
+        the coordinate to project onto the polyline
+    :return:
+        the distance along the polyline to the point on the polyline that is
+        nearest to ``coord``
+    """
+    if len(coords) < 2:
+        return 0.0
+    starts = coords[:-1]
+    vectors = coords[1:] - starts
+    squared_lengths = np.einsum('ij,ij->i', vectors, vectors)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(
+            squared_lengths > 0,
+            np.einsum('ij,ij->i', np.asarray(coord) - starts, vectors) /
+            squared_lengths,
+            0
+        )
+    ratios = np.clip(ratios, 0, 1)
+    nearest = starts + vectors * ratios[:, np.newaxis]
+    differences = nearest - np.asarray(coord)
+    index = int(np.argmin(np.einsum('ij,ij->i', differences, differences)))
+    return float(
+        lengths[index] + (lengths[index + 1] - lengths[index]) * ratios[index]
+    )
+
+
+def substring(
+        coords: np.ndarray,
+        lengths: np.ndarray,
+        start: float,
+        end: float
+) -> np.ndarray:
+    """
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :param lengths:
+        the cumulative lengths of the polyline, as returned by
+        :func:`cumulative_lengths`
+    :param start:
+        the distance along the polyline where the substring starts
+    :param end:
+        the distance along the polyline where the substring ends. This is
+        clamped to be at least ``start``.
+    :return:
+        the coordinates of the part of the polyline between ``start`` and
+        ``end``
+    """
+    start = min(max(start, 0.0), float(lengths[-1]))
+    end = min(max(end, start), float(lengths[-1]))
+    start_index = np.searchsorted(lengths, start, side='right')
+    end_index = np.searchsorted(lengths, end, side='left')
+    ends = interpolate(coords, lengths, [start, end])
+    return np.concatenate((
+        ends[:1],
+        coords[start_index:end_index],
+        ends[1:]
+    ))
+
+
+def left_to_right_length(coords: np.ndarray) -> float:
+    """
+    Vectorized equivalent of ``line_string_helper.left_to_right_length()``.
+
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :return:
+        the length of all the segments that go left (-x) to right (+x),
+        including vertical segments
+    """
+    dx = np.diff(coords[:, 0])
+    segment_lengths = np.hypot(dx, np.diff(coords[:, 1]))
+    return float(segment_lengths[dx >= 0].sum())
+
+
+def right_to_left_length(coords: np.ndarray) -> float:
+    """
+    Vectorized equivalent of ``line_string_helper.right_to_left_length()``.
+
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :return:
+        the length of all the segments that go right (+x) to left (-x),
+        including vertical segments
+    """
+    dx = np.diff(coords[:, 0])
+    segment_lengths = np.hypot(dx, np.diff(coords[:, 1]))
+    return float(segment_lengths[dx <= 0].sum())
+
+
+# The same values as Shapely's ``JOIN_STYLE``
+JOIN_STYLE_ROUND = 1
+JOIN_STYLE_MITRE = 2
+JOIN_STYLE_BEVEL = 3
+
+
+def _get_cap(
+        center: np.ndarray,
+        offset: np.ndarray,
+        direction: np.ndarray,
+        resolution: int
+) -> np.ndarray:
+    """
+    :return:
+        the coordinates of the half circle from ``center + offset`` to
+        ``center - offset``, around the side of ``center`` that ``direction``
+        points to
+    """
+    sign = np.sign(offset[0] * direction[1] - offset[1] * direction[0])
+    angles = sign * np.pi * np.arange(2 * resolution + 1) / (2 * resolution)
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+    return center + np.column_stack((
+        offset[0] * cos - offset[1] * sin,
+        offset[0] * sin + offset[1] * cos
+    ))
+
+
+def _get_crossing_ratios(
+        coords: np.ndarray,
+        pairs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :param pairs:
+        the ``(M, 2)`` indexes of pairs of segments of the polyline that
+        cross, as returned by :meth:`SegmentIndex.find_crossings`
+    :return:
+        the ratios along the first and second segment of each pair where
+        they cross, which are ``nan`` for parallel segments
+    """
+    starts_a = coords[pairs[:, 0]]
+    vectors_a = coords[pairs[:, 0] + 1] - starts_a
+    starts_b = coords[pairs[:, 1]]
+    vectors_b = coords[pairs[:, 1] + 1] - starts_b
+    differences = starts_b - starts_a
+    denominators = vectors_a[:, 0] * vectors_b[:, 1] - \
+        vectors_a[:, 1] * vectors_b[:, 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios_a = (
+            differences[:, 0] * vectors_b[:, 1] -
+            differences[:, 1] * vectors_b[:, 0]
+        ) / denominators
+        ratios_b = (
+            differences[:, 0] * vectors_a[:, 1] -
+            differences[:, 1] * vectors_a[:, 0]
+        ) / denominators
+    parallel = denominators == 0
+    ratios_a[parallel] = np.nan
+    ratios_b[parallel] = np.nan
+    return np.clip(ratios_a, 0, 1), np.clip(ratios_b, 0, 1)
+
+
+def _get_winding_numbers(
+        points: np.ndarray,
+        coords: np.ndarray
+) -> np.ndarray:
+    """
+    :param points:
+        the ``(M, 2)`` coordinates to find the winding numbers at
+    :param coords:
+        the ``(N, 2)`` coordinates of a closed polyline, which is closed by
+        its first and last coordinates being equal
+    :return:
+        the number of times the polyline winds counterclockwise around each
+        point, when ``y`` points up
+    """
+    # The rays are cast across the narrower side of the polyline's extent,
+    # where they cross fewer segments. Swapping x and y mirrors the polyline,
+    # which reverses the direction it winds in.
+    sign = 1
+    if np.ptp(coords[:, 1]) < np.ptp(coords[:, 0]):
+        points = points[:, ::-1]
+        coords = coords[:, ::-1]
+        sign = -1
+    # Count the segments that cross a ray from each point towards positive x,
+    # upwards if they pass to the right of the point, and downwards if they
+    # pass to its left.
+    pairs = SegmentIndex(coords, 4, 4).query_extents(
+        points,
+        np.column_stack((np.full(len(points), np.inf), points[:, 1]))
+    )
+    starts = coords[pairs[:, 1]]
+    vectors = coords[pairs[:, 1] + 1] - starts
+    differences = points[pairs[:, 0]] - starts
+    sides = vectors[:, 0] * differences[:, 1] - \
+        vectors[:, 1] * differences[:, 0]
+    upwards = (differences[:, 1] >= 0) & (vectors[:, 1] > differences[:, 1])
+    downwards = (differences[:, 1] < 0) & \
+        (vectors[:, 1] <= differences[:, 1])
+    crossings = (upwards & (sides > 0)).astype(int) - \
+        (downwards & (sides < 0)).astype(int)
+    return sign * np.bincount(
+        pairs[:, 0],
+        weights=crossings,
+        minlength=len(points)
+    )
+
+
+def _chain_parts(
+        parts: List[np.ndarray],
+        tolerance: float
+) -> Optional[List[np.ndarray]]:
+    """
+    :param parts:
+        the coordinates of the parts of a polyline
+    :param tolerance:
+        the maximum distance between the end of a part and the start of the
+        part that follows it
+    :return:
+        the parts in the order in which each part starts where the previous
+        part ends, or ``None`` if they do not form a single polyline or ring
+    """
+    starts = np.array([part[0] for part in parts])
+    ends = np.array([part[-1] for part in parts])
+    order = np.argsort(starts[:, 0], kind='stable')
+    sorted_xs = starts[order, 0]
+    next_parts = np.full(len(parts), -1)
+    for i, end in enumerate(ends):
+        # Parts usually continue with the part after them, where a removed
+        # loop crosses itself, but can continue with any part.
+        candidates = order[
+            np.searchsorted(sorted_xs, end[0] - tolerance):
+            np.searchsorted(sorted_xs, end[0] + tolerance, side='right')
+        ]
+        candidates = candidates[candidates != i]
+        gaps = np.hypot(*(starts[candidates] - end).T)
+        if len(candidates) > 0 and gaps.min() <= tolerance:
+            next_parts[i] = candidates[np.argmin(gaps)]
+
+    # Parts that form a ring start with the first part.
+    firsts = np.setdiff1d(np.arange(len(parts)), next_parts)
+    if len(firsts) > 1:
+        return None
+    chain = [int(firsts[0]) if len(firsts) > 0 else 0]
+    while next_parts[chain[-1]] not in (-1, chain[0]) and \
+            len(chain) <= len(parts):
+        chain.append(int(next_parts[chain[-1]]))
+    if len(chain) != len(parts):
+        return None
+    return [parts[i] for i in chain]
+
+
+def _remove_near_parts(
+        offset_coords: np.ndarray,
+        opposite_coords: np.ndarray,
+        coords: np.ndarray,
+        distance: float,
+        resolution: int
+) -> Optional[np.ndarray]:
+    """
+    Removes the parts of an offset polyline that are nearer to the polyline
+    than the offset distance, like loops into tight turns and ends that
+    turn back towards the polyline.
+
+    Like Shapely's buffers, the area nearer than the offset distance is the
+    area inside the outline made of the offsets on both sides of the
+    polyline and the half circles around its ends. The offset can only enter
+    or leave that area where it crosses the outline.
+
+    :param opposite_coords:
+        the offset on the other side of the polyline, before its near parts
+        are removed
+    :param resolution:
+        the number of segments used to approximate a quarter circle in the
+        half circles around the ends
+    :return:
+        the remaining parts, joined where they meet, or ``None`` if nothing
+        remains or the remaining parts do not meet
+    """
+    outline = np.concatenate((
+        offset_coords,
+        _get_cap(
+            coords[-1],
+            offset_coords[-1] - coords[-1],
+            coords[-1] - coords[-2],
+            resolution
+        )[1:-1],
+        opposite_coords[::-1],
+        _get_cap(
+            coords[0],
+            opposite_coords[0] - coords[0],
+            coords[0] - coords[1],
+            resolution
+        )[1:-1],
+        offset_coords[:1]
+    ))
+    pairs = SegmentIndex(outline, 4, 4).find_crossings()
+    # Only the crossings of the offset are needed, which are the first
+    # segments of the outline.
+    pairs = pairs[pairs[:, 0] < len(offset_coords) - 1]
+    ratios_a, ratios_b = _get_crossing_ratios(outline, pairs)
+    on_offset = pairs[:, 1] < len(offset_coords) - 1
+    crossing_segments = np.concatenate((pairs[:, 0], pairs[on_offset, 1]))
+    crossing_ratios = np.concatenate((ratios_a, ratios_b[on_offset]))
+    parallel = np.isnan(crossing_ratios)
+
+    lengths = cumulative_lengths(offset_coords)
+    bounds = np.unique(np.concatenate((
+        [0, lengths[-1]],
+        lengths[crossing_segments[~parallel]] +
+        crossing_ratios[~parallel] *
+        np.diff(lengths)[crossing_segments[~parallel]]
+    )))
+    # Each piece between two crossings is either entirely inside the
+    # outline or not, so a point just outside the middle of the first
+    # segment of each piece decides whether it is removed. The outline winds
+    # counterclockwise around the area inside it for positive distances.
+    segments = np.minimum(
+        np.searchsorted(lengths, bounds[:-1], side='right') - 1,
+        len(offset_coords) - 2
+    )
+    middles = (
+        bounds[:-1] + np.minimum(bounds[1:], lengths[segments + 1])
+    ) / 2
+    vectors = np.diff(offset_coords, axis=0)[segments]
+    normals = np.column_stack((vectors[:, 1], -vectors[:, 0])) / \
+        np.hypot(vectors[:, 0], vectors[:, 1])[:, np.newaxis]
+    points = interpolate(offset_coords, lengths, middles) + \
+        normals * 1e-7 * distance
+    inside = _get_winding_numbers(points, outline) * np.sign(distance) > 0
+    kept = ~inside & (np.diff(bounds) > 1e-9 * abs(distance))
+
+    # The runs of kept pieces must join into a single polyline, usually where
+    # a removed loop crosses itself.
+    changes = np.flatnonzero(np.diff(np.concatenate(([0], kept, [0]))))
+    parts = [
+        substring(offset_coords, lengths, bounds[start], bounds[end])
+        for start, end in zip(changes[::2], changes[1::2])
+    ]
+    if len(parts) == 0:
+        return None
+    parts = _chain_parts(
+        parts,
+        1e-6 * abs(distance) + 1e-12 * float(np.abs(coords).max())
+    )
+    if parts is None:
+        return None
+    result = np.concatenate(
+        [parts[0]] + [part[1:] for part in parts[1:]]
+    )
+    distinct = np.concatenate((
+        [True],
+        np.any(np.diff(result, axis=0) != 0, axis=1)
+    ))
+    return result[distinct]
+
+
+def _get_raw_offset(
+        coords: np.ndarray,
+        directions: np.ndarray,
+        segment_lengths: np.ndarray,
+        distance: float,
+        join_style: int,
+        resolution: int,
+        mitre_limit: float
+) -> np.ndarray:
+    """
+    :return:
+        the coordinates of the offset polyline before the parts that are too
+        near the polyline are removed
+    """
+    normals = np.column_stack((directions[:, 1], -directions[:, 0]))
+    offsets = normals * distance
+
+    # The turn at each vertex between two segments
+    cross = directions[:-1, 0] * directions[1:, 1] - \
+        directions[:-1, 1] * directions[1:, 0]
+    dot = np.einsum('ij,ij->i', directions[:-1], directions[1:])
+    turns = np.arctan2(cross, dot)
+    straight = np.abs(turns) < 1e-9
+    # Reversals are joined around the end of the previous segment.
+    reversed_turns = (np.abs(cross) < 1e-9) & (dot < 0)
+    turns[reversed_turns] = np.pi * np.sign(distance)
+    inner = (cross * distance < 0) & ~straight & ~reversed_turns
+
+    # Inner joins are the intersection of the offset segments. Where it is
+    # beyond the other end of either segment, the offset segments are joined
+    # through the vertex instead, which is removed with the other parts that
+    # are too near the polyline.
+    trims = np.zeros(len(cross))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        trims[inner] = np.abs(distance * cross[inner]) / (1 + dot[inner])
+    through_vertex = inner & (
+        (trims > segment_lengths[:-1]) | (trims > segment_lengths[1:])
+    )
+
+    # The number of steps each outer join is divided into. Joins with no
+    # steps are a single point at the intersection of the offset segments.
+    steps = np.zeros(len(cross), dtype=int)
+    outer = ~inner & ~straight
+    if join_style == JOIN_STYLE_ROUND:
+        steps[outer] = np.maximum(
+            1,
+            np.ceil(np.abs(turns[outer]) * 2 * resolution / np.pi)
+        ).astype(int)
+    elif join_style == JOIN_STYLE_MITRE:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mitre_ratios = np.sqrt(2 / (1 + dot))
+        clipped = outer & ~(mitre_ratios <= mitre_limit)
+        steps[clipped] = 1
+    else:
+        steps[outer] = 1
+    steps[through_vertex] = 2
+
+    # Rotate the offset of the previous segment around each vertex, towards
+    # the offset of the next segment.
+    counts = steps + 1
+    vertex_indexes = np.repeat(np.arange(len(cross)), counts)
+    step_indexes = np.arange(len(vertex_indexes)) - \
+        np.repeat(np.cumsum(counts) - counts, counts)
+    angles = turns[vertex_indexes] * \
+        step_indexes / np.maximum(steps[vertex_indexes], 1)
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+    starts = offsets[:-1][vertex_indexes]
+    joins = coords[1:-1][vertex_indexes] + np.column_stack((
+        starts[:, 0] * cos - starts[:, 1] * sin,
+        starts[:, 0] * sin + starts[:, 1] * cos
+    ))
+
+    # Replace the single point joins with the intersection of the offset
+    # segments.
+    single = (steps == 0)[vertex_indexes]
+    single_indexes = vertex_indexes[single]
+    joins[single] = coords[1:-1][single_indexes] + \
+        (offsets[:-1][single_indexes] + offsets[1:][single_indexes]) / \
+        (1 + dot[single_indexes])[:, np.newaxis]
+
+    if np.any(through_vertex):
+        through_indexes = np.flatnonzero(through_vertex)
+        first_indexes = (np.cumsum(counts) - counts)[through_indexes]
+        vertices = coords[1:-1][through_indexes]
+        joins[first_indexes] = vertices + offsets[:-1][through_indexes]
+        joins[first_indexes + 1] = vertices
+        joins[first_indexes + 2] = vertices + offsets[1:][through_indexes]
+
+    if join_style == JOIN_STYLE_MITRE and np.any(clipped):
+        # Clip mitre joins that are too long at ``mitre_limit``, by extending
+        # both offset segments to a line across the bisector of the turn.
+        clipped_indexes = np.flatnonzero(clipped)
+        bisectors = offsets[:-1][clipped_indexes] + \
+            offsets[1:][clipped_indexes]
+        bisector_lengths = np.hypot(bisectors[:, 0], bisectors[:, 1])
+        reversal = bisector_lengths < 1e-9 * abs(distance)
+        bisectors[reversal] = directions[:-1][clipped_indexes[reversal]]
+        bisector_lengths[reversal] = 1
+        bisectors /= bisector_lengths[:, np.newaxis]
+        extensions = np.maximum(0, (
+            mitre_limit * abs(distance) - np.einsum(
+                'ij,ij->i',
+                offsets[:-1][clipped_indexes],
+                bisectors
+            )
+        ) / np.einsum('ij,ij->i', directions[:-1][clipped_indexes], bisectors))
+        first_indexes = (np.cumsum(counts) - counts)[clipped_indexes]
+        vertices = coords[1:-1][clipped_indexes]
+        joins[first_indexes] = vertices + offsets[:-1][clipped_indexes] + \
+            directions[:-1][clipped_indexes] * extensions[:, np.newaxis]
+        joins[first_indexes + 1] = vertices + offsets[1:][clipped_indexes] - \
+            directions[1:][clipped_indexes] * extensions[:, np.newaxis]
+
+    result = np.concatenate((
+        coords[:1] + offsets[:1],
+        joins,
+        coords[-1:] + offsets[-1:]
+    ))
+    distinct = np.concatenate((
+        [True],
+        np.any(np.diff(result, axis=0) != 0, axis=1)
+    ))
+    return result[distinct]
+
+
+def parallel_offset(
+        coords: np.ndarray,
+        distance: float,
+        join_style: int = JOIN_STYLE_ROUND,
+        resolution: int = 16,
+        mitre_limit: float = 5
+) -> Optional[np.ndarray]:
+    """
+    Offsets a polyline, keeping the direction of the polyline.
+
+    Each segment is moved by ``distance`` along its normal. Where the
+    polyline turns away from the offset, the offset segments overlap, and are
+    trimmed to the point where they intersect. Where it turns towards the
+    offset, the gap between them is filled using ``join_style``.
+
+    Like Shapely's offsets, the parts of the offset that come nearer to the
+    polyline than ``distance`` are then removed, such as loops into turns
+    that are tighter than the offset, and ends that turn back towards the
+    polyline. Offsets that break into several parts are not supported.
+    Neither are closed polylines, which would need to be offset as rings.
+
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :param distance:
+        the distance to offset the polyline by. Positive distances offset
+        the polyline to its left, when ``y`` points down, like in cairo.
+    :param join_style:
+        ``JOIN_STYLE_ROUND``, ``JOIN_STYLE_MITRE`` or ``JOIN_STYLE_BEVEL``
+    :param resolution:
+        the number of segments used to approximate a quarter circle in round
+        joins
+    :param mitre_limit:
+        the maximum ratio of the length of a mitre join to ``distance``.
+        Mitre joins that are longer are clipped.
+    :return:
+        the coordinates of the offset polyline, or ``None`` if nothing
+        remains of the offset, it breaks into several parts, or the polyline
+        is closed
+    """
+    coords = np.asarray(coords, dtype=float)[:, :2]
+    vectors = np.diff(coords, axis=0)
+    segment_lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    # Remove repeated coordinates, as they have no direction.
+    keep = np.concatenate(([True], segment_lengths > 0))
+    coords = coords[keep]
+    vectors = vectors[segment_lengths > 0]
+    segment_lengths = segment_lengths[segment_lengths > 0]
+    if len(coords) < 2 or np.array_equal(coords[0], coords[-1]):
+        return None
+    if distance == 0:
+        return coords.copy()
+
+    directions = vectors / segment_lengths[:, np.newaxis]
+    result = _get_raw_offset(
+        coords,
+        directions,
+        segment_lengths,
+        distance,
+        join_style,
+        resolution,
+        mitre_limit
+    )
+    opposite = _get_raw_offset(
+        coords,
+        directions,
+        segment_lengths,
+        -distance,
+        join_style,
+        resolution,
+        mitre_limit
+    )
+    return _remove_near_parts(
+        result,
+        opposite,
+        coords,
+        distance,
+        resolution
+    )
+
+
+def simplify(coords: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Removes repeated coordinates, and simplifies the polyline using the
+    Douglas-Peucker algorithm.
+
+    :param coords:
+        the ``(N, 2)`` coordinates of the polyline
+    :param tolerance:
+        the maximum distance between the removed coordinates and the
+        simplified polyline
+    :return:
+        the coordinates of the simplified polyline, which always include the
+        first and last coordinates
+    """
+    coords = np.asarray(coords, dtype=float)[:, :2]
+    distinct = np.concatenate((
+        [True],
+        np.any(np.diff(coords, axis=0) != 0, axis=1)
+    ))
+    coords = coords[distinct]
+    if len(coords) < 3 or tolerance <= 0:
+        return coords
+
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[[0, -1]] = True
+    ranges = [(0, len(coords) - 1)]
+    while len(ranges) > 0:
+        start, end = ranges.pop()
+        if end - start < 2:
+            continue
+        vector = coords[end] - coords[start]
+        points = coords[start + 1:end] - coords[start]
+        squared_length = vector.dot(vector)
+        if squared_length > 0:
+            ratios = np.clip(points.dot(vector) / squared_length, 0, 1)
+            points = points - ratios[:, np.newaxis] * vector
+        distances = np.hypot(points[:, 0], points[:, 1])
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            index += start + 1
+            keep[index] = True
+            ranges.append((start, index))
+            ranges.append((index, end))
+    return coords[keep]
@@ -1,4 +1,41 @@
-from .text_path_glyph_item import TextPathGlyphItem  # noqa
-from .text_path_abstract import TextPathAbstract  # noqa
-from .text_path import TextPath  # noqa
-from .upright_text_path import UprightTextPath  # noqa
+"""
+    Classes for rendering text along a ``LineString``.
+
+    The classes exported here are imported on first access. See
+    :mod:`pangocairohelpers`.
+"""
+from typing import TYPE_CHECKING
+
+from pangocairohelpers._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .text_path_glyph_item import TextPathGlyphItem  # noqa
+    from .text_path_placement import TextPathPlacement, PlacedCluster  # noqa
+    from .text_path_glyph_arrays import TextPathGlyphArrays  # noqa
+    from .shared_path import SharedPath  # noqa
+    from .text_path_abstract import TextPathAbstract  # noqa
+    from .text_path import TextPath  # noqa
+    from .upright_text_path import UprightTextPath  # noqa
+    from .batch_placement import LabelSpec  # noqa
+    from .font_size_fitting import fit_font_size  # noqa
+    from .truncation import Truncation  # noqa
+    from .text_path_animation import TextPathAnimation  # noqa
+
+_lazy_attributes = {
+    'TextPathGlyphItem': '.text_path_glyph_item',
+    'TextPathPlacement': '.text_path_placement',
+    'PlacedCluster': '.text_path_placement',
+    'TextPathGlyphArrays': '.text_path_glyph_arrays',
+    'SharedPath': '.shared_path',
+    'TextPathAbstract': '.text_path_abstract',
+    'TextPath': '.text_path',
+    'UprightTextPath': '.upright_text_path',
+    'LabelSpec': '.batch_placement',
+    'fit_font_size': '.font_size_fitting',
+    'Truncation': '.truncation',
+    'TextPathAnimation': '.text_path_animation',
+}
+
+__all__ = list(_lazy_attributes)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _lazy_attributes)
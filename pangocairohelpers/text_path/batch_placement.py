@@ -0,0 +1,226 @@
+"""
+    Computes the placements of many labels at once, spread across a pool of
+    processes.
+
+    Pango and cairo objects cannot be pickled, so labels are described by a
+    :class:`LabelSpec` instead, and each worker process shapes and places the
+    labels itself. The resulting :class:`TextPathPlacement` objects only hold
+    plain data, so they are cheap to send back, and can be drawn onto any
+    context with :meth:`TextPathPlacement.draw`.
+"""
+import itertools
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from cairocffi import Context, SVGSurface
+import pangocairocffi
+import pangocffi
+from pangocffi import Alignment, FontDescription, Layout
+from shapely.geometry import LineString
+
+from pangocairohelpers import Side
+from pangocairohelpers.text_path import TextPath, TextPathPlacement, \
+    UprightTextPath
+
+
+class LabelSpec:
+    """
+    An immutable description of a label to place along a line
+    """
+
+    __slots__ = (
+        'text',
+        'font',
+        'coords',
+        'alignment',
+        'side',
+        'start_offset',
+        'vertical_offset',
+        'upright',
+        'markup'
+    )
+
+    def __init__(
+            self,
+            text: str,
+            font: str,
+            coords: Sequence[Tuple[float, float]],
+            alignment: Alignment = Alignment.LEFT,
+            side: Side = Side.LEFT,
+            start_offset: float = 0,
+            vertical_offset: float = 0,
+            upright: bool = True,
+            markup: bool = False
+    ):
+        """
+        :param text:
+            the text of the label
+        :param font:
+            the Pango font description of the text, for example ``Sans 10``
+        :param coords:
+            the coordinates of the line for the text to follow
+        :param alignment:
+            the alignment of the text along the line
+        :param side:
+            the side of the line the text is placed on
+        :param start_offset:
+            how far along the line the text starts
+        :param vertical_offset:
+            how far the text is offset from the line
+        :param upright:
+            if ``True``, the text is placed with ``UprightTextPath``, so that
+            it is never upside down. Otherwise ``TextPath`` is used.
+        :param markup:
+            if ``True``, ``text`` is parsed as Pango markup
+        """
+        object.__setattr__(self, 'text', text)
+        object.__setattr__(self, 'font', font)
+        object.__setattr__(self, 'coords', coords)
+        object.__setattr__(self, 'alignment', alignment)
+        object.__setattr__(self, 'side', side)
+        object.__setattr__(self, 'start_offset', start_offset)
+        object.__setattr__(self, 'vertical_offset', vertical_offset)
+        object.__setattr__(self, 'upright', upright)
+        object.__setattr__(self, 'markup', markup)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            "'%s' object is immutable" % type(self).__name__
+        )
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            "'%s' object is immutable" % type(self).__name__
+        )
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+    def __repr__(self) -> str:
+        return '%s%r' % (type(self).__name__, self._values())
+
+
+# Pango contexts must not be shared by threads, so each thread of each
+# process creates its own.
+_thread_local = threading.local()
+
+
+def _get_pango_context() -> pangocffi.Context:
+    pango_context = getattr(_thread_local, 'pango_context', None)
+    if pango_context is None:
+        # Metrics are computed without hinting, like on vector surfaces, so
+        # that the placements can be drawn onto any kind of surface.
+        context = Context(SVGSurface(None, 1, 1))
+        pango_context = pangocairocffi.create_context(context)
+        _thread_local.context = context
+        _thread_local.pango_context = pango_context
+    return pango_context
+
+
+def _create_layout(label: LabelSpec) -> Layout:
+    layout = Layout(_get_pango_context())
+    description_pointer = pangocffi.pango.pango_font_description_from_string(
+        label.font.encode('utf-8')
+    )
+    # The layout keeps a copy of the font description.
+    layout.set_font_description(
+        FontDescription.from_pointer(description_pointer)
+    )
+    pangocffi.pango.pango_font_description_free(description_pointer)
+    if label.markup:
+        layout.set_markup(label.text)
+    else:
+        layout.set_text(label.text)
+    return layout
+
+
+def compute_placement(label: LabelSpec) -> Optional[TextPathPlacement]:
+    """
+    Shapes and places a single label in the current process.
+
+    :param label:
+        the label to place
+    :return:
+        the placement of the label, or ``None`` if the text does not fit
+        along the line or the line could not be offset
+    """
+    layout = _create_layout(label)
+    line_string = LineString(label.coords)
+    if label.upright:
+        text_path = UprightTextPath(line_string, layout)
+    else:
+        text_path = TextPath(line_string, layout)
+    text_path.alignment = label.alignment
+    text_path.side = label.side
+    text_path.start_offset = label.start_offset
+    text_path.vertical_offset = label.vertical_offset
+
+    try:
+        placement = text_path.compute_placement()
+    except RuntimeError:
+        # The offset of the line was not a single line string
+        return None
+    cluster_count = len(text_path.layout_clusters.get_clusters())
+    if len(placement.clusters) != cluster_count:
+        return None
+    return placement
+
+
+def _compute_chunk(
+        labels: List[LabelSpec]
+) -> List[Optional[TextPathPlacement]]:
+    return [compute_placement(label) for label in labels]
+
+
+def compute_placements(
+        labels: Iterable[LabelSpec],
+        max_workers: Optional[int] = None,
+        chunksize: int = 64,
+        max_pending_chunks: Optional[int] = None
+) -> Iterator[Optional[TextPathPlacement]]:
+    """
+    Shapes and places labels across a pool of processes.
+
+    Labels are read from ``labels`` as the results are consumed, so that
+    only a few chunks of labels and placements are held in memory at once,
+    however many labels there are.
+
+    :param labels:
+        the labels to place
+    :param max_workers:
+        the number of processes to use. Defaults to the number of processors
+        on the machine.
+    :param chunksize:
+        the number of labels sent to a process at once. Larger chunks reduce
+        the overhead of communicating with the processes, smaller chunks
+        spread uneven workloads more evenly.
+    :param max_pending_chunks:
+        the maximum number of chunks that are submitted to the processes, but
+        whose placements have not been returned yet. Defaults to twice the
+        number of processes, which keeps every process busy.
+    :return:
+        the result of :func:`compute_placement` for each label, in the same
+        order as ``labels``
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending_chunks is None:
+        max_pending_chunks = 2 * max_workers
+    labels = iter(labels)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending_chunks = deque()
+        while True:
+            while len(pending_chunks) < max_pending_chunks:
+                chunk = list(itertools.islice(labels, chunksize))
+                if len(chunk) == 0:
+                    break
+                pending_chunks.append(executor.submit(_compute_chunk, chunk))
+            if len(pending_chunks) == 0:
+                return
+            yield from pending_chunks.popleft().result()
@@ -0,0 +1,253 @@
+"""
+    Finds the largest font size at which a layout fits along a path.
+
+    Text widths grow almost linearly with the font size, so only a few sizes
+    are shaped. The metrics of each shaped size are scaled linearly to
+    estimate the next size to shape, and the search stops once the largest
+    size that fits is known within a tolerance.
+"""
+from typing import Any, Optional, Tuple
+
+import numpy as np
+import pangocffi
+from pangocffi import Alignment, FontDescription, Layout, units_from_double, \
+    units_to_double
+
+from pangocairohelpers.path import PathAbstract, as_path
+
+
+def compute_max_curvature(
+        path: PathAbstract,
+        start: float,
+        width: float,
+        height: float
+) -> float:
+    """
+    :param path:
+        the path that the text is placed on
+    :param start:
+        the distance along the path where the text starts
+    :param width:
+        the width of the text
+    :param height:
+        the height of the text
+    :return:
+        the largest angle in radians that the path turns by along any part
+        of the text that is as long as the height of the text
+    """
+    if height <= 0 or width <= 0:
+        return 0.0
+    step = height / 4
+    offsets = np.linspace(
+        start,
+        start + width,
+        max(2, min(int(np.ceil(width / step)) + 1, 10000))
+    )
+    angles = np.unwrap(path.angles_at(offsets))
+    turns = np.abs(np.diff(angles))
+    window = max(1, int(round(height / (offsets[1] - offsets[0]))))
+    if len(turns) <= window:
+        return float(turns.sum())
+    cumulative_turns = np.concatenate(([0], np.cumsum(turns)))
+    return float(np.max(
+        cumulative_turns[window:] - cumulative_turns[:-window]
+    ))
+
+
+class _Fitting:
+
+    def __init__(
+            self,
+            layout: Layout,
+            font_description: FontDescription,
+            path: PathAbstract,
+            alignment: Alignment,
+            start_offset: float,
+            max_curvature: Optional[float]
+    ):
+        self.layout = layout
+        self.font_description = font_description
+        self.path = path
+        self.alignment = alignment
+        self.start_offset = start_offset
+        self.max_curvature = max_curvature
+        self.available_length = path.length - start_offset
+        # The width and height of each size that was shaped
+        self.metrics = {}
+
+    def set_size(self, size: float):
+        self.font_description.set_size(units_from_double(size))
+        self.layout.set_font_description(self.font_description)
+
+    def measure(self, size: float) -> Tuple[float, float]:
+        """
+        :return:
+            the width and height of the layout at a font size, shaping the
+            layout if the size was not measured before
+        """
+        if size not in self.metrics:
+            self.set_size(size)
+            _, logical_extent = self.layout.get_extents()
+            self.metrics[size] = (
+                units_to_double(logical_extent.width),
+                units_to_double(logical_extent.height)
+            )
+        return self.metrics[size]
+
+    def _get_start(self, width: float) -> float:
+        # The same alignment as the ``Svg`` layout engine
+        if self.alignment == Alignment.CENTER:
+            return (self.path.length - width) / 2 + self.start_offset
+        if self.alignment == Alignment.RIGHT:
+            return self.path.length - width + self.start_offset
+        return self.start_offset
+
+    def fits(self, width: float, height: float) -> bool:
+        if width > self.available_length:
+            return False
+        if self.max_curvature is None:
+            return True
+        curvature = compute_max_curvature(
+            self.path,
+            self._get_start(width),
+            width,
+            height
+        )
+        return curvature <= self.max_curvature
+
+    def estimate(self, size: float, max_size: float) -> float:
+        """
+        :return:
+            the largest size up to ``max_size`` that fits, if the metrics of
+            ``size`` were scaled linearly
+        """
+        width, height = self.measure(size)
+        if width <= 0:
+            return max_size
+        upper = min(max_size, size * self.available_length / width)
+        if upper <= 0:
+            return 0.0
+
+        def scaled_fits(scaled_size: float) -> bool:
+            scale = scaled_size / size
+            return self.fits(width * scale, height * scale)
+
+        if scaled_fits(upper):
+            return upper
+        lower = 0.0
+        for _ in range(24):
+            middle = (lower + upper) / 2
+            if scaled_fits(middle):
+                lower = middle
+            else:
+                upper = middle
+        return lower
+
+
+def fit_font_size(
+        layout: Layout,
+        path: Any,
+        font: str,
+        min_size: float,
+        max_size: float,
+        alignment: Alignment = Alignment.LEFT,
+        start_offset: float = 0,
+        max_curvature: Optional[float] = None,
+        tolerance: float = 0.25,
+        max_passes: int = 4
+) -> Optional[float]:
+    """
+    Finds the largest font size, between ``min_size`` and ``max_size``, at
+    which the text of a layout fits along a path, and sets the layout to that
+    size.
+
+    Only the size of the layout's font description is changed, so sizes set
+    in the markup of the layout are not scaled.
+
+    :param layout:
+        the layout of a single line of text
+    :param path:
+        the path for the text to follow. See ``TextPath``.
+    :param font:
+        the Pango font description of the text, for example ``Sans``. Its
+        size is replaced by the sizes that are tried.
+    :param min_size:
+        the smallest font size in points to try
+    :param max_size:
+        the largest font size in points to try
+    :param alignment:
+        the alignment of the text, which decides which part of the path the
+        curvature is measured on
+    :param start_offset:
+        how far along the path the text starts
+    :param max_curvature:
+        the largest angle in radians that the path may turn by along any part
+        of the text that is as long as the height of the text. Larger text is
+        taller, so tight bends limit its size. ``None`` disables the limit.
+    :param tolerance:
+        how far from the largest size that fits the result may be
+    :param max_passes:
+        the maximum number of sizes to shape the layout at. If none of them
+        fit, ``min_size`` is shaped once more.
+    :return:
+        the font size the layout was set to, or ``None`` if the text does not
+        fit at ``min_size``, in which case the layout is set to ``min_size``
+    """
+    description_pointer = pangocffi.pango.pango_font_description_from_string(
+        font.encode('utf-8')
+    )
+    font_description = FontDescription.from_pointer(description_pointer)
+    fitting = _Fitting(
+        layout,
+        font_description,
+        as_path(path),
+        alignment,
+        start_offset,
+        max_curvature
+    )
+    try:
+        largest_fit = None
+        smallest_misfit = None
+        size = max_size
+        for _ in range(max_passes):
+            if fitting.fits(*fitting.measure(size)):
+                largest_fit = size
+            else:
+                smallest_misfit = size
+            if largest_fit == max_size:
+                break
+
+            estimate = fitting.estimate(size, max_size)
+            lower = largest_fit if largest_fit is not None else min_size
+            if smallest_misfit is not None and estimate >= smallest_misfit:
+                # The metrics did not scale linearly, so bisect instead.
+                estimate = (lower + smallest_misfit) / 2
+            if largest_fit is not None and estimate - largest_fit <= \
+                    tolerance:
+                break
+            # Aim below the estimate, so that the next size most likely fits
+            # and the search can stop, and round to the Pango units of the
+            # font description.
+            next_size = units_to_double(
+                units_from_double(max(estimate - tolerance / 2, 0))
+            )
+            if next_size < min_size:
+                if min_size in fitting.metrics:
+                    break
+                next_size = min_size
+            size = next_size
+
+        if largest_fit is None and min_size not in fitting.metrics:
+            # The passes ran out before ``min_size`` was tried. ``None``
+            # means that the text does not fit at ``min_size``, so it is
+            # tried once more.
+            if fitting.fits(*fitting.measure(min_size)):
+                largest_fit = min_size
+        if largest_fit is None:
+            fitting.set_size(min_size)
+            return None
+        fitting.set_size(largest_fit)
+        return largest_fit
+    finally:
+        # The layout keeps a copy of the font description.
+        pangocffi.pango.pango_font_description_free(description_pointer)
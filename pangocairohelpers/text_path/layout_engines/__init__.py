@@ -1,2 +1,22 @@
-from .layout_engine_abstract import LayoutEngineAbstract  # noqa
-from .svg import Svg  # noqa
+"""
+    The layout engines that position the clusters of a text path.
+
+    The classes exported here are imported on first access. See
+    :mod:`pangocairohelpers`.
+"""
+from typing import TYPE_CHECKING
+
+from pangocairohelpers._lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .layout_engine_abstract import LayoutEngineAbstract  # noqa
+    from .svg import Svg  # noqa
+
+_lazy_attributes = {
+    'LayoutEngineAbstract': '.layout_engine_abstract',
+    'Svg': '.svg',
+}
+
+__all__ = list(_lazy_attributes)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _lazy_attributes)
@@ -1,24 +1,41 @@
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import Any, List
 
 from pangocffi import Alignment
 from shapely.geometry import LineString
 
 from pangocairohelpers import LayoutClusters
-from pangocairohelpers.text_path import TextPathGlyphItem
+from pangocairohelpers.path import as_path
+from pangocairohelpers.text_path import TextPathGlyphItem, \
+    TextPathGlyphArrays
+from pangocairohelpers.text_path.truncation import Truncation, \
+    create_ellipsis_clusters
 
 
 class LayoutEngineAbstract(object, metaclass=ABCMeta):
 
     def __init__(
             self,
-            line_string: LineString,
+            line_string: Any,
             layout_clusters: LayoutClusters
     ):
-        self.line_string = line_string
+        """
+        :param line_string:
+            the path for the text to follow. This can be a ``PathAbstract``,
+            a ``LineString``, or an ``(N, 2)`` array of coordinates.
+        :param layout_clusters:
+            the clusters of the layout to position
+        """
+        self.path = as_path(line_string)
         self.layout_clusters = layout_clusters
         self._alignment = Alignment.LEFT
         self._start_offset = 0
+        self._truncation = Truncation.CLIP
+        self._ellipsis_clusters = None
+
+    @property
+    def line_string(self) -> LineString:
+        return self.path.to_line_string()
 
     @property
     def alignment(self) -> Alignment:
@@ -36,6 +53,39 @@ class LayoutEngineAbstract(object, metaclass=ABCMeta):
     def start_offset(self, value: float):
         self._start_offset = float(value)
 
+    @property
+    def truncation(self) -> Truncation:
+        return self._truncation
+
+    @truncation.setter
+    def truncation(self, value: Truncation):
+        self._truncation = value
+
+    def get_ellipsis_clusters(self) -> LayoutClusters:
+        """
+        :return:
+            the clusters of the ellipsis that ends truncated text. The
+            ellipsis is shaped the first time it is needed. Glyphs of the
+            ellipsis are placed with cluster indexes that follow the clusters
+            of the layout.
+        """
+        if self._ellipsis_clusters is None:
+            self._ellipsis_clusters = create_ellipsis_clusters(
+                self.layout_clusters.get_layout()
+            )
+        return self._ellipsis_clusters
+
     @abstractmethod
     def generate_text_path_glyph_items(self) -> List[TextPathGlyphItem]:
         pass  # pragma: no cover
+
+    def generate_glyph_arrays(self) -> TextPathGlyphArrays:
+        """
+        :return:
+            the same placement as :meth:`generate_text_path_glyph_items`,
+            stored as arrays. Layout engines are encouraged to override this
+            with an implementation that does not create the glyph items.
+        """
+        return TextPathGlyphArrays.from_text_path_glyph_items(
+            self.generate_text_path_glyph_items()
+        )
@@ -1,34 +1,37 @@
-import math
-from typing import List
+from typing import Any, List, Tuple
 
+import numpy as np
 from pangocffi import Alignment
-from shapely.geometry import LineString
 
-from pangocairohelpers import LayoutClusters, point_helper
-from pangocairohelpers import line_string_helper
-from pangocairohelpers.text_path import TextPathGlyphItem
+from pangocairohelpers import LayoutClusters
+from pangocairohelpers.text_path import TextPathGlyphItem, \
+    TextPathGlyphArrays
 from pangocairohelpers.text_path.layout_engines import LayoutEngineAbstract
+from pangocairohelpers.text_path.truncation import Truncation, \
+    get_truncated_cluster_count
 
 
 class Svg(LayoutEngineAbstract):
 
     def __init__(
             self,
-            line_string: LineString,
+            line_string: Any,
             layout_clusters: LayoutClusters
     ):
         super().__init__(line_string, layout_clusters)
 
-    def _get_aligned_start_offset(self) -> float:
+    def _get_aligned_start_offset(self, width: float) -> float:
         """
+        :param width:
+            the width of the text to place
         :return:
             the offset along the line_string where the first character should
             begin.
         """
         if self._alignment == Alignment.CENTER:
-            return self._get_center_aligned_start_offset()
+            return self._get_center_aligned_start_offset(width)
         if self._alignment == Alignment.RIGHT:
-            return self._get_right_aligned_start_offset()
+            return self._get_right_aligned_start_offset(width)
         # Default to left
         return self._get_left_aligned_start_offset()
 
@@ -36,67 +39,122 @@ class Svg(LayoutEngineAbstract):
         # Todo: This assumes we don't allow clipping of text at the beginning
         return self.start_offset
 
-    def _get_center_aligned_start_offset(self) -> float:
-        layout_extent = self.layout_clusters.get_max_logical_extent()
+    def _get_center_aligned_start_offset(self, width: float) -> float:
         # Todo: This assumes we don't allow clipping of text at the beginning
-        if layout_extent.width > self.line_string.length:
+        if width > self.path.length:
             return self._get_left_aligned_start_offset()
-        return (self.line_string.length - layout_extent.width) / 2 + \
+        return (self.path.length - width) / 2 + \
             self.start_offset
 
-    def _get_right_aligned_start_offset(self) -> float:
-        layout_extent = self.layout_clusters.get_max_logical_extent()
+    def _get_right_aligned_start_offset(self, width: float) -> float:
         # Todo: This assumes we don't allow clipping of text at the beginning
-        if layout_extent.width > self.line_string.length:
+        if width > self.path.length:
             return self._get_left_aligned_start_offset()
-        return self.line_string.length - layout_extent.width + \
+        return self.path.length - width + \
             self.start_offset
 
-    def generate_text_path_glyph_items(self) -> List[TextPathGlyphItem]:
-        text_path_glyph_items = []
+    def _get_available_width(self) -> float:
+        """
+        :return:
+            the width of the widest text that stays on the path once it is
+            aligned and moved by the start offset
+        """
+        if self._alignment == Alignment.CENTER:
+            return self.path.length - 2 * abs(self.start_offset)
+        if self._alignment == Alignment.RIGHT:
+            return self.path.length + self.start_offset
+        return self.path.length - self.start_offset
 
-        angles_at_offsets = line_string_helper.angles_at_offsets(
-            self.line_string
+    def _get_extents_to_place(self) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        :return:
+            the logical extents of the clusters to place, their cluster
+            indexes, and the width of the text they make. If the text is
+            truncated, the clusters that fit are followed by the clusters of
+            the ellipsis.
+        """
+        extents = self.layout_clusters.get_logical_extents_array()
+        cluster_indices = np.arange(len(extents))
+        width = self.layout_clusters.get_max_logical_extent().width
+        available_width = self._get_available_width()
+        if self._truncation != Truncation.ELLIPSIS or \
+                width <= available_width or len(extents) == 0:
+            return extents, cluster_indices, width
+
+        ellipsis_clusters = self.get_ellipsis_clusters()
+        ellipsis_width = ellipsis_clusters.get_max_logical_extent().width
+        count = get_truncated_cluster_count(
+            extents[:, 2],
+            self.layout_clusters.get_cluster_texts(),
+            available_width - ellipsis_width
+        )
+        ellipsis_extents = \
+            ellipsis_clusters.get_logical_extents_array().copy()
+        kept_width = float(np.sum(extents[:count, 2]))
+        ellipsis_extents[:, 0] += extents[0, 0] + kept_width
+        return (
+            np.concatenate((extents[:count], ellipsis_extents)),
+            np.concatenate((
+                cluster_indices[:count],
+                len(extents) + np.arange(len(ellipsis_extents))
+            )),
+            kept_width + ellipsis_width
         )
 
-        line_string_length = self.line_string.length
-
-        alignment_start_offset = self._get_aligned_start_offset()
-
+    def generate_text_path_glyph_items(self) -> List[TextPathGlyphItem]:
+        glyph_arrays = self.generate_glyph_arrays()
         glyph_items = self.layout_clusters.get_clusters()
         extents = self.layout_clusters.get_logical_extents()
-        glyph_items_and_extents = zip(glyph_items, extents)
-        for glyph_item, extent in glyph_items_and_extents:
-
-            glyph_width = extent.width
-            offset = alignment_start_offset + extent.x + glyph_width / 2
-
-            # Cut off rendering the rest of the text if there no more space
-            # to layout the text
-            if line_string_length < offset:
-                break
-
-            # Cut off rendering the beginning of the text if there is no
-            # space to layout the text
-            if offset <= 0:
-                continue
-
-            center_position = self.line_string.interpolate(offset)
-
-            rotation = line_string_helper.angle_at_offset(
-                angles_at_offsets, offset
-            )
-
-            left_position = point_helper.add_polar_vector(
-                center_position, rotation + math.pi, glyph_width / 2
-            )
-
-            text_path_glyph_item = TextPathGlyphItem(
-                glyph_item,
-                left_position,
+        if self._ellipsis_clusters is not None:
+            glyph_items = glyph_items + \
+                self._ellipsis_clusters.get_clusters()
+            extents = extents + self._ellipsis_clusters.get_logical_extents()
+
+        # The positions are passed on as tuples, so that no ``Point`` is
+        # created for each glyph unless it is asked for.
+        return [
+            TextPathGlyphItem(
+                glyph_items[cluster_index],
+                (x, y),
                 rotation,
-                extent
+                extents[cluster_index],
+                cluster_index
             )
-            text_path_glyph_items.append(text_path_glyph_item)
-
-        return text_path_glyph_items
+            for (x, y), rotation, cluster_index in zip(
+                glyph_arrays.positions.tolist(),
+                glyph_arrays.rotations.tolist(),
+                glyph_arrays.cluster_indices.tolist()
+            )
+        ]
+
+    def generate_glyph_arrays(self) -> TextPathGlyphArrays:
+        extents, extent_cluster_indices, width = self._get_extents_to_place()
+        widths = extents[:, 2]
+        offsets = self._get_aligned_start_offset(width) + extents[:, 0] + \
+            widths / 2
+
+        # Cut off the rest of the text at the first cluster that does not
+        # fit, and the beginning of the text where there is no space.
+        overflowing = np.flatnonzero(offsets > self.path.length)
+        end = overflowing[0] if len(overflowing) > 0 else len(offsets)
+        placed_indices = np.flatnonzero(offsets[:end] > 0)
+
+        offsets = offsets[placed_indices]
+        widths = widths[placed_indices]
+        rotations = self.path.angles_at(offsets)
+        positions = self.path.interpolate(offsets)
+        positions[:, 0] -= np.cos(rotations) * widths / 2
+        positions[:, 1] -= np.sin(rotations) * widths / 2
+
+        placed_extents = np.zeros((len(placed_indices), 4))
+        placed_extents[:, 1] = extents[placed_indices, 1] - \
+            extents[placed_indices, 4]
+        placed_extents[:, 2] = widths
+        placed_extents[:, 3] = extents[placed_indices, 3]
+
+        return TextPathGlyphArrays(
+            positions,
+            rotations,
+            placed_extents,
+            extent_cluster_indices[placed_indices]
+        )
@@ -0,0 +1,112 @@
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List
+
+from cairocffi import Context
+from pangocffi import Layout
+
+from pangocairohelpers.path import PathAbstract, as_path
+from pangocairohelpers.text_path import TextPathPlacement, \
+    TextPathGlyphArrays
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pangocairohelpers.text_path import TextPathAbstract  # noqa
+
+
+class SharedPath:
+    """
+    A path shared by several labels, like the name of a road, the text of
+    its route shields and its distance markers.
+
+    The shared path owns the input path, and the variants of it that the
+    labels follow: simplified, reversed, offset and transformed. Each variant
+    is computed once, by the first label that needs it, along with the table
+    of lengths it is indexed by, and is then reused by every other label with
+    the same settings. Labels with different layouts, alignments and start
+    offsets only differ in how their clusters are placed along the variants.
+    """
+
+    def __init__(self, line_string: Any):
+        """
+        :param line_string:
+            the path for the labels to follow. This can be a
+            ``PathAbstract``, a ``LineString``, or an ``(N, 2)`` array of
+            coordinates.
+        """
+        self.path = as_path(line_string)
+        self._paths = {}
+        self._labels = []
+
+    @property
+    def labels(self) -> List['TextPathAbstract']:
+        """
+        :return:
+            the text paths of the labels added with :meth:`add_label`
+        """
+        return self._labels
+
+    def get_path(
+            self,
+            key: Hashable,
+            compute_path: Callable[[], PathAbstract]
+    ) -> PathAbstract:
+        """
+        :param key:
+            the settings that the variant of the path depends on
+        :param compute_path:
+            computes the variant of the path, if it has not been computed yet
+        :return:
+            the variant of the path
+        """
+        path = self._paths.get(key)
+        if path is None:
+            path = compute_path()
+            self._paths[key] = path
+        return path
+
+    def add_label(
+            self,
+            layout: Layout,
+            upright: bool = False
+    ) -> 'TextPathAbstract':
+        """
+        :param layout:
+            the layout of the label
+        :param upright:
+            if ``True``, the label is placed with ``UprightTextPath``, so that
+            it is never upside down. Otherwise ``TextPath`` is used.
+        :return:
+            the text path of the label, to set the alignment, offsets and
+            other settings of the label on
+        """
+        # Imported here, as the text paths import this module.
+        from pangocairohelpers.text_path import TextPath, UprightTextPath
+
+        if upright:
+            text_path = UprightTextPath(self, layout)
+        else:
+            text_path = TextPath(self, layout)
+        self._labels.append(text_path)
+        return text_path
+
+    def compute_placements(self) -> List[TextPathPlacement]:
+        """
+        :return:
+            the placement of each label, in the order they were added
+        """
+        return [label.compute_placement() for label in self._labels]
+
+    def compute_glyph_arrays(self) -> List[TextPathGlyphArrays]:
+        """
+        :return:
+            the glyph arrays of each label, in the order they were added
+        """
+        return [label.compute_glyph_arrays() for label in self._labels]
+
+    def draw(self, context: Context):
+        """
+        Draws every label onto the context, in the order they were added.
+
+        :param context:
+            the context to draw onto
+        """
+        for label in self._labels:
+            label.draw(context)
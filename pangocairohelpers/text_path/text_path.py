@@ -1,75 +1,165 @@
-from typing import Optional, List
+from typing import Any, Optional, List
 
 from cairocffi import Context
 from pangocffi import Layout
 from shapely.geometry import LineString, MultiPolygon
 from pangocairocffi.render_functions import show_glyph_item
 
-from pangocairohelpers import Side, point_helper
-from pangocairohelpers.line_string_helper import reverse, substring, \
+from pangocairohelpers import Side, Extent, point_helper, instrumentation
+from pangocairohelpers.line_string_helper import \
     parallel_offset_with_matching_direction
-from pangocairohelpers.text_path import TextPathAbstract, TextPathGlyphItem
+from pangocairohelpers.path import PathAbstract, PolylinePath, \
+    TransformedPath
+from pangocairohelpers.text_path import TextPathAbstract, TextPathGlyphItem, \
+    TextPathPlacement, TextPathGlyphArrays
+from pangocairohelpers.text_path.truncation import ELLIPSIS
 
 
 class TextPath(TextPathAbstract):
     """
     Renders text similar to the behaviour found in SVG's ``<textPath>``.
 
-    ``line_string`` behaves as the baseline for the text in the layout.
+    ``line_string`` behaves as the baseline for the text in the layout. It
+    can be a ``LineString``, an ``(N, 2)`` array of coordinates, a
+    ``PathAbstract``, like a ``BezierPath`` or an ``ArcPath``, or a
+    ``SharedPath`` that other labels follow too. Shapely is
+    only used when the text is offset from the line and the offset
+    vanishes or breaks into several parts.
 
     Multi-line layouts are not supported and will throw an error.
 
     Left-to-right text is assumed.
     """
 
+    @instrumentation.text_path_method
     def __init__(
             self,
-            line_string: LineString,
+            line_string: Any,
             layout: Layout
     ):
         """
         :param line_string:
-            a ``LineString`` for the text to follow
+            a ``LineString``, ``(N, 2)`` array of coordinates,
+            ``PathAbstract`` or ``SharedPath`` for the text to follow
         :param layout:
             the layout to apply to the ``line_string``
         """
         super().__init__(line_string, layout)
 
-        self._modified_line_string = None  # type: Optional[LineString]
+        self._modified_path = None  # type: Optional[PathAbstract]
+        self._modified_path_key = None
         self._text_path_glyph_items = None  \
             # type: Optional[List[TextPathGlyphItem]]
 
-    def _generate_modified_line_string(self):
-        self._modified_line_string = self._input_line_string
-        if self._side == Side.RIGHT:
-            self._modified_line_string = reverse(self._modified_line_string)
+    def _offset_path(
+            self,
+            path: PathAbstract,
+            distance: float
+    ) -> PathAbstract:
+        offset_path = path.offset(distance)
+        if offset_path is not None:
+            return offset_path
 
-        if self._vertical_offset != 0:
-            self._modified_line_string, matched_direction = \
-                parallel_offset_with_matching_direction(
-                    self._modified_line_string,
+        if isinstance(path, TransformedPath) and path.is_similarity:
+            # The path is offset before it is transformed, so that the offset
+            # is shared by every similarity transform of the path.
+            return TransformedPath(
+                self._offset_path(
+                    path.path,
+                    path.to_original_offset(distance)
+                ),
+                path.transform
+            )
+
+        offset_coords = self._offset_cache.get_offset(
+            path.to_coords(),
+            distance
+        )
+        if offset_coords is not None:
+            return PolylinePath(offset_coords)
+
+        # Offsets that vanish or break into several parts, and closed paths,
+        # are left to Shapely.
+        offset_line_string, matched_direction = \
+            parallel_offset_with_matching_direction(
+                path.to_line_string(),
+                distance,
+                side=Side.LEFT
+            )
+
+        if not isinstance(offset_line_string, LineString) or \
+                offset_line_string.is_empty:
+            raise RuntimeError("Failed to offset linestring. "
+                               "Non-linestring object returned.")
+
+        if not matched_direction:
+            raise RuntimeError("Failed to offset linestring. "
+                               "Direction could not be established.")
+
+        return PolylinePath(offset_line_string.coords)
+
+    def _generate_modified_path(self):
+        # The modified path only depends on these settings, so that changing
+        # other settings, like the start offset, does not offset it again.
+        key = (
+            self._side,
+            self._vertical_offset,
+            self._simplification,
+            self._offset_cache,
+            self._transform
+        )
+        if self._modified_path is not None and \
+                key == self._modified_path_key:
+            return
+
+        self._modified_path = None
+        # The layout engine is created again to follow the new path.
+        self._layout_engine = None
+        if self._shared_path is None:
+            path = self._compute_modified_path()
+        else:
+            # Labels with the same settings on a shared path follow the same
+            # modified path, which is computed once.
+            path = self._shared_path.get_path(
+                (
+                    'modified',
+                    self._side,
                     self._vertical_offset,
-                    side=Side.LEFT
-                )
+                    self._get_simplification_tolerance(),
+                    self._transform
+                ),
+                self._compute_modified_path
+            )
 
-            if not isinstance(self._modified_line_string, LineString) or \
-                    self._modified_line_string.is_empty:
-                self._modified_line_string = None
-                raise RuntimeError("Failed to offset linestring. "
-                                   "Non-linestring object returned.")
+        self._modified_path = path
+        self._modified_path_key = key
 
-            if not matched_direction:
-                self._modified_line_string = None
-                raise RuntimeError("Failed to offset linestring. "
-                                   "Direction could not be established.")
+    def compute_modified_path(self) -> PathAbstract:
+        """
+        :return:
+            the path that the glyphs are placed on, after it has been
+            transformed, simplified, reversed and offset
+        """
+        self._generate_modified_path()
+        return self._modified_path
+
+    def _compute_modified_path(self) -> PathAbstract:
+        path = self._get_simplified_path()
+        if self._side == Side.RIGHT:
+            path = path.reversed()
+
+        if self._vertical_offset != 0:
+            with instrumentation.stage(instrumentation.OFFSETTING):
+                path = self._offset_path(path, self._vertical_offset)
+        return path
 
     def _generate_layout_engine(self):
-        self._generate_modified_line_string()
+        self._generate_modified_path()
 
         if not isinstance(self._layout_engine, self._layout_engine_class) or \
                 self._layout_engine is None:
             self._layout_engine = self.layout_engine_class(
-                self._modified_line_string,
+                self._modified_path,
                 self._layout_clusters
             )
 
@@ -79,52 +169,221 @@ class TextPath(TextPathAbstract):
         if self._layout_engine.start_offset != self._start_offset:
             self._layout_engine.start_offset = self._start_offset
 
+        if self._layout_engine.truncation != self._truncation:
+            self._layout_engine.truncation = self._truncation
+
     def _compute_text_path_glyph_items(self) -> List[TextPathGlyphItem]:
         self._generate_layout_engine()
-        self._text_path_glyph_items = self._layout_engine. \
-            generate_text_path_glyph_items()
+        with instrumentation.stage(instrumentation.PLACEMENT):
+            self._text_path_glyph_items = self._layout_engine. \
+                generate_text_path_glyph_items()
         return self._text_path_glyph_items
 
+    @instrumentation.text_path_method
     def text_fits(self) -> bool:
         text_path_glyph_items = self._compute_text_path_glyph_items()
-        number_of_laid_out_glyphs = len(text_path_glyph_items)
+        # Glyphs of an ellipsis do not count, as they replace text that did
+        # not fit.
+        number_of_laid_out_glyphs = sum(
+            1 for text_path_glyph_item in text_path_glyph_items
+            if not self._is_ellipsis(text_path_glyph_item)
+        )
         number_of_total_glyphs = len(self._layout_clusters.get_clusters())
         return number_of_laid_out_glyphs == number_of_total_glyphs
 
-    def compute_baseline(self) -> Optional[LineString]:
+    def _is_ellipsis(self, text_path_glyph_item: TextPathGlyphItem) -> bool:
+        cluster_index = text_path_glyph_item.cluster_index
+        return cluster_index is not None and \
+            cluster_index >= len(self._layout_clusters.get_clusters())
+
+    def _get_text(self, text_path_glyph_item: TextPathGlyphItem) -> str:
+        """
+        :return:
+            the text that the glyph item belongs to
+        """
+        if self._is_ellipsis(text_path_glyph_item):
+            return ELLIPSIS
+        return self._layout_text
+
+    def compute_baseline_path(self) -> Optional[PathAbstract]:
+        """
+        :return:
+            the part of the modified path that the text covers, or ``None``
+            if no glyphs are laid out
+        """
         text_path_glyph_items = self._compute_text_path_glyph_items()
+        if len(text_path_glyph_items) == 0:
+            return None
 
         # Get the start position
-        start_point = text_path_glyph_items[0].position
+        start_coords = text_path_glyph_items[0].coords
 
         # Get the end position
         end_glyph = text_path_glyph_items[-1]
-        end_point = point_helper.add_polar_vector(
-            end_glyph.position,
+        end_coords = point_helper.add_polar_vector_to_coords(
+            end_glyph.coords,
             end_glyph.rotation,
             end_glyph.logical_extent.width
         )
 
-        start_offset = self._modified_line_string.project(start_point)
-        end_offset = self._modified_line_string.project(end_point)
+        start_offset = self._modified_path.project(start_coords)
+        end_offset = self._modified_path.project(end_coords)
 
-        return substring(self._modified_line_string, start_offset, end_offset)
+        return self._modified_path.substring(start_offset, end_offset)
 
+    @instrumentation.text_path_method
+    def compute_baseline(self) -> Optional[LineString]:
+        baseline_path = self.compute_baseline_path()
+        if baseline_path is None:
+            return None
+        return baseline_path.to_line_string()
+
+    def resolve_text_path(self) -> 'TextPath':
+        return self
+
+    @instrumentation.text_path_method
     def compute_boundaries(self) -> Optional[MultiPolygon]:
         pass
 
-    def draw(self, context: Context):
+    @instrumentation.text_path_method
+    def compute_bounding_extent(self) -> Optional[Extent]:
         text_path_glyph_items = self._compute_text_path_glyph_items()
-        for text_path_glyph_item in text_path_glyph_items:
-            glyph_position = text_path_glyph_item.position
-            glyph_rotation = text_path_glyph_item.rotation
-
-            context.save()
-            context.translate(glyph_position.x, glyph_position.y)
-            context.rotate(glyph_rotation)
-            show_glyph_item(
-                context,
-                self._layout_text,
-                text_path_glyph_item.glyph_item
-            )
-            context.restore()
+        return self._union_of_extents([
+            text_path_glyph_item.compute_bounding_extent()
+            for text_path_glyph_item in text_path_glyph_items
+        ])
+
+    @instrumentation.text_path_method
+    def compute_placement(self) -> TextPathPlacement:
+        text_path_glyph_items = self._compute_text_path_glyph_items()
+        placement = TextPathPlacement.from_text_path_glyph_items(
+            self._layout_text,
+            text_path_glyph_items
+        )
+        ellipsis_clusters = [
+            cluster
+            for cluster, text_path_glyph_item
+            in zip(placement.clusters, text_path_glyph_items)
+            if self._is_ellipsis(text_path_glyph_item)
+        ]
+        if len(ellipsis_clusters) > 0:
+            # The text of the ellipsis is recorded after the text of the
+            # layout, so that the indexes of its clusters point to it.
+            text_length = len(self._layout_text.encode('utf-8'))
+            placement.text += ELLIPSIS
+            for cluster in ellipsis_clusters:
+                cluster.start_index += text_length
+                cluster.end_index += text_length
+        return placement
+
+    @instrumentation.text_path_method
+    def compute_glyph_arrays(self) -> TextPathGlyphArrays:
+        self._generate_layout_engine()
+        with instrumentation.stage(instrumentation.PLACEMENT):
+            return self._layout_engine.generate_glyph_arrays()
+
+    @staticmethod
+    def _union_of_extents(extents: List[Extent]) -> Optional[Extent]:
+        bounding_extent = None
+        for extent in extents:
+            bounding_extent = extent.union(bounding_extent)
+        return bounding_extent
+
+    @staticmethod
+    def _get_clip_extent(context: Context) -> Extent:
+        x1, y1, x2, y2 = context.clip_extents()
+        return Extent(x1, y1, x2 - x1, y2 - y1)
+
+    def _get_visible_text_path_glyph_items(
+            self,
+            context: Context,
+            viewport: Optional[Extent],
+            cull_to_clip_extents: bool
+    ) -> List[TextPathGlyphItem]:
+        text_path_glyph_items = self._compute_text_path_glyph_items()
+
+        if viewport is None and cull_to_clip_extents:
+            viewport = self._get_clip_extent(context)
+
+        if viewport is None:
+            return text_path_glyph_items
+
+        glyph_extents = [
+            text_path_glyph_item.compute_bounding_extent()
+            for text_path_glyph_item in text_path_glyph_items
+        ]
+        # Skip the whole label first, as tiles commonly only overlap a
+        # small number of the labels that are rendered into them.
+        bounding_extent = self._union_of_extents(glyph_extents)
+        if bounding_extent is None or \
+                not bounding_extent.intersects(viewport):
+            return []
+        return [
+            text_path_glyph_item
+            for text_path_glyph_item, glyph_extent
+            in zip(text_path_glyph_items, glyph_extents)
+            if glyph_extent.intersects(viewport)
+        ]
+
+    @instrumentation.text_path_method
+    def draw(
+            self,
+            context: Context,
+            viewport: Optional[Extent] = None,
+            cull_to_clip_extents: bool = False
+    ):
+        text_path_glyph_items = self._get_visible_text_path_glyph_items(
+            context,
+            viewport,
+            cull_to_clip_extents
+        )
+        instrumentation.count(
+            instrumentation.GLYPHS,
+            len(text_path_glyph_items)
+        )
+        with instrumentation.stage(instrumentation.DRAWING):
+            for text_path_glyph_item in text_path_glyph_items:
+                context.save()
+                context.translate(
+                    text_path_glyph_item.x,
+                    text_path_glyph_item.y
+                )
+                context.rotate(text_path_glyph_item.rotation)
+                show_glyph_item(
+                    context,
+                    self._get_text(text_path_glyph_item),
+                    text_path_glyph_item.glyph_item
+                )
+                context.restore()
+
+    @instrumentation.text_path_method
+    def append_path(
+            self,
+            context: Context,
+            viewport: Optional[Extent] = None,
+            cull_to_clip_extents: bool = False
+    ):
+        text_path_glyph_items = self._get_visible_text_path_glyph_items(
+            context,
+            viewport,
+            cull_to_clip_extents
+        )
+        instrumentation.count(
+            instrumentation.GLYPHS,
+            len(text_path_glyph_items)
+        )
+        with instrumentation.stage(instrumentation.DRAWING):
+            for text_path_glyph_item in text_path_glyph_items:
+                # The current path is not part of the saved state, so the
+                # transformed outlines remain on the path after restoring.
+                context.save()
+                context.translate(
+                    text_path_glyph_item.x,
+                    text_path_glyph_item.y
+                )
+                context.rotate(text_path_glyph_item.rotation)
+                self._glyph_outline_cache.append_glyph_item_path(
+                    context,
+                    text_path_glyph_item.glyph_item
+                )
+                context.restore()
@@ -1,15 +1,26 @@
 from abc import ABCMeta, abstractmethod
 
 from cairocffi import Context
-from typing import Type, TypeVar, Optional
+from typing import TYPE_CHECKING, Any, Sequence, Type, TypeVar, Optional
 
 from pangocffi import Layout, Alignment
 from shapely.geometry import LineString, MultiPolygon
 
-from pangocairohelpers import LayoutClusters, Side
+from pangocairohelpers import LayoutClusters, Side, Extent, instrumentation
+from pangocairohelpers.glyph_outline_cache import GlyphOutlineCache, \
+    default_glyph_outline_cache
+from pangocairohelpers.offset_cache import OffsetCache, default_offset_cache
+from pangocairohelpers.path import PathAbstract, TransformedPath, as_path
+from pangocairohelpers.text_path import TextPathPlacement, \
+    TextPathGlyphArrays
 from pangocairohelpers.text_path.layout_engines import LayoutEngineAbstract
+from pangocairohelpers.text_path.shared_path import SharedPath
+from pangocairohelpers.text_path.truncation import Truncation
 from pangocairohelpers.text_path.layout_engines import Svg as SvgLayoutEngine
 
+if TYPE_CHECKING:  # pragma: no cover
+    from pangocairohelpers.text_path import TextPath  # noqa
+
 LayoutEngine = TypeVar('LayoutEngine', bound=LayoutEngineAbstract)
 
 
@@ -17,25 +28,60 @@ class TextPathAbstract(object, metaclass=ABCMeta):
 
     def __init__(
             self,
-            line_string: LineString,
+            line_string: Any,
             layout: Layout
     ):
         if layout.get_line_count() > 1:
             raise ValueError('layout cannot be more than one line.')
 
         self._layout = layout
-        self._input_line_string = line_string
+        if isinstance(line_string, SharedPath):
+            self._shared_path = line_string
+            self._input_path = line_string.path
+        else:
+            self._shared_path = None
+            self._input_path = as_path(line_string)
 
         self._layout_text = layout.get_text()
 
         self._alignment = Alignment.LEFT
         self._start_offset = 0
         self._vertical_offset = 0
+        self._simplification = 0
         self._side = Side.LEFT
+        self._truncation = Truncation.CLIP
+        self._transform = None
+        self._transformed_path = None
 
         self._layout_clusters = LayoutClusters(self._layout)
         self._layout_engine_class = SvgLayoutEngine
         self._layout_engine = None
+        self._glyph_outline_cache = default_glyph_outline_cache
+        self._offset_cache = default_offset_cache
+
+    @property
+    def path(self) -> PathAbstract:
+        """
+        :return:
+            the path for the text to follow
+        """
+        return self._input_path
+
+    @property
+    def layout_clusters(self) -> LayoutClusters:
+        """
+        :return:
+            the clusters of the layout
+        """
+        return self._layout_clusters
+
+    @property
+    def text(self) -> str:
+        """
+        :return:
+            the text of the layout
+        """
+        return self._layout_text
 
     @property
     def side(self) -> Side:
@@ -98,6 +144,114 @@ class TextPathAbstract(object, metaclass=ABCMeta):
         """
         self._vertical_offset = float(value)
 
+    @property
+    def simplification(self) -> float:
+        return float(self._simplification)
+
+    @simplification.setter
+    def simplification(self, value: float):
+        """
+        :param value:
+            How much the ``line_string`` should be simplified before the text
+            is placed, as a fraction of the height of the layout. Vertices
+            closer than this to the simplified line are removed, which makes
+            text on jagged or high resolution lines faster to place and
+            smoother. For example, ``0.1`` for a layout with a height of
+            ``20`` removes vertices closer than ``2`` units.
+
+            Defaults to ``0``, which leaves the ``line_string`` unchanged
+        """
+        self._simplification = float(value)
+
+    @property
+    def truncation(self) -> Truncation:
+        return self._truncation
+
+    @truncation.setter
+    def truncation(self, value: Truncation):
+        """
+        :param value:
+            What happens to text that is too long for the ``line_string``.
+            With ``Truncation.ELLIPSIS``, the text is cut short between two
+            grapheme clusters, and an ellipsis is placed after it.
+
+            Defaults to ``Truncation.CLIP``, which leaves out the clusters
+            that do not fit
+        """
+        self._truncation = value
+
+    @property
+    def transform(self) -> Optional[Sequence[float]]:
+        return self._transform
+
+    @transform.setter
+    def transform(self, value: Optional[Sequence[float]]):
+        """
+        :param value:
+            An affine transform ``(a, b, d, e, xoff, yoff)`` from the
+            coordinates of the ``line_string`` to the coordinates that the
+            text is placed and drawn in, in the same order as
+            ``shapely.affinity.affine_transform()``. For example, lines in
+            world coordinates can be placed at the scale of a device without
+            transforming the lines first. The transform is applied lazily, and
+            the offsets, simplifications and tables of the ``line_string``
+            are shared by every similarity transform of it.
+
+            The start offset, vertical offset and layout are in the
+            transformed coordinates.
+
+            Defaults to ``None``, which leaves the ``line_string`` unchanged
+        """
+        if value is not None:
+            value = tuple(float(element) for element in value)
+        self._transform = value
+        self._transformed_path = None
+
+    def _get_transformed_path(self) -> PathAbstract:
+        """
+        :return:
+            the input path, with the transform applied to it
+        """
+        if self._transform is None:
+            return self._input_path
+        if self._transformed_path is None:
+            self._transformed_path = TransformedPath(
+                self._input_path,
+                self._transform
+            )
+        return self._transformed_path
+
+    def _get_simplification_tolerance(self) -> float:
+        """
+        :return:
+            the tolerance that the input path is simplified with, relative to
+            the height of the layout
+        """
+        if self._simplification <= 0:
+            return 0
+        layout_extent = self._layout_clusters.get_max_logical_extent()
+        return self._simplification * layout_extent.height
+
+    def _get_simplified_path(self) -> PathAbstract:
+        """
+        :return:
+            the transformed input path, simplified with a tolerance relative
+            to the height of the layout
+        """
+        tolerance = self._get_simplification_tolerance()
+        if tolerance == 0:
+            return self._get_transformed_path()
+        if self._shared_path is not None:
+            return self._shared_path.get_path(
+                ('simplified', tolerance, self._transform),
+                lambda: self._simplify_path(tolerance)
+            )
+        return self._simplify_path(tolerance)
+
+    def _simplify_path(self, tolerance: float) -> PathAbstract:
+        with instrumentation.stage(instrumentation.SIMPLIFYING):
+            return self._get_transformed_path().simplified(tolerance)
+
     @property
     def layout_engine_class(self) -> Type[LayoutEngine]:
         return self._layout_engine_class
@@ -113,6 +267,45 @@ class TextPathAbstract(object, metaclass=ABCMeta):
         """
         self._layout_engine_class = value
 
+    @property
+    def glyph_outline_cache(self) -> GlyphOutlineCache:
+        return self._glyph_outline_cache
+
+    @glyph_outline_cache.setter
+    def glyph_outline_cache(self, value: GlyphOutlineCache):
+        """
+        :param value:
+            The cache of glyph outlines to use in ``append_path()``.
+
+            Defaults to a cache that is shared by all text paths
+        """
+        self._glyph_outline_cache = value
+
+    @property
+    def offset_cache(self) -> OffsetCache:
+        return self._offset_cache
+
+    @offset_cache.setter
+    def offset_cache(self, value: OffsetCache):
+        """
+        :param value:
+            The cache of offset paths to use when ``vertical_offset`` is set.
+
+            Defaults to a cache that is shared by all text paths
+        """
+        self._offset_cache = value
+
+    @abstractmethod
+    def resolve_text_path(self) -> 'TextPath':
+        """
+        Resolves the ``TextPath`` that lays out the text, for example the
+        side of the path chosen by ``UprightTextPath``.
+
+        :return:
+            the text path that places the glyphs
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     def text_fits(self) -> bool:
         """
@@ -144,11 +337,88 @@ class TextPathAbstract(object, metaclass=ABCMeta):
         pass  # pragma: no cover
 
     @abstractmethod
-    def draw(self, context: Context):
+    def compute_bounding_extent(self) -> Optional[Extent]:
         """
-        Todo
+        Computes the axis-aligned extent covering every glyph in the text path
 
         :return:
-            Todo
+            the bounding extent, or ``None`` if no glyphs could be laid out
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def compute_placement(self) -> TextPathPlacement:
+        """
+        Records the positions, rotations and extents of the laid out glyphs,
+        so that they can be drawn onto several contexts (for example SVG, PDF
+        and PNG surfaces) while only laying out the text once.
+
+        :return:
+            the placement of the text path
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def compute_glyph_arrays(self) -> TextPathGlyphArrays:
+        """
+        Computes the positions, rotations and extents of the laid out glyphs
+        as NumPy arrays, without creating Python objects for each glyph.
+
+        :return:
+            the glyph arrays of the text path
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def draw(
+            self,
+            context: Context,
+            viewport: Optional[Extent] = None,
+            cull_to_clip_extents: bool = False
+    ):
+        """
+        Draws the text path onto the context.
+
+        :param context:
+            the context to draw onto
+        :param viewport:
+            if set, glyphs whose rotated logical extent lies entirely outside
+            this extent (in user-space coordinates) are not drawn
+        :param cull_to_clip_extents:
+            if ``True`` and ``viewport`` is not set, the viewport is taken
+            from ``context.clip_extents()``
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def append_path(
+            self,
+            context: Context,
+            viewport: Optional[Extent] = None,
+            cull_to_clip_extents: bool = False
+    ):
+        """
+        Appends the outlines of every glyph in the text path to the current
+        path of the context as a single path, without rendering it. The path
+        can then be stroked and filled, for example to draw a halo:
+
+        .. code-block:: python
+
+            text_path.append_path(context)
+            context.set_source_rgb(1, 1, 1)
+            context.stroke_preserve()
+            context.set_source_rgb(0, 0, 0)
+            context.fill()
+
+        Glyph outlines are read from ``glyph_outline_cache``.
+
+        :param context:
+            the context to append the path to
+        :param viewport:
+            if set, glyphs whose rotated logical extent lies entirely outside
+            this extent (in user-space coordinates) are not appended
+        :param cull_to_clip_extents:
+            if ``True`` and ``viewport`` is not set, the viewport is taken
+            from ``context.clip_extents()``
         """
         pass  # pragma: no cover
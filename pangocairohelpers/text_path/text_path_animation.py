@@ -0,0 +1,113 @@
+from typing import Iterable, Iterator
+
+from cairocffi import Context
+from pangocairocffi.render_functions import show_glyph_item
+
+from pangocairohelpers import instrumentation
+from pangocairohelpers.text_path import TextPathAbstract, \
+    TextPathGlyphArrays
+from pangocairohelpers.text_path.truncation import ELLIPSIS
+
+
+class TextPathAnimation:
+    """
+    Places the text of a text path at many start offsets, for example to
+    slide the text along a route.
+
+    Everything that does not depend on the start offset is computed once
+    when the animation is created: the simplified and offset path with its
+    table of lengths, the clusters of the layout and their extents, and the
+    layout engine. Each frame then only shifts the offsets of the clusters
+    and looks up their positions and angles on the path.
+
+    The text path is not changed by the animation. For an
+    ``UprightTextPath``, the side of the path is chosen once, at the start
+    offset of the text path, so that the text does not flip over while it is
+    animated.
+    """
+
+    def __init__(self, text_path: TextPathAbstract):
+        """
+        :param text_path:
+            the text path to animate, with its other settings, like the
+            alignment and vertical offset, already set
+        """
+        if not isinstance(text_path, TextPathAbstract):
+            raise TypeError('text_path must be a TextPathAbstract')
+
+        text_path = text_path.resolve_text_path()
+        self._text_path = text_path
+        path = text_path.compute_modified_path()
+        self._layout_engine = text_path.layout_engine_class(
+            path,
+            text_path.layout_clusters
+        )
+        self._layout_engine.alignment = text_path.alignment
+        self._layout_engine.truncation = text_path.truncation
+
+        # Compute the tables of the path, and the array of the extents of the
+        # clusters, before the first frame.
+        path.angles_at([0])
+        text_path.layout_clusters.get_logical_extents_array()
+
+    def compute_glyph_arrays(self, start_offset: float) -> TextPathGlyphArrays:
+        """
+        :param start_offset:
+            how far along the path the text starts in this frame. See
+            ``TextPathAbstract.start_offset``.
+        :return:
+            the glyph arrays of the text in this frame
+        """
+        self._layout_engine.start_offset = start_offset
+        with instrumentation.stage(instrumentation.PLACEMENT):
+            return self._layout_engine.generate_glyph_arrays()
+
+    def generate_frames(
+            self,
+            start_offsets: Iterable[float]
+    ) -> Iterator[TextPathGlyphArrays]:
+        """
+        Computes the frames one at a time, so that long animations can be
+        drawn or written out without keeping every frame in memory.
+
+        :param start_offsets:
+            the start offset of each frame
+        :return:
+            the glyph arrays of each frame
+        """
+        for start_offset in start_offsets:
+            yield self.compute_glyph_arrays(start_offset)
+
+    def draw(self, context: Context, glyph_arrays: TextPathGlyphArrays):
+        """
+        Draws a frame onto the context.
+
+        :param context:
+            the context to draw onto
+        :param glyph_arrays:
+            the glyph arrays of the frame, computed by this animation
+        """
+        clusters = self._layout_engine.layout_clusters.get_clusters()
+        layout_text = self._text_path.text
+        instrumentation.count(instrumentation.GLYPHS, len(glyph_arrays))
+        with instrumentation.stage(instrumentation.DRAWING):
+            for (x, y), rotation, cluster_index in zip(
+                    glyph_arrays.positions.tolist(),
+                    glyph_arrays.rotations.tolist(),
+                    glyph_arrays.cluster_indices.tolist()
+            ):
+                if cluster_index < len(clusters):
+                    text = layout_text
+                    glyph_item = clusters[cluster_index]
+                else:
+                    text = ELLIPSIS
+                    ellipsis_clusters = \
+                        self._layout_engine.get_ellipsis_clusters()
+                    glyph_item = ellipsis_clusters.get_clusters()[
+                        cluster_index - len(clusters)
+                    ]
+                context.save()
+                context.translate(x, y)
+                context.rotate(rotation)
+                show_glyph_item(context, text, glyph_item)
+                context.restore()
@@ -0,0 +1,105 @@
+from typing import List
+
+import numpy as np
+
+from pangocairohelpers.text_path import TextPathGlyphItem
+
+
+class TextPathGlyphArrays:
+    """
+    The positions, rotations and extents of the clusters laid out by a text
+    path, stored as NumPy arrays instead of a ``TextPathGlyphItem`` for each
+    cluster.
+
+    This is intended for vectorized processing of the placed glyphs, for
+    example in collision detection or when exporting the geometry.
+    """
+
+    def __init__(
+            self,
+            positions: np.ndarray,
+            rotations: np.ndarray,
+            extents: np.ndarray,
+            cluster_indices: np.ndarray
+    ):
+        """
+        :param positions:
+            an ``(N, 2)`` array with the origin of each cluster on the baseline
+        :param rotations:
+            an array of ``N`` rotations of each cluster around its origin
+        :param extents:
+            an ``(N, 4)`` array with the ``x``, ``y``, ``width`` and ``height``
+            of the logical extent of each cluster, relative to its origin
+            before the cluster is rotated
+        :param cluster_indices:
+            an array of ``N`` indexes of each cluster in
+            ``LayoutClusters.get_clusters()``. The clusters of the ellipsis
+            of truncated text follow the clusters of the layout.
+        """
+        self.positions = positions
+        self.rotations = rotations
+        self.extents = extents
+        self.cluster_indices = cluster_indices
+
+    def __len__(self) -> int:
+        return len(self.cluster_indices)
+
+    @classmethod
+    def from_text_path_glyph_items(
+            cls,
+            text_path_glyph_items: List[TextPathGlyphItem]
+    ) -> 'TextPathGlyphArrays':
+        """
+        :param text_path_glyph_items:
+            the glyph items to convert
+        :return:
+            the arrays of the glyph items
+        """
+        count = len(text_path_glyph_items)
+        positions = np.empty((count, 2))
+        rotations = np.empty(count)
+        extents = np.empty((count, 4))
+        cluster_indices = np.empty(count, dtype=np.intp)
+        for i, text_path_glyph_item in enumerate(text_path_glyph_items):
+            extent = text_path_glyph_item.logical_extent
+            positions[i] = text_path_glyph_item.coords
+            rotations[i] = text_path_glyph_item.rotation
+            extents[i] = (
+                0,
+                extent.y - extent.baseline,
+                extent.width,
+                extent.height
+            )
+            cluster_indices[i] = text_path_glyph_item.cluster_index
+        return cls(positions, rotations, extents, cluster_indices)
+
+    def compute_corners(self) -> np.ndarray:
+        """
+        :return:
+            an ``(N, 4, 2)`` array with the corners of the rotated logical
+            extent of each cluster
+        """
+        local_x = self.extents[:, [0, 0, 0, 0]]
+        local_x[:, 1:3] += self.extents[:, [2, 2]]
+        local_y = self.extents[:, [1, 1, 1, 1]]
+        local_y[:, 2:4] += self.extents[:, [3, 3]]
+        cos = np.cos(self.rotations)[:, np.newaxis]
+        sin = np.sin(self.rotations)[:, np.newaxis]
+        corners = np.empty((len(self), 4, 2))
+        corners[:, :, 0] = self.positions[:, [0]] + local_x * cos - \
+            local_y * sin
+        corners[:, :, 1] = self.positions[:, [1]] + local_x * sin + \
+            local_y * cos
+        return corners
+
+    def compute_bounding_boxes(self) -> np.ndarray:
+        """
+        :return:
+            an ``(N, 4)`` array with the ``min_x``, ``min_y``, ``max_x`` and
+            ``max_y`` of the axis-aligned box covering each rotated cluster
+        """
+        corners = self.compute_corners()
+        return np.concatenate(
+            (corners.min(axis=1), corners.max(axis=1)),
+            axis=1
+        )
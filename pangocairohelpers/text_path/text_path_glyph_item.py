@@ -1,22 +1,138 @@
+import math
+from typing import Optional, Tuple, Union, Any
+
 from pangocffi import GlyphItem
 from shapely.geometry import Point
 
-from pangocairohelpers import GlyphExtent
+from pangocairohelpers import Extent, GlyphExtent
 
 
 class TextPathGlyphItem:
     """
-    An individual glyphItem component that is part of the TextPath
+    An individual glyphItem component that is part of the TextPath.
+
+    Instances are immutable. The position is stored as two floats, and a
+    ``Point`` is only created when :attr:`position` is read.
     """
 
+    __slots__ = (
+        'glyph_item',
+        'x',
+        'y',
+        'rotation',
+        'logical_extent',
+        'cluster_index'
+    )
+
     def __init__(
             self,
             glyph_item: GlyphItem,
-            position: Point,
+            position: Union[Point, Tuple[float, float]],
             rotation: float,
-            logical_extent: GlyphExtent
+            logical_extent: GlyphExtent,
+            cluster_index: Optional[int] = None
     ):
-        self.glyph_item = glyph_item
-        self.position = position
-        self.rotation = rotation
-        self.logical_extent = logical_extent
+        """
+        :param glyph_item:
+            the cluster to render
+        :param position:
+            the position of the cluster's origin on the baseline, either as a
+            ``Point`` or as an ``(x, y)`` tuple
+        :param rotation:
+            the rotation of the cluster around its origin
+        :param logical_extent:
+            the logical extent of the cluster in the layout
+        :param cluster_index:
+            the index of the cluster in ``LayoutClusters.get_clusters()``.
+            The clusters of the ellipsis of truncated text follow the
+            clusters of the layout.
+        """
+        if isinstance(position, Point):
+            x, y = position.x, position.y
+        else:
+            x, y = position
+        object.__setattr__(self, 'glyph_item', glyph_item)
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'rotation', rotation)
+        object.__setattr__(self, 'logical_extent', logical_extent)
+        object.__setattr__(self, 'cluster_index', cluster_index)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            "'%s' object is immutable" % type(self).__name__
+        )
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            "'%s' object is immutable" % type(self).__name__
+        )
+
+    @property
+    def position(self) -> Point:
+        """
+        :return:
+            the position of the cluster's origin on the baseline
+        """
+        return Point(self.x, self.y)
+
+    @property
+    def coords(self) -> Tuple[float, float]:
+        """
+        :return:
+            the position of the cluster's origin on the baseline, without
+            creating a ``Point``
+        """
+        return self.x, self.y
+
+    def compute_bounding_extent(self) -> Extent:
+        """
+        :return:
+            the axis-aligned extent that covers the rotated logical extent of
+            the glyph item
+        """
+        return self.compute_rotated_extent(
+            self.x,
+            self.y,
+            self.rotation,
+            self.logical_extent
+        )
+
+    @staticmethod
+    def compute_rotated_extent(
+            x: float,
+            y: float,
+            rotation: float,
+            logical_extent: GlyphExtent
+    ) -> Extent:
+        """
+        :param x:
+            the x position of the cluster's origin on the baseline
+        :param y:
+            the y position of the cluster's origin on the baseline
+        :param rotation:
+            the rotation of the cluster around its origin
+        :param logical_extent:
+            the logical extent of the cluster in the layout
+        :return:
+            the axis-aligned extent that covers the rotated logical extent
+        """
+        top = logical_extent.y - logical_extent.baseline
+        bottom = top + logical_extent.height
+        right = logical_extent.width
+        cos = math.cos(rotation)
+        sin = math.sin(rotation)
+
+        xs = []
+        ys = []
+        for local_x, local_y in ((0, top), (right, top),
+                                 (right, bottom), (0, bottom)):
+            xs.append(x + local_x * cos - local_y * sin)
+            ys.append(y + local_x * sin + local_y * cos)
+
+        return Extent(
+            min(xs),
+            min(ys),
+            max(xs) - min(xs),
+            max(ys) - min(ys)
+        )
@@ -0,0 +1,342 @@
+from typing import List, Optional, Dict, Any, Sequence
+
+from cairocffi import Context, Matrix, ScaledFont
+
+from pangocairohelpers import Extent, GlyphExtent, glyph_item_helper, \
+    instrumentation
+from pangocairohelpers.glyph_item_helper import Glyph
+from pangocairohelpers.path.transformed_path import apply_transform, \
+    get_similarity
+from pangocairohelpers.text_path import TextPathGlyphItem
+
+
+class PlacedCluster:
+    """
+    A cluster of glyphs that has been positioned by a text path
+    """
+
+    __slots__ = (
+        'cluster_index',
+        'start_index',
+        'end_index',
+        'font_index',
+        'glyphs',
+        'x',
+        'y',
+        'rotation',
+        'logical_extent'
+    )
+
+    def __init__(
+            self,
+            cluster_index: int,
+            start_index: int,
+            end_index: int,
+            font_index: int,
+            glyphs: List[Glyph],
+            x: float,
+            y: float,
+            rotation: float,
+            logical_extent: GlyphExtent
+    ):
+        """
+        :param cluster_index:
+            the index of the cluster in ``LayoutClusters.get_clusters()``.
+            The clusters of the ellipsis of truncated text follow the
+            clusters of the layout.
+        :param start_index:
+            the byte index in the text where the cluster starts
+        :param end_index:
+            the byte index in the text where the cluster ends
+        :param font_index:
+            the index of the cluster's font in ``TextPathPlacement.fonts``
+        :param glyphs:
+            the ``(glyph, x, y)`` tuples of the glyphs in the cluster, relative
+            to the cluster's origin
+        :param x:
+            the x position of the cluster's origin
+        :param y:
+            the y position of the cluster's origin
+        :param rotation:
+            the rotation of the cluster around its origin
+        :param logical_extent:
+            the logical extent of the cluster in the layout
+        """
+        self.cluster_index = cluster_index
+        self.start_index = start_index
+        self.end_index = end_index
+        self.font_index = font_index
+        self.glyphs = glyphs
+        self.x = x
+        self.y = y
+        self.rotation = rotation
+        self.logical_extent = logical_extent
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return:
+            a JSON-serializable representation of the cluster
+        """
+        extent = self.logical_extent
+        return {
+            'cluster_index': self.cluster_index,
+            'start_index': self.start_index,
+            'end_index': self.end_index,
+            'font_index': self.font_index,
+            'glyphs': [list(glyph) for glyph in self.glyphs],
+            'x': self.x,
+            'y': self.y,
+            'rotation': self.rotation,
+            'logical_extent': [
+                extent.x,
+                extent.y,
+                extent.width,
+                extent.height,
+                extent.baseline
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PlacedCluster':
+        """
+        :param data:
+            a representation of a cluster, as returned by :meth:`to_dict`
+        :return:
+            the cluster
+        """
+        return cls(
+            data['cluster_index'],
+            data['start_index'],
+            data['end_index'],
+            data['font_index'],
+            [(int(glyph), x, y) for glyph, x, y in data['glyphs']],
+            data['x'],
+            data['y'],
+            data['rotation'],
+            GlyphExtent(*data['logical_extent'])
+        )
+
+
+class TextPathPlacement:
+    """
+    The result of laying out a text path, recorded so that it can be drawn
+    onto any number of contexts without shaping or laying out the text again.
+
+    Placements only hold plain data, so they can be pickled, or converted to
+    and from JSON with :meth:`to_dict` and :meth:`from_dict`. Fonts are
+    referenced by their Pango font description, and are loaded again when the
+    placement is drawn.
+    """
+
+    __slots__ = ('text', 'fonts', 'clusters')
+
+    def __init__(
+            self,
+            text: str,
+            fonts: List[str],
+            clusters: List[PlacedCluster]
+    ):
+        """
+        :param text:
+            the text of the layout that was placed
+        :param fonts:
+            the descriptions of the fonts used by the clusters
+        :param clusters:
+            the clusters that were placed
+        """
+        self.text = text
+        self.fonts = fonts
+        self.clusters = clusters
+
+    @classmethod
+    def from_text_path_glyph_items(
+            cls,
+            text: str,
+            text_path_glyph_items: List[TextPathGlyphItem]
+    ) -> 'TextPathPlacement':
+        """
+        :param text:
+            the text of the layout that the glyph items belong to
+        :param text_path_glyph_items:
+            the glyph items computed by a text path
+        :return:
+            the recorded placement of the glyph items
+        """
+        fonts = []
+        font_indexes = {}
+        clusters = []
+        for text_path_glyph_item in text_path_glyph_items:
+            glyph_item = text_path_glyph_item.glyph_item
+            glyphs = glyph_item_helper.get_glyphs(glyph_item)
+
+            font = glyph_item_helper.get_font_description_string(glyph_item)
+            if font not in font_indexes:
+                font_indexes[font] = len(fonts)
+                fonts.append(font)
+
+            item = glyph_item.item
+            clusters.append(PlacedCluster(
+                text_path_glyph_item.cluster_index,
+                item.offset,
+                item.offset + item.length,
+                font_indexes[font],
+                glyphs,
+                text_path_glyph_item.x,
+                text_path_glyph_item.y,
+                text_path_glyph_item.rotation,
+                text_path_glyph_item.logical_extent
+            ))
+        return cls(text, fonts, clusters)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return:
+            a JSON-serializable representation of the placement
+        """
+        return {
+            'text': self.text,
+            'fonts': list(self.fonts),
+            'clusters': [cluster.to_dict() for cluster in self.clusters]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TextPathPlacement':
+        """
+        :param data:
+            a representation of a placement, as returned by :meth:`to_dict`
+        :return:
+            the placement
+        """
+        return cls(
+            data['text'],
+            list(data['fonts']),
+            [PlacedCluster.from_dict(cluster) for cluster in data['clusters']]
+        )
+
+    def transformed(self, transform: Sequence[float]) -> 'TextPathPlacement':
+        """
+        Re-emits the placement for another transform, for example when the
+        same labels in world coordinates are drawn at another zoom level,
+        without shaping or laying out the text again.
+
+        :param transform:
+            an affine transform ``(a, b, d, e, xoff, yoff)``, in the same
+            order as ``shapely.affinity.affine_transform()``. It must be a
+            similarity that does not reflect the placement, so that the
+            glyphs keep their shape.
+        :return:
+            the placement, with the positions of the clusters transformed, and
+            the fonts, glyphs and extents scaled
+        """
+        similarity = get_similarity(transform)
+        if similarity is None or similarity[2]:
+            raise ValueError(
+                'Placements can only be transformed by similarities that do '
+                'not reflect them'
+            )
+        scale, rotation, _ = similarity
+        fonts = [
+            glyph_item_helper.scale_font_description_string(font, scale)
+            for font in self.fonts
+        ]
+        positions = apply_transform(
+            transform,
+            [(cluster.x, cluster.y) for cluster in self.clusters]
+        ).tolist()
+        clusters = []
+        for cluster, (x, y) in zip(self.clusters, positions):
+            extent = cluster.logical_extent
+            clusters.append(PlacedCluster(
+                cluster.cluster_index,
+                cluster.start_index,
+                cluster.end_index,
+                cluster.font_index,
+                [
+                    (glyph, glyph_x * scale, glyph_y * scale)
+                    for glyph, glyph_x, glyph_y in cluster.glyphs
+                ],
+                x,
+                y,
+                cluster.rotation + rotation,
+                GlyphExtent(
+                    extent.x * scale,
+                    extent.y * scale,
+                    extent.width * scale,
+                    extent.height * scale,
+                    extent.baseline * scale
+                )
+            ))
+        return TextPathPlacement(self.text, fonts, clusters)
+
+    def compute_cluster_extents(self) -> List[Extent]:
+        """
+        :return:
+            the axis-aligned extent covering each placed cluster
+        """
+        return [
+            TextPathGlyphItem.compute_rotated_extent(
+                cluster.x,
+                cluster.y,
+                cluster.rotation,
+                cluster.logical_extent
+            )
+            for cluster in self.clusters
+        ]
+
+    def compute_bounding_extent(self) -> Optional[Extent]:
+        """
+        :return:
+            the axis-aligned extent covering every placed cluster, or ``None``
+            if no clusters were placed
+        """
+        bounding_extent = None
+        for extent in self.compute_cluster_extents():
+            bounding_extent = extent.union(bounding_extent)
+        return bounding_extent
+
+    def draw(
+            self,
+            context: Context,
+            matrix: Optional[Matrix] = None,
+            font_cache: Optional[Dict[str, ScaledFont]] = None
+    ):
+        """
+        Draws the placed glyphs onto a context.
+
+        :param context:
+            the context to draw onto
+        :param matrix:
+            an optional transformation to apply to the placement before
+            drawing it
+        :param font_cache:
+            an optional dictionary of the scaled fonts that have already been
+            loaded, keyed by their description. Fonts that are missing are
+            loaded and added to it. This allows fonts to be loaded once when
+            drawing many placements onto contexts with the same font options.
+        """
+        if font_cache is None:
+            font_cache = {}
+        scaled_fonts = []
+        for font in self.fonts:
+            if font not in font_cache:
+                font_cache[font] = glyph_item_helper.load_scaled_font(
+                    context,
+                    font
+                )
+            scaled_fonts.append(font_cache[font])
+
+        instrumentation.count(instrumentation.GLYPHS, len(self.clusters))
+        with instrumentation.stage(instrumentation.DRAWING):
+            context.save()
+            if matrix is not None:
+                context.transform(matrix)
+            for cluster in self.clusters:
+                if len(cluster.glyphs) == 0:
+                    continue
+                context.save()
+                context.translate(cluster.x, cluster.y)
+                context.rotate(cluster.rotation)
+                context.set_scaled_font(scaled_fonts[cluster.font_index])
+                context.show_glyphs(cluster.glyphs)
+                context.restore()
+            context.restore()
@@ -0,0 +1,117 @@
+"""
+    Truncates text that is too long for its path, ending it with an ellipsis
+    instead of cutting it off.
+"""
+import unicodedata
+from enum import Enum
+from typing import List
+
+import numpy as np
+from pangocffi import Layout
+
+from pangocairohelpers import LayoutClusters
+
+ELLIPSIS = '\u2026'
+"""The text that is placed after truncated text"""
+
+_ZERO_WIDTH_JOINER = '\u200d'
+_REGIONAL_INDICATORS = ''.join(map(chr, range(0x1f1e6, 0x1f200)))
+
+
+class Truncation(Enum):
+    """
+    What happens to text that is too long for its path.
+    """
+    CLIP = 'clip'
+    """The clusters that do not fit are not placed"""
+    ELLIPSIS = 'ellipsis'
+    """The text is cut short at a grapheme cluster, and ends in an ellipsis"""
+
+
+def create_ellipsis_clusters(layout: Layout) -> LayoutClusters:
+    """
+    :param layout:
+        the layout of the text to truncate
+    :return:
+        the clusters of the ellipsis, shaped with the context and the font
+        description of ``layout``. Fonts set in the markup of the layout are
+        not used.
+    """
+    ellipsis_layout = Layout(layout.get_context())
+    font_description = layout.get_font_description()
+    if font_description is not None:
+        ellipsis_layout.set_font_description(font_description)
+    ellipsis_layout.set_text(ELLIPSIS)
+    return LayoutClusters(ellipsis_layout)
+
+
+def _is_regional_indicator(character: str) -> bool:
+    return character in _REGIONAL_INDICATORS
+
+
+def is_grapheme_boundary(before: str, after: str) -> bool:
+    """
+    Approximates the rules of Unicode's extended grapheme clusters for the
+    characters either side of a boundary between two clusters.
+
+    :param before:
+        the text of the cluster before the boundary
+    :param after:
+        the text of the cluster after the boundary
+    :return:
+        whether the text can be cut between the clusters without splitting a
+        user-perceived character, like a letter and its accents or an emoji
+        sequence
+    """
+    if len(before) == 0 or len(after) == 0:
+        return True
+    previous = before[-1]
+    character = after[0]
+    if previous == '\r' and character == '\n':
+        return False
+    if character == _ZERO_WIDTH_JOINER or \
+            unicodedata.category(character) in ('Mn', 'Mc', 'Me'):
+        return False
+    # Emoji skin tone modifiers
+    if '\U0001f3fb' <= character <= '\U0001f3ff':
+        return False
+    if previous == _ZERO_WIDTH_JOINER:
+        return False
+    if _is_regional_indicator(previous) and \
+            _is_regional_indicator(character):
+        # Flags are pairs of regional indicators
+        indicator_count = len(before) - len(
+            before.rstrip(_REGIONAL_INDICATORS)
+        )
+        return indicator_count % 2 == 0
+    return True
+
+
+def get_truncated_cluster_count(
+        widths: np.ndarray,
+        cluster_texts: List[str],
+        max_width: float
+) -> int:
+    """
+    :param widths:
+        the width of each cluster of the text
+    :param cluster_texts:
+        the text of each cluster
+    :param max_width:
+        the width that the kept clusters must fit in
+    :return:
+        the number of clusters at the beginning of the text to keep, ending
+        on a grapheme boundary and without trailing whitespace
+    """
+    # The prefix sums of the widths are sorted, so the last cluster that fits
+    # is found with a binary search.
+    ends = np.cumsum(widths)
+    count = int(np.searchsorted(ends, max_width, side='right'))
+    while 0 < count < len(cluster_texts) and not is_grapheme_boundary(
+            cluster_texts[count - 1],
+            cluster_texts[count]
+    ):
+        count -= 1
+    while count > 0 and cluster_texts[count - 1].isspace():
+        count -= 1
+    return count
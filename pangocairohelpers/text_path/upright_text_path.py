@@ -1,11 +1,13 @@
 from pangocffi import Layout
-from typing import Optional
+from typing import Any, Optional
 
 from cairocffi import Context
 from shapely.geometry import MultiPolygon, LineString
 
-from pangocairohelpers import line_string_helper
-from pangocairohelpers.text_path import TextPathAbstract, TextPath
+from pangocairohelpers import polyline_helper, Extent, instrumentation
+from pangocairohelpers.path import PathAbstract
+from pangocairohelpers.text_path import TextPathAbstract, TextPath, \
+    TextPathPlacement, TextPathGlyphArrays
 
 
 class UprightTextPath(TextPathAbstract):
@@ -14,49 +16,122 @@ class UprightTextPath(TextPathAbstract):
     never rendered upside down for poor readability.
     """
 
-    def __init__(self, line_string: LineString, layout: Layout):
+    @instrumentation.text_path_method
+    def __init__(self, line_string: Any, layout: Layout):
+        """
+        :param line_string:
+            the path for the text to follow. This can be a ``PathAbstract``,
+            a ``LineString``, an ``(N, 2)`` array of coordinates, or a
+            ``SharedPath``.
+        :param layout:
+            the layout to apply to the ``line_string``
+        """
         super().__init__(line_string, layout)
         self._text_path = None  # type: Optional[TextPath]
 
+    @staticmethod
+    def _left_to_right_length(baseline: Optional[PathAbstract]) -> float:
+        if baseline is None:
+            return 0
+        return polyline_helper.left_to_right_length(baseline.to_coords())
+
     def _compute_best_text_path(self):
-        text_path_a = TextPath(self._input_line_string, self._layout)
+        # Both sides are offset from the shared path, if there is one, so
+        # that other upright labels on it reuse the offset paths.
+        line_string = self._input_path if self._shared_path is None \
+            else self._shared_path
+        text_path_a = TextPath(line_string, self._layout)
         text_path_a.side = self._side
         text_path_a.alignment = self._alignment
         text_path_a.start_offset = self._start_offset
         text_path_a.vertical_offset = self._vertical_offset
+        text_path_a.simplification = self._simplification
+        text_path_a.truncation = self._truncation
+        text_path_a.transform = self._transform
         text_path_a.layout_engine_class = self._layout_engine_class
+        text_path_a.glyph_outline_cache = self._glyph_outline_cache
+        text_path_a.offset_cache = self._offset_cache
 
-        text_path_b = TextPath(self._input_line_string, self._layout)
+        text_path_b = TextPath(line_string, self._layout)
         text_path_b.side = self._side.flipped
         text_path_b.alignment = self._alignment
         text_path_b.start_offset = self._start_offset
         text_path_b.vertical_offset = self._vertical_offset
+        text_path_b.simplification = self._simplification
+        text_path_b.truncation = self._truncation
+        text_path_b.transform = self._transform
         text_path_b.layout_engine_class = self._layout_engine_class
+        text_path_b.glyph_outline_cache = self._glyph_outline_cache
+        text_path_b.offset_cache = self._offset_cache
 
-        baseline_a = text_path_a.compute_baseline()
-        baseline_b = text_path_b.compute_baseline()
+        # The baselines are compared as paths, so that no ``LineString`` is
+        # created for them.
+        baseline_a = text_path_a.compute_baseline_path()
+        baseline_b = text_path_b.compute_baseline_path()
 
-        ltr_length_a = line_string_helper.left_to_right_length(baseline_a)
-        ltr_length_b = line_string_helper.left_to_right_length(baseline_b)
+        ltr_length_a = self._left_to_right_length(baseline_a)
+        ltr_length_b = self._left_to_right_length(baseline_b)
 
         if ltr_length_a > ltr_length_b:
             self._text_path = text_path_a
         else:
             self._text_path = text_path_b
 
+    def resolve_text_path(self) -> TextPath:
+        self._compute_best_text_path()
+        return self._text_path
+
+    @instrumentation.text_path_method
     def text_fits(self) -> bool:
         self._compute_best_text_path()
         return self._text_path.text_fits()
         pass
 
+    @instrumentation.text_path_method
     def compute_baseline(self) -> Optional[LineString]:
         self._compute_best_text_path()
         return self._text_path.compute_baseline()
 
+    @instrumentation.text_path_method
     def compute_boundaries(self) -> MultiPolygon:
         self._compute_best_text_path()
         return self._text_path.compute_boundaries()
 
-    def draw(self, context: Context):
+    @instrumentation.text_path_method
+    def compute_bounding_extent(self) -> Optional[Extent]:
+        self._compute_best_text_path()
+        return self._text_path.compute_bounding_extent()
+
+    @instrumentation.text_path_method
+    def compute_placement(self) -> TextPathPlacement:
+        self._compute_best_text_path()
+        return self._text_path.compute_placement()
+
+    @instrumentation.text_path_method
+    def compute_glyph_arrays(self) -> TextPathGlyphArrays:
+        self._compute_best_text_path()
+        return self._text_path.compute_glyph_arrays()
+
+    @instrumentation.text_path_method
+    def draw(
+            self,
+            context: Context,
+            viewport: Optional[Extent] = None,
+            cull_to_clip_extents: bool = False
+    ):
+        self._compute_best_text_path()
+        return self._text_path.draw(context, viewport, cull_to_clip_extents)
+
+    @instrumentation.text_path_method
+    def append_path(
+            self,
+            context: Context,
+            viewport: Optional[Extent] = None,
+            cull_to_clip_extents: bool = False
+    ):
         self._compute_best_text_path()
-        return self._text_path.draw(context)
+        return self._text_path.append_path(
+            context,
+            viewport,
+            cull_to_clip_extents
+        )
@@ -0,0 +1,202 @@
+import itertools
+import math
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from cairocffi import Context, ImageSurface, FORMAT_ARGB32
+import pangocairocffi
+
+from pangocairohelpers import glyph_item_helper
+from pangocairohelpers.text_path import TextPathPlacement
+
+Tile = Tuple[int, int]
+
+
+class _Worker:
+    """
+    The state of a rendering thread. Pango contexts must not be shared by
+    threads, so each thread loads its own fonts.
+    """
+
+    def __init__(self):
+        self.pango_context = None
+        self.font_cache = {}
+
+    def load_fonts(self, context: Context, fonts: List[str]):
+        if self.pango_context is None:
+            self.pango_context = pangocairocffi.create_context(context)
+        for font in fonts:
+            if font not in self.font_cache:
+                self.font_cache[font] = glyph_item_helper.load_scaled_font(
+                    context,
+                    font,
+                    self.pango_context
+                )
+
+
+class TileRenderer:
+    """
+    Renders placed labels onto a grid of square image tiles, using a pool of
+    threads.
+
+    Placements are indexed by the tiles they overlap when the renderer is
+    created. Each tile is then rendered onto its own surface and context by
+    one of the threads, which only draws the placements in that tile.
+    Placements only hold plain data, so they are shared by every thread.
+
+    Tile ``(x, y)`` covers the area from ``(x * tile_size, y * tile_size)``
+    to ``((x + 1) * tile_size, (y + 1) * tile_size)`` in the coordinates of
+    the placements.
+    """
+
+    def __init__(
+            self,
+            placements: Iterable[Optional[TextPathPlacement]],
+            tile_size: int = 256,
+            margin: float = 2,
+            max_workers: Optional[int] = None
+    ):
+        """
+        :param placements:
+            the placements to render. ``None`` values, for example labels
+            that did not fit, are ignored.
+        :param tile_size:
+            the width and height of each tile in pixels
+        :param margin:
+            how far the ink of a glyph may extend outside its logical extent.
+            Placements are also drawn onto tiles within this distance.
+        :param max_workers:
+            the number of threads to render tiles with. Defaults to the
+            default of ``ThreadPoolExecutor``.
+        """
+        self.tile_size = tile_size
+        self.margin = margin
+        self.max_workers = max_workers
+        self._placements = [
+            placement for placement in placements if placement is not None
+        ]
+        self._tile_index = {}
+        self._index_placements()
+        self._local = threading.local()
+
+    def _index_placements(self):
+        for i, placement in enumerate(self._placements):
+            extent = placement.compute_bounding_extent()
+            if extent is None:
+                continue
+            min_x = math.floor((extent.x - self.margin) / self.tile_size)
+            min_y = math.floor((extent.y - self.margin) / self.tile_size)
+            max_x = math.floor(
+                (extent.x + extent.width + self.margin) / self.tile_size
+            )
+            max_y = math.floor(
+                (extent.y + extent.height + self.margin) / self.tile_size
+            )
+            for tile_x in range(min_x, max_x + 1):
+                for tile_y in range(min_y, max_y + 1):
+                    self._tile_index.setdefault(
+                        (tile_x, tile_y),
+                        []
+                    ).append(i)
+
+    def get_tiles(self) -> List[Tile]:
+        """
+        :return:
+            the tiles that at least one placement is drawn onto, sorted by
+            their ``y`` and then their ``x``
+        """
+        return sorted(self._tile_index.keys(), key=lambda tile: tile[::-1])
+
+    def get_placements(self, tile: Tile) -> List[TextPathPlacement]:
+        """
+        :param tile:
+            the ``(x, y)`` of the tile
+        :return:
+            the placements that are drawn onto the tile
+        """
+        return [
+            self._placements[i] for i in self._tile_index.get(tile, [])
+        ]
+
+    def _get_worker(self) -> _Worker:
+        worker = getattr(self._local, 'worker', None)
+        if worker is None:
+            worker = _Worker()
+            self._local.worker = worker
+        return worker
+
+    def render_tile(self, tile: Tile) -> ImageSurface:
+        """
+        Renders a single tile in the current thread.
+
+        :param tile:
+            the ``(x, y)`` of the tile
+        :return:
+            a new surface with the placements of the tile drawn in black
+        """
+        surface = ImageSurface(FORMAT_ARGB32, self.tile_size, self.tile_size)
+        placements = self.get_placements(tile)
+        if len(placements) == 0:
+            return surface
+
+        context = Context(surface)
+        context.translate(
+            -tile[0] * self.tile_size,
+            -tile[1] * self.tile_size
+        )
+        context.set_source_rgb(0, 0, 0)
+        worker = self._get_worker()
+        for placement in placements:
+            worker.load_fonts(context, placement.fonts)
+            placement.draw(context, font_cache=worker.font_cache)
+        surface.flush()
+        return surface
+
+    def render_tiles(
+            self,
+            tiles: Optional[Iterable[Tile]] = None,
+            max_pending_tiles: Optional[int] = None
+    ) -> Iterator[Tuple[Tile, ImageSurface]]:
+        """
+        Renders tiles concurrently.
+
+        Tiles are read from ``tiles`` as the surfaces are consumed, so that
+        only a few surfaces are held in memory at once, however many tiles
+        there are.
+
+        :param tiles:
+            the ``(x, y)`` of the tiles to render. Defaults to every tile
+            returned by :meth:`get_tiles`.
+        :param max_pending_tiles:
+            the maximum number of tiles that are submitted to the threads, but
+            whose surfaces have not been returned yet. Defaults to twice the
+            number of threads, which keeps every thread busy.
+        :return:
+            each tile and its surface, in the same order as ``tiles``
+        """
+        if tiles is None:
+            tiles = self.get_tiles()
+        if max_pending_tiles is None:
+            max_workers = self.max_workers
+            if max_workers is None:
+                # The default of ``ThreadPoolExecutor``
+                max_workers = min(32, (os.cpu_count() or 1) + 4)
+            max_pending_tiles = 2 * max_workers
+        tiles = iter(tiles)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending_tiles = deque()
+            while True:
+                for tile in itertools.islice(
+                        tiles,
+                        max_pending_tiles - len(pending_tiles)
+                ):
+                    pending_tiles.append(
+                        (tile, executor.submit(self.render_tile, tile))
+                    )
+                if len(pending_tiles) == 0:
+                    return
+                tile, future = pending_tiles.popleft()
+                yield tile, future.result()
@@ -0,0 +1,91 @@
+import itertools
+import pickle
+
+from pangocffi import Alignment
+
+from pangocairohelpers.text_path import LabelSpec, TextPathPlacement
+from pangocairohelpers.text_path import batch_placement
+
+
+def _create_labels():
+    return [
+        LabelSpec(
+            'Label %d' % i,
+            'Sans 10',
+            [(0, i * 20), (100, i * 20 + 10), (200, i * 20)],
+            alignment=Alignment.CENTER,
+            vertical_offset=i % 3
+        )
+        for i in range(10)
+    ]
+
+
+def test_compute_placement():
+    placement = batch_placement.compute_placement(LabelSpec(
+        'Hi from Παν語',
+        'Sans 8',
+        [(0, 10), (50, 20), (100, 10)]
+    ))
+    assert isinstance(placement, TextPathPlacement)
+    assert placement.text == 'Hi from Παν語'
+    assert len(placement.clusters) == 12
+    assert len(placement.fonts) > 0
+
+    restored = pickle.loads(pickle.dumps(placement))
+    assert restored.to_dict() == placement.to_dict()
+
+
+def test_compute_placement_with_markup():
+    placement = batch_placement.compute_placement(LabelSpec(
+        '<b>Hi</b>',
+        'Sans 8',
+        [(0, 10), (100, 10)],
+        markup=True
+    ))
+    assert placement.text == 'Hi'
+
+
+def test_compute_placement_returns_none_if_text_does_not_fit():
+    placement = batch_placement.compute_placement(LabelSpec(
+        'This text is far too long for the line',
+        'Sans 10',
+        [(0, 10), (20, 10)]
+    ))
+    assert placement is None
+
+
+def test_compute_placements_preserves_order():
+    labels = _create_labels()
+    placements = list(batch_placement.compute_placements(
+        labels,
+        max_workers=2,
+        chunksize=3
+    ))
+    assert [placement.text for placement in placements] == \
+        [label.text for label in labels]
+    assert [placement.to_dict() for placement in placements] == [
+        batch_placement.compute_placement(label).to_dict()
+        for label in labels
+    ]
+
+
+def test_compute_placements_consumes_labels_lazily():
+    consumed = []
+
+    def generate_labels():
+        for label in itertools.cycle(_create_labels()):
+            consumed.append(label)
+            yield label
+
+    placements = batch_placement.compute_placements(
+        generate_labels(),
+        max_workers=2,
+        chunksize=3,
+        max_pending_chunks=4
+    )
+    first_placements = list(itertools.islice(placements, 5))
+    assert [placement.text for placement in first_placements] == \
+        ['Label %d' % i for i in range(5)]
+    # The input is endless, but only the pending chunks have been read.
+    assert len(consumed) <= 4 * 3 + 3
+    placements.close()
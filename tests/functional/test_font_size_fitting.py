@@ -0,0 +1,112 @@
+import math
+
+from cairocffi import Context, SVGSurface
+import pangocairocffi
+from pangocffi import Alignment, units_to_double
+from shapely.geometry import LineString
+
+from pangocairohelpers.path import ArcPath, PolylinePath
+from pangocairohelpers.text_path import TextPath, fit_font_size
+from pangocairohelpers.text_path.font_size_fitting import \
+    compute_max_curvature
+
+
+def _create_layout(text: str):
+    surface = SVGSurface(None, 100, 100)
+    context = Context(surface)
+    layout = pangocairocffi.create_layout(context)
+    layout.set_text(text)
+    return layout
+
+
+def _get_width(layout) -> float:
+    _, logical_extent = layout.get_extents()
+    return units_to_double(logical_extent.width)
+
+
+def test_fits_the_largest_size():
+    layout = _create_layout('Hi from Παν語')
+    line_string = LineString([[0, 0], [200, 0]])
+    size = fit_font_size(layout, line_string, 'Sans', 4, 100, tolerance=0.5)
+    assert size is not None
+    assert 4 <= size < 100
+    assert _get_width(layout) <= 200
+    assert TextPath(line_string, layout).text_fits()
+
+    # A size slightly larger than the tolerance no longer fits.
+    fit_font_size(layout, line_string, 'Sans', size + 1, size + 1)
+    assert _get_width(layout) > 200
+
+
+def test_returns_max_size_if_it_fits():
+    layout = _create_layout('Hi')
+    line_string = LineString([[0, 0], [500, 0]])
+    assert fit_font_size(layout, line_string, 'Sans', 4, 12) == 12
+    assert layout.get_font_description().get_size() == 12 * 1024
+
+
+def test_returns_none_if_min_size_does_not_fit():
+    layout = _create_layout('This text is far too long for the line')
+    line_string = LineString([[0, 0], [20, 0]])
+    assert fit_font_size(layout, line_string, 'Sans', 4, 12) is None
+    assert layout.get_font_description().get_size() == 4 * 1024
+
+
+def test_tries_min_size_when_passes_run_out():
+    layout = _create_layout('Hi from Παν語')
+    line_string = LineString([[0, 0], [200, 0]])
+    size = fit_font_size(layout, line_string, 'Sans', 4, 100, max_passes=1)
+    assert size == 4
+    assert layout.get_font_description().get_size() == 4 * 1024
+
+
+def test_max_curvature_limits_the_size():
+    layout = _create_layout('Hi from Παν語')
+    path = ArcPath.circle((100, 100), 50)
+    size_without_limit = fit_font_size(layout, path, 'Sans', 2, 100)
+    size_with_limit = fit_font_size(
+        layout,
+        path,
+        'Sans',
+        2,
+        100,
+        max_curvature=0.5
+    )
+    assert size_with_limit < size_without_limit
+
+
+def test_alignment_and_start_offset():
+    layout = _create_layout('Hi from Παν語')
+    line_string = LineString([[0, 0], [200, 0]])
+    size = fit_font_size(
+        layout,
+        line_string,
+        'Sans',
+        4,
+        100,
+        alignment=Alignment.CENTER,
+        start_offset=100
+    )
+    assert _get_width(layout) <= 100
+    assert size < fit_font_size(layout, line_string, 'Sans', 4, 100)
+
+
+def test_compute_max_curvature():
+    straight = PolylinePath([[0, 0], [100, 0]])
+    assert compute_max_curvature(straight, 0, 100, 10) == 0
+
+    # A right angle turns by a quarter turn on any part that includes it
+    corner = PolylinePath([[0, 0], [100, 0], [100, 100]])
+    assert math.isclose(
+        compute_max_curvature(corner, 50, 100, 10),
+        math.pi / 2
+    )
+    assert compute_max_curvature(corner, 0, 90, 10) == 0
+
+    # An arc turns by the height over its radius
+    arc = ArcPath((0, 0), 50, 0, math.pi)
+    assert math.isclose(
+        compute_max_curvature(arc, 0, arc.length, 10),
+        10 / 50,
+        rel_tol=0.1
+    )
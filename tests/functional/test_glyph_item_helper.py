@@ -0,0 +1,40 @@
+import unittest
+
+from cairocffi import Context, SVGSurface, ScaledFont
+import pangocairocffi
+from pangocffi import Layout
+
+from pangocairohelpers import glyph_item_helper
+
+
+class TestGlyphItemHelper(unittest.TestCase):
+
+    @staticmethod
+    def _create_layout(text: str) -> Layout:
+        surface = SVGSurface(None, 100, 100)
+        cairo_context = Context(surface)
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_text(text)
+        return layout
+
+    def test_get_glyphs(self):
+        layout = self._create_layout('Hi Hi')
+        glyph_item = layout.get_iter().get_run()
+        glyphs = glyph_item_helper.get_glyphs(glyph_item)
+
+        assert len(glyphs) == 5
+        assert glyphs[0][0] == glyphs[3][0]
+        assert glyphs[1][0] == glyphs[4][0]
+        assert glyphs[0][1] == 0
+        x_positions = [x for _, x, _ in glyphs]
+        assert x_positions == sorted(x_positions)
+
+    def test_get_scaled_font(self):
+        layout = self._create_layout('Hi')
+        glyph_item = layout.get_iter().get_run()
+        scaled_font_a = glyph_item_helper.get_scaled_font(glyph_item)
+        scaled_font_b = glyph_item_helper.get_scaled_font(glyph_item)
+
+        assert isinstance(scaled_font_a, ScaledFont)
+        assert glyph_item_helper.get_scaled_font_key(scaled_font_a) == \
+            glyph_item_helper.get_scaled_font_key(scaled_font_b)
@@ -0,0 +1,47 @@
+import unittest
+
+from cairocffi import Context, SVGSurface
+import pangocairocffi
+
+from pangocairohelpers import LayoutClusters
+from pangocairohelpers.glyph_outline_cache import GlyphOutlineCache
+
+
+class TestGlyphOutlineCache(unittest.TestCase):
+
+    @staticmethod
+    def _create_layout_clusters(
+            cairo_context: Context,
+            markup: str
+    ) -> LayoutClusters:
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup(markup)
+        return LayoutClusters(layout)
+
+    def test_outlines_are_cached(self):
+        surface = SVGSurface(None, 100, 100)
+        cairo_context = Context(surface)
+        layout_clusters = self._create_layout_clusters(cairo_context, 'HiHi')
+
+        cache = GlyphOutlineCache()
+        for glyph_item in layout_clusters.get_clusters():
+            cache.append_glyph_item_path(cairo_context, glyph_item)
+
+        assert len(cache) == 2
+        assert cache.misses == 2
+        assert cache.hits == 2
+
+        path = cairo_context.copy_path()
+        assert len(path) > 0
+
+    def test_outlines_are_evicted(self):
+        surface = SVGSurface(None, 100, 100)
+        cairo_context = Context(surface)
+        layout_clusters = self._create_layout_clusters(cairo_context, 'HIO')
+
+        cache = GlyphOutlineCache(max_size=1)
+        for glyph_item in layout_clusters.get_clusters():
+            cache.append_glyph_item_path(cairo_context, glyph_item)
+
+        assert len(cache) == 0
+        assert cache.misses == 3
@@ -0,0 +1,138 @@
+import json
+
+import pytest
+
+from pangocairohelpers import label_cli
+
+
+def _write_lines(path, lines):
+    with open(str(path), 'w', encoding='utf-8') as file:
+        for line in lines:
+            file.write(line + '\n')
+
+
+def _feature(name, coords):
+    return json.dumps({
+        'type': 'Feature',
+        'properties': {'name': name},
+        'geometry': {'type': 'LineString', 'coordinates': coords}
+    })
+
+
+def test_read_geojson_features():
+    features = list(label_cli.read_geojson_features(iter([
+        _feature('A', [[0, 0], [10, 0]]),
+        '',
+        json.dumps({
+            'type': 'Feature',
+            'properties': {'name': 'B'},
+            'geometry': {
+                'type': 'MultiLineString',
+                'coordinates': [[[0, 0], [1, 0]], [[0, 5], [20, 5]]]
+            }
+        }),
+        _feature(None, [[0, 0], [10, 0]]),
+        json.dumps({
+            'type': 'Feature',
+            'properties': {'name': 'C'},
+            'geometry': {'type': 'Point', 'coordinates': [0, 0]}
+        }),
+    ]), 'name'))
+    assert features == [
+        ('A', [(0, 0), (10, 0)]),
+        ('B', [(0, 5), (20, 5)]),
+        None,
+        None,
+    ]
+
+
+def test_read_wkt_features():
+    features = list(label_cli.read_wkt_features(iter([
+        'LINESTRING (0 0, 10 0)\tA\n',
+        'POINT (0 0)\tB\n',
+        'LINESTRING (0 0, 10 0)\n',
+    ])))
+    assert features == [('A', [(0, 0), (10, 0)]), None, None]
+
+
+def test_malformed_lines_are_skipped():
+    features = list(label_cli.read_geojson_features(iter([
+        _feature('A', [[0, 0], [10, 0]]),
+        '{"type": "Feature", "properties": ',
+        _feature('B', [[0, 0]]),
+        '[1, 2]',
+        _feature('C', [[0, 5], [20, 5]]),
+    ]), 'name'))
+    assert features == [
+        ('A', [(0, 0), (10, 0)]),
+        None,
+        None,
+        None,
+        ('C', [(0, 5), (20, 5)]),
+    ]
+
+    features = list(label_cli.read_wkt_features(iter([
+        'LINESTRING (0 0, 10 0)\tA\n',
+        'LINESTRING (0 0\tB\n',
+        'LINESTRING (0 0)\tC\n',
+        'LINESTRING (0 5, 20 5)\tD\n',
+    ])))
+    assert features == [
+        ('A', [(0, 0), (10, 0)]),
+        None,
+        None,
+        ('D', [(0, 5), (20, 5)]),
+    ]
+
+
+@pytest.mark.parametrize("output_name", [
+    'label_cli.svg',
+    'label_cli.pdf',
+    'label_cli.png',
+])
+def test_main(tmpdir, output_name, capsys):
+    input_path = tmpdir.join('features.ndjson')
+    placements_path = tmpdir.join('placements.ndjson')
+    _write_lines(input_path, [
+        _feature('Main Street', [[10, 50], [190, 50]]),
+        # Collides with the first feature
+        _feature('Main Street', [[10, 52], [190, 52]]),
+        _feature('High Street', [[10, 150], [190, 150]]),
+        # Too short for the text
+        _feature('A very long street name', [[10, 100], [20, 100]]),
+        _feature(None, [[10, 100], [20, 100]]),
+    ])
+
+    label_cli.main([
+        str(input_path),
+        'tests/output/%s' % output_name,
+        '--width', '200',
+        '--height', '200',
+        '--placements', str(placements_path),
+    ])
+
+    with open(str(placements_path), encoding='utf-8') as file:
+        placements = [json.loads(line) for line in file]
+    assert [placement['feature_index'] for placement in placements] == [0, 2]
+    assert [placement['text'] for placement in placements] == \
+        ['Main Street', 'High Street']
+
+    _, err = capsys.readouterr()
+    assert '5 features, 2 placed, 1 rejected, 2 skipped' in err
+
+
+def test_main_with_wkt(tmpdir, capsys):
+    input_path = tmpdir.join('features.wkt')
+    _write_lines(input_path, [
+        'LINESTRING (10 50, 190 50)\tMain Street',
+        'LINESTRING (10 100\tBroken Street',
+        'LINESTRING (10 150, 190 150)\tHigh Street',
+    ])
+    label_cli.main([
+        str(input_path),
+        'tests/output/label_cli_wkt.svg',
+        '--width', '200',
+        '--height', '200',
+    ])
+    _, err = capsys.readouterr()
+    assert '3 features, 2 placed, 0 rejected, 1 skipped' in err
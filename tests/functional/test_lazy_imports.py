@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import pytest
+
+import pangocairohelpers
+import pangocairohelpers.path
+import pangocairohelpers.text_path
+import pangocairohelpers.text_path.layout_engines
+
+HEAVY_MODULES = [
+    'shapely',
+    'numpy',
+    'cffi',
+    'cairocffi',
+    'pangocffi',
+    'pangocairocffi',
+]
+
+
+def _get_imported_heavy_modules(statement: str) -> str:
+    return subprocess.check_output([
+        sys.executable,
+        '-c',
+        '%s\n'
+        'import sys\n'
+        'print(sorted(m for m in %r if m in sys.modules))' %
+        (statement, HEAVY_MODULES)
+    ]).decode().strip()
+
+
+@pytest.mark.parametrize("statement", [
+    'import pangocairohelpers',
+    'from pangocairohelpers import Side, Extent, GlyphExtent, line_helper',
+])
+def test_light_imports_do_not_load_dependencies(statement: str):
+    assert _get_imported_heavy_modules(statement) == '[]'
+
+
+@pytest.mark.parametrize("package", [
+    pangocairohelpers,
+    pangocairohelpers.path,
+    pangocairohelpers.text_path,
+    pangocairohelpers.text_path.layout_engines,
+])
+def test_every_export_can_be_accessed(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        pangocairohelpers.does_not_exist
+    with pytest.raises(AttributeError):
+        pangocairohelpers.path.does_not_exist
+    with pytest.raises(AttributeError):
+        pangocairohelpers.text_path.does_not_exist
+    with pytest.raises(AttributeError):
+        pangocairohelpers.text_path.layout_engines.does_not_exist
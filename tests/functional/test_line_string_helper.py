@@ -2,7 +2,8 @@ from typing import List, Tuple, Optional
 
 import pytest
 from shapely.geometry import LineString, Point, JOIN_STYLE, MultiLineString
-from pangocairohelpers import line_string_helper as helper, Side
+from pangocairohelpers import line_string_helper as helper, Side, \
+    instrumentation
 import math
 
 
@@ -461,3 +462,14 @@ def test_parallel_offset_with_matching_direction_multi_linear_ring():
 
     assert isinstance(offset_line_string, MultiLineString) and \
         correct_direction is False
+
+
+def test_next_offset_from_offset_in_line_string_is_instrumented():
+    line_string = LineString([[0, 0], [10, 0], [10, 10]])
+    with instrumentation.recording() as recorder:
+        helper.next_offset_from_offset_in_line_string(line_string, 2, 3)
+    assert recorder.counters == {
+        instrumentation.SHAPELY_INTERPOLATE: 1,
+        instrumentation.SHAPELY_INTERSECTION: 1,
+        instrumentation.SHAPELY_PROJECT: 1,
+    }
@@ -0,0 +1,89 @@
+import numpy as np
+
+from pangocairohelpers import polyline_helper
+from pangocairohelpers.offset_cache import OffsetCache, get_fingerprint
+
+
+def test_offsets_are_cached():
+    coords = np.array([[5, 40], [45, 40], [90, 80]], dtype=float)
+    cache = OffsetCache()
+
+    offset_coords = cache.get_offset(coords, 3)
+    assert cache.misses == 1
+    assert np.allclose(
+        offset_coords,
+        polyline_helper.parallel_offset(coords, 3)
+    )
+    assert not offset_coords.flags.writeable
+
+    assert cache.get_offset(coords.copy(), 3) is offset_coords
+    assert cache.hits == 1
+    assert len(cache) == 1
+
+
+def test_offsets_are_keyed_by_options():
+    coords = np.array([[5, 40], [45, 40], [90, 80]], dtype=float)
+    cache = OffsetCache()
+    cache.get_offset(coords, 3)
+    cache.get_offset(coords, -3)
+    cache.get_offset(coords[::-1], 3)
+    cache.get_offset(coords, 3, join_style=polyline_helper.JOIN_STYLE_MITRE)
+    cache.get_offset(coords, 3, resolution=4)
+    assert cache.misses == 5
+    assert cache.hits == 0
+
+
+def test_failed_offsets_are_cached():
+    coords = np.array([[0, 0], [1, 0], [0, 1]], dtype=float)
+    cache = OffsetCache()
+    assert cache.get_offset(coords, -10) is None
+    assert cache.get_offset(coords, -10) is None
+    assert cache.hits == 1
+
+
+def test_offsets_are_evicted():
+    coords = np.array([[5, 40], [45, 40], [90, 80]], dtype=float)
+    offset_size = len(polyline_helper.parallel_offset(coords, 3))
+    assert len(polyline_helper.parallel_offset(coords, 4)) == offset_size
+
+    # The cache fits one offset, but not two
+    cache = OffsetCache(max_size=offset_size * 2 - 1)
+    cache.get_offset(coords, 3)
+    cache.get_offset(coords, 4)
+    assert len(cache) == 1
+    cache.get_offset(coords, 4)
+    assert cache.hits == 1
+    cache.get_offset(coords, 3)
+    assert cache.misses == 3
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_least_recently_used_offsets_are_evicted():
+    coords = np.array([[5, 40], [45, 40], [90, 80]], dtype=float)
+    offset_size = len(polyline_helper.parallel_offset(coords, 3))
+
+    # The cache fits two offsets, but not three
+    cache = OffsetCache(max_size=offset_size * 2)
+    cache.get_offset(coords, 3)
+    cache.get_offset(coords, 4)
+    # The offset by 3 is used again, so the offset by 4 is evicted
+    cache.get_offset(coords, 3)
+    cache.get_offset(coords, 2)
+    assert len(cache) == 2
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+    cache.get_offset(coords, 3)
+    cache.get_offset(coords, 2)
+    assert cache.hits == 3
+    assert cache.misses == 3
+    cache.get_offset(coords, 4)
+    assert cache.misses == 4
+
+
+def test_get_fingerprint():
+    coords = np.array([[5, 40], [45, 40], [90, 80]], dtype=float)
+    assert get_fingerprint(coords) == get_fingerprint(coords.tolist())
+    assert get_fingerprint(coords) != get_fingerprint(coords[::-1])
+    assert get_fingerprint(coords) != get_fingerprint(coords[:2])
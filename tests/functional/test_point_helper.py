@@ -3,7 +3,8 @@ import math
 import pytest
 from shapely.geometry import Point
 
-from pangocairohelpers.point_helper import add_polar_vector
+from pangocairohelpers.point_helper import add_polar_vector, \
+    add_polar_vector_to_coords
 
 test_add_polar_vector_data = [
     # All directions (from -2pi to 2pi)
@@ -35,3 +36,20 @@ def test_add_polar_vector(
     output = add_polar_vector(point, angle, magnitude)
     assert math.isclose(output.x, expected_output.x)
     assert math.isclose(output.y, expected_output.y)
+
+
+@pytest.mark.parametrize(
+    "point,angle,magnitude,expected_output",
+    test_add_polar_vector_data
+)
+def test_add_polar_vector_to_coords(
+        point: Point,
+        angle: float,
+        magnitude: float,
+        expected_output: Point
+):
+    output = add_polar_vector_to_coords((point.x, point.y), angle, magnitude)
+    assert isinstance(output, tuple)
+    assert math.isclose(output[0], expected_output.x)
+    assert math.isclose(output[1], expected_output.y)
+    assert add_polar_vector((point.x, point.y), angle, magnitude) == output
@@ -0,0 +1,243 @@
+import math
+
+import numpy as np
+import pytest
+from shapely import ops
+from shapely.geometry import LineString, Point
+
+from pangocairohelpers import polyline_helper, line_string_helper
+
+
+def test_cumulative_lengths():
+    coords = np.array([[0, 0], [3, 4], [3, 4], [3, 6]], dtype=float)
+    lengths = polyline_helper.cumulative_lengths(coords)
+    assert lengths.tolist() == [0, 5, 5, 7]
+
+
+def test_segment_angles():
+    coords = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float)
+    angles = polyline_helper.segment_angles(coords)
+    assert np.allclose(angles, [0, math.pi / 2, math.pi])
+
+
+test_interpolate_data = [
+    [[0, 0], [10, 0]],
+    [[0, 0], [10, 0], [10, 10], [0, 10]],
+    [[0, 0], [1, 1], [1, 1], [5, -3], [-4, 2]],
+]
+
+
+@pytest.mark.parametrize("coords", test_interpolate_data)
+def test_interpolate_matches_shapely(coords):
+    line_string = LineString(coords)
+    coords = np.array(coords, dtype=float)
+    lengths = polyline_helper.cumulative_lengths(coords)
+    offsets = np.linspace(0, line_string.length + 1, 37)
+    positions = polyline_helper.interpolate(coords, lengths, offsets)
+    for offset, position in zip(offsets, positions):
+        expected = line_string.interpolate(offset)
+        assert math.isclose(position[0], expected.x, abs_tol=1e-9)
+        assert math.isclose(position[1], expected.y, abs_tol=1e-9)
+
+
+def test_interpolate_clamps_negative_offsets():
+    coords = np.array([[0, 0], [10, 0]], dtype=float)
+    lengths = polyline_helper.cumulative_lengths(coords)
+    positions = polyline_helper.interpolate(coords, lengths, [-5])
+    assert positions.tolist() == [[0, 0]]
+
+
+@pytest.mark.parametrize("coords", test_interpolate_data)
+def test_angles_at_matches_angle_at_offset(coords):
+    line_string = LineString(coords)
+    angles_at_offsets = line_string_helper.angles_at_offsets(line_string)
+    coords = np.array(coords, dtype=float)
+    lengths = polyline_helper.cumulative_lengths(coords)
+    angles = polyline_helper.segment_angles(coords)
+    offsets = np.linspace(0, line_string.length + 1, 37)
+    result = polyline_helper.angles_at(angles, lengths, offsets)
+    for offset, angle in zip(offsets, result):
+        expected = line_string_helper.angle_at_offset(
+            angles_at_offsets,
+            offset
+        )
+        assert math.isclose(angle, expected)
+
+
+@pytest.mark.parametrize("coords", test_interpolate_data)
+def test_project_matches_shapely(coords):
+    line_string = LineString(coords)
+    coords = np.array(coords, dtype=float)
+    lengths = polyline_helper.cumulative_lengths(coords)
+    for point in [[0, 0], [3, 2], [10, -1], [-4, 2], [5, 5], [20, 20]]:
+        assert math.isclose(
+            polyline_helper.project(coords, lengths, np.array(point)),
+            line_string.project(Point(point)),
+            abs_tol=1e-9
+        )
+
+
+@pytest.mark.parametrize("coords", test_interpolate_data)
+def test_substring_matches_shapely(coords):
+    line_string = LineString(coords)
+    coords = np.array(coords, dtype=float)
+    lengths = polyline_helper.cumulative_lengths(coords)
+    for start, end in [(0, line_string.length), (1, 2), (2.5, 14)]:
+        expected = ops.substring(line_string, start, end)
+        result = polyline_helper.substring(coords, lengths, start, end)
+        assert math.isclose(
+            LineString(result).length,
+            expected.length,
+            abs_tol=1e-9
+        )
+        assert np.allclose(result[0], expected.coords[0])
+        assert np.allclose(result[-1], expected.coords[-1])
+
+
+@pytest.mark.parametrize("coords", test_interpolate_data)
+def test_directional_lengths_match_line_string_helper(coords):
+    line_string = LineString(coords)
+    coords = np.array(coords, dtype=float)
+    assert math.isclose(
+        polyline_helper.left_to_right_length(coords),
+        line_string_helper.left_to_right_length(line_string)
+    )
+    assert math.isclose(
+        polyline_helper.right_to_left_length(coords),
+        line_string_helper.right_to_left_length(line_string)
+    )
+
+
+test_parallel_offset_data = [
+    [[5, 40], [45, 40], [90, 80]],
+    [[0, 0], [10, 0], [10, 10], [0, 10]],
+    [[0, 10], [50, 20], [100, 10]],
+    [[0, 0], [50, 0], [0, 40]],
+    [[0, 0], [10, 0], [10, 0], [20, 0], [30, 5]],
+]
+
+
+@pytest.mark.parametrize("coords", test_parallel_offset_data)
+@pytest.mark.parametrize("join_style", [
+    polyline_helper.JOIN_STYLE_ROUND,
+    polyline_helper.JOIN_STYLE_MITRE,
+    polyline_helper.JOIN_STYLE_BEVEL,
+])
+@pytest.mark.parametrize("distance", [-3, 3, 13])
+def test_parallel_offset_matches_shapely(coords, join_style, distance):
+    line_string = LineString(coords)
+    result = polyline_helper.parallel_offset(
+        np.array(coords, dtype=float),
+        distance,
+        join_style=join_style
+    )
+    # Shapely offsets the opposite way, as its y axis points up.
+    expected = line_string.offset_curve(
+        -distance,
+        join_style=join_style
+    )
+    assert result is not None
+    assert np.allclose(result[0], expected.coords[0])
+    assert np.allclose(result[-1], expected.coords[-1])
+    # Round joins are approximated by slightly different points
+    assert LineString(result).hausdorff_distance(expected) < 0.02
+
+
+def test_parallel_offset_keeps_direction():
+    coords = np.array([[0, 10], [50, 20], [100, 10]], dtype=float)
+    result = polyline_helper.parallel_offset(coords, -3)
+    assert result[0, 0] < result[-1, 0]
+    assert np.allclose(
+        polyline_helper.segment_angles(result)[[0, -1]],
+        polyline_helper.segment_angles(coords)[[0, -1]]
+    )
+
+
+def test_parallel_offset_of_zero_returns_coords():
+    coords = np.array([[0, 0], [10, 0], [10, 10]], dtype=float)
+    result = polyline_helper.parallel_offset(coords, 0)
+    assert result.tolist() == coords.tolist()
+    assert not np.shares_memory(result, coords)
+
+
+def test_parallel_offset_fails_on_collapse():
+    coords = np.array([[0, 0], [1, 0], [0, 1]], dtype=float)
+    assert polyline_helper.parallel_offset(coords, -10) is None
+
+
+def test_parallel_offset_fails_on_closed_polylines():
+    coords = np.array([[0, 0], [40, 0], [40, 40], [0, 0]], dtype=float)
+    assert polyline_helper.parallel_offset(coords, -10) is None
+
+
+@pytest.mark.parametrize("tolerance", [0.5, 2, 5])
+def test_simplify_matches_shapely(tolerance):
+    random = np.random.default_rng(0)
+    coords = np.cumsum(random.normal(size=(500, 2)), axis=0)
+    expected = LineString(coords).simplify(
+        tolerance,
+        preserve_topology=False
+    )
+    result = polyline_helper.simplify(coords, tolerance)
+    assert np.allclose(result, np.asarray(expected.coords))
+
+
+def test_simplify_removes_repeated_coordinates():
+    coords = np.array([[0, 0], [0, 0], [5, 1], [5, 1], [10, 0]], dtype=float)
+    assert polyline_helper.simplify(coords, 0).tolist() == \
+        [[0, 0], [5, 1], [10, 0]]
+    assert polyline_helper.simplify(coords, 2).tolist() == [[0, 0], [10, 0]]
+
+
+def test_parallel_offset_fails_on_several_parts():
+    # Offsetting the hook into its inside leaves a loop inside the hook,
+    # apart from the rest of the offset.
+    coords = np.array(
+        [[0, 0], [20, 0], [20, 10], [14, 10], [14, 1]],
+        dtype=float
+    )
+    assert polyline_helper.parallel_offset(coords, -2.5) is None
+
+    result = polyline_helper.parallel_offset(coords, 2.5)
+    assert result is not None
+    assert LineString(result).is_simple
+
+
+def test_parallel_offset_removes_parts_near_polyline():
+    # The end of the offset turns back towards the start of the polyline,
+    # and stops where it is the offset distance from it.
+    coords = np.array(
+        [[0, 0], [20, 0], [20, 10], [5, 10], [5, 1]],
+        dtype=float
+    )
+    result = polyline_helper.parallel_offset(coords, 2)
+    assert np.allclose(result[-1], [3, 2])
+    expected = LineString(coords).offset_curve(-2)
+    assert LineString(result).hausdorff_distance(expected) < 0.02
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parallel_offset_is_never_nearer_than_distance(seed):
+    random = np.random.default_rng(seed)
+    resolution = 16
+    # Round joins cut across the circle around their vertex, by at most the
+    # chord of one step.
+    ratio = math.cos(math.pi / (4 * resolution))
+    count = 0
+    while count < 50:
+        coords = random.uniform(0, 20, size=(random.integers(3, 8), 2))
+        line_string = LineString(coords)
+        if not line_string.is_simple:
+            continue
+        distance = random.choice([-1, 1]) * random.uniform(0.5, 4)
+        result = polyline_helper.parallel_offset(
+            coords,
+            distance,
+            resolution=resolution
+        )
+        if result is None:
+            continue
+        count += 1
+        for coord in result:
+            assert line_string.distance(Point(coord)) >= \
+                abs(distance) * ratio - 1e-9
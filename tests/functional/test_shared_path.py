@@ -0,0 +1,102 @@
+from typing import Tuple
+
+from cairocffi import Context, SVGSurface, Surface
+import numpy as np
+import pangocairocffi
+from pangocffi import Alignment
+from shapely.geometry import LineString
+import unittest
+
+from pangocairohelpers.offset_cache import OffsetCache
+from pangocairohelpers.text_path import SharedPath, TextPath, \
+    UprightTextPath
+
+
+class TestSharedPath(unittest.TestCase):
+
+    line_string = LineString([[190, 90], [90, 90], [50, 50], [10, 50]])
+
+    def _create_void_surface(self) -> Tuple[Surface, Context]:
+        surface = SVGSurface(None, 200, 100)
+        cairo_context = Context(surface)
+        return surface, cairo_context
+
+    def _create_layout(self, context: Context, markup: str):
+        layout = pangocairocffi.create_layout(context)
+        layout.set_markup(markup)
+        return layout
+
+    def test_labels_match_text_paths(self):
+        surface, cairo_context = self._create_void_surface()
+        shared_path = SharedPath(self.line_string)
+        settings = [
+            ('Main Street', Alignment.CENTER, 0, True),
+            ('A1', Alignment.LEFT, 6, True),
+            ('2 km', Alignment.RIGHT, -6, False),
+        ]
+        for markup, alignment, vertical_offset, upright in settings:
+            label = shared_path.add_label(
+                self._create_layout(cairo_context, markup),
+                upright=upright
+            )
+            label.alignment = alignment
+            label.vertical_offset = vertical_offset
+        assert len(shared_path.labels) == 3
+        assert isinstance(shared_path.labels[0], UprightTextPath)
+        assert isinstance(shared_path.labels[2], TextPath)
+
+        placements = shared_path.compute_placements()
+        glyph_arrays = shared_path.compute_glyph_arrays()
+        for (markup, alignment, vertical_offset, upright), placement, \
+                arrays in zip(settings, placements, glyph_arrays):
+            text_path_class = UprightTextPath if upright else TextPath
+            text_path = text_path_class(
+                self.line_string,
+                self._create_layout(cairo_context, markup)
+            )
+            text_path.alignment = alignment
+            text_path.vertical_offset = vertical_offset
+            expected = text_path.compute_glyph_arrays()
+            assert np.allclose(arrays.positions, expected.positions)
+            assert np.allclose(arrays.rotations, expected.rotations)
+            assert placement.text == markup
+            assert len(placement.clusters) == len(expected)
+
+        shared_path.draw(cairo_context)
+
+    def test_offsets_are_computed_once(self):
+        surface, cairo_context = self._create_void_surface()
+        shared_path = SharedPath(self.line_string)
+        offset_cache = OffsetCache()
+        for markup in ['Main Street', 'A1', 'B2']:
+            label = shared_path.add_label(
+                self._create_layout(cairo_context, markup)
+            )
+            label.vertical_offset = 4
+            label.offset_cache = offset_cache
+        shared_path.compute_glyph_arrays()
+
+        # The other labels reuse the offset path, without looking it up.
+        assert offset_cache.misses == 1
+        assert offset_cache.hits == 0
+
+    def test_paths_are_shared_by_upright_labels(self):
+        surface, cairo_context = self._create_void_surface()
+        shared_path = SharedPath(self.line_string)
+        labels = [
+            shared_path.add_label(
+                self._create_layout(cairo_context, markup),
+                upright=True
+            )
+            for markup in ['Main Street', 'A1']
+        ]
+        for label in labels:
+            label.vertical_offset = 4
+            label.simplification = 0.1
+            label.compute_glyph_arrays()
+
+        # The first label computes the simplified path, and the offset paths
+        # on both sides of it, which the second label reuses.
+        assert len(shared_path._paths) == 3
+        assert labels[0]._text_path._modified_path is \
+            labels[1]._text_path._modified_path
@@ -1,16 +1,19 @@
 from typing import Tuple
 
 from cairocffi import Context, SVGSurface, Surface
+import numpy as np
 import pangocairocffi
-from pangocffi import Alignment
-from shapely.affinity import translate
+from pangocffi import Alignment, units_to_double
+from shapely.affinity import affine_transform, translate
 from shapely.geometry import LineString
 import unittest
 
-from pangocairohelpers import Side
+from pangocairohelpers import Side, Extent, instrumentation
 from pangocairohelpers.line_string_helper import \
     parallel_offset_with_matching_direction
-from pangocairohelpers.text_path import TextPath
+from pangocairohelpers.offset_cache import OffsetCache
+from pangocairohelpers.path import ArcPath, BezierPath
+from pangocairohelpers.text_path import TextPath, Truncation
 from pangocairohelpers.text_path.layout_engines import Svg
 from . import debug
 
@@ -106,6 +109,102 @@ class TestTextPath(unittest.TestCase):
 
         surface.finish()
 
+    def test_compute_baseline_path(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[0, 10], [50, 20], [100, 10]])
+        text_path = TextPath(line_string, layout)
+        text_path.alignment = Alignment.CENTER
+
+        baseline_path = text_path.compute_baseline_path()
+        assert baseline_path.to_line_string().equals_exact(
+            text_path.compute_baseline(),
+            1e-9
+        )
+
+        layout.set_markup('')
+        assert TextPath(line_string, layout).compute_baseline_path() is None
+
+    def test_coordinate_array_input_matches_line_string(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        coords = np.array([[0, 10], [50, 20], [100, 10]], dtype=float)
+        text_path_a = TextPath(LineString(coords), layout)
+        text_path_b = TextPath(coords, layout)
+        text_path_a.vertical_offset = 2
+        text_path_b.vertical_offset = 2
+        assert np.allclose(
+            text_path_a.compute_glyph_arrays().positions,
+            text_path_b.compute_glyph_arrays().positions
+        )
+        assert text_path_a.compute_baseline().equals_exact(
+            text_path_b.compute_baseline(),
+            1e-9
+        )
+
+    def test_bezier_path_input(self):
+        surface, cairo_context = self._create_real_surface(
+            'bezier_path_input.svg'
+        )
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        cairo_context.move_to(10, 80)
+        cairo_context.curve_to(30, 10, 70, 10, 90, 80)
+        path = BezierPath.from_cairo_path(cairo_context.copy_path())
+        cairo_context.new_path()
+
+        text_path = TextPath(path, layout)
+        text_path.alignment = Alignment.CENTER
+        text_path.draw(cairo_context)
+
+        assert text_path.path is path
+        glyph_arrays = text_path.compute_glyph_arrays()
+        assert len(glyph_arrays) > 0
+        assert np.all(np.diff(glyph_arrays.rotations) > 0)
+        assert isinstance(text_path.compute_baseline(), LineString)
+
+        surface.finish()
+
+    def test_closed_bezier_path_input(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        cairo_context.rectangle(10, 10, 80, 30)
+        path = BezierPath.from_cairo_path(cairo_context.copy_path())
+        cairo_context.new_path()
+        assert np.isclose(path.length, 220)
+
+        text_path = TextPath(path, layout)
+        assert len(text_path.compute_glyph_arrays()) > 0
+
+    def test_arc_path_input(self):
+        surface, cairo_context = self._create_real_surface(
+            'arc_path_input.svg'
+        )
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        path = ArcPath.circle((50, 50), 30)
+        text_path = TextPath(path, layout)
+        text_path.alignment = Alignment.CENTER
+        text_path.vertical_offset = 5
+        text_path.draw(cairo_context)
+
+        # The text is on a circle with a larger radius, without offsetting a
+        # polyline.
+        glyph_arrays = text_path.compute_glyph_arrays()
+        assert len(glyph_arrays) > 0
+        radii = np.hypot(*(glyph_arrays.positions - [50, 50]).T)
+        assert np.all(radii > 30)
+
+        surface.finish()
+
     def test_compute_boundaries(self):
         surface, cairo_context = self._create_real_surface(
             'compute_boundaries.svg'
@@ -138,6 +237,165 @@ class TestTextPath(unittest.TestCase):
 
         surface.finish()
 
+    def test_compute_bounding_extent(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[10, 30], [90, 30]])
+        text_path = TextPath(line_string, layout)
+        extent = text_path.compute_bounding_extent()
+
+        assert isinstance(extent, Extent)
+        assert extent.x >= 10
+        assert extent.y < 30
+        assert extent.x + extent.width <= 90
+
+    def test_draw_with_viewport(self):
+        surface, cairo_context = self._create_real_surface(
+            'draw_with_viewport.svg'
+        )
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[10, 30], [90, 30]])
+        text_path = TextPath(line_string, layout)
+        text_path.draw(cairo_context, viewport=Extent(0, 0, 40, 100))
+
+        line_string = LineString([[10, 50], [90, 50]])
+        text_path = TextPath(line_string, layout)
+        text_path.draw(cairo_context, viewport=Extent(200, 200, 10, 10))
+
+        cairo_context.rectangle(50, 60, 50, 40)
+        cairo_context.clip()
+        line_string = LineString([[10, 70], [90, 70]])
+        text_path = TextPath(line_string, layout)
+        text_path.draw(cairo_context, cull_to_clip_extents=True)
+
+        surface.finish()
+
+    def test_draw_is_instrumented(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[10, 50], [50, 50], [90, 90]])
+        calls = []
+        with instrumentation.recording(
+            lambda text_path, statistics: calls.append(
+                (text_path, statistics)
+            )
+        ) as recorder:
+            text_path = TextPath(line_string, layout)
+            text_path.vertical_offset = 3
+            text_path.draw(cairo_context)
+
+        assert set(recorder.stage_times.keys()) == {
+            instrumentation.SHAPING,
+            instrumentation.OFFSETTING,
+            instrumentation.PLACEMENT,
+            instrumentation.DRAWING
+        }
+        glyph_count = len(text_path.compute_glyph_arrays())
+        assert glyph_count > 0
+        assert recorder.counters[instrumentation.GLYPHS] == glyph_count
+        assert instrumentation.SHAPELY_PARALLEL_OFFSET not in \
+            recorder.counters
+        assert recorder.counters.get(instrumentation.OFFSET_CACHE_HITS, 0) + \
+            recorder.counters.get(instrumentation.OFFSET_CACHE_MISSES, 0) == 1
+
+        assert [text_path_call for text_path_call, _ in calls] == \
+            [text_path, text_path]
+        assert list(calls[0][1].stage_times.keys()) == \
+            [instrumentation.SHAPING]
+        assert calls[1][1].counters[instrumentation.GLYPHS] == glyph_count
+
+        surface.finish()
+
+    def test_append_path(self):
+        surface, cairo_context = self._create_real_surface('append_path.svg')
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[10, 50], [50, 50], [90, 90]])
+        text_path = TextPath(line_string, layout)
+        text_path.append_path(cairo_context)
+        assert len(cairo_context.copy_path()) > 0
+
+        cairo_context.set_source_rgb(1, 0, 0)
+        cairo_context.set_line_width(2)
+        cairo_context.stroke_preserve()
+        cairo_context.set_source_rgb(0, 0, 0)
+        cairo_context.fill()
+
+        text_path.append_path(
+            cairo_context,
+            viewport=Extent(200, 200, 10, 10)
+        )
+        assert len(cairo_context.copy_path()) == 0
+
+        surface.finish()
+
+    def test_compute_glyph_arrays(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        # On a straight horizontal line, each cluster starts where Pango lays
+        # it out, moved along by the start of the line and the start offset.
+        line_string = LineString([[10, 50], [410, 50]])
+        text_path = TextPath(line_string, layout)
+        text_path.start_offset = 20
+        glyph_arrays = text_path.compute_glyph_arrays()
+
+        expected_extents = []
+        layout_iter = layout.get_iter()
+        while layout_iter.get_run() is not None:
+            __, logical_extent = layout_iter.get_cluster_extents()
+            expected_extents.append([
+                units_to_double(logical_extent.x),
+                units_to_double(logical_extent.y) -
+                units_to_double(layout_iter.get_baseline()),
+                units_to_double(logical_extent.width),
+                units_to_double(logical_extent.height)
+            ])
+            layout_iter.next_cluster()
+        expected_extents = np.array(expected_extents)
+
+        assert len(glyph_arrays) == len(expected_extents) > 0
+        assert np.allclose(
+            glyph_arrays.positions[:, 0],
+            10 + 20 + expected_extents[:, 0]
+        )
+        assert np.allclose(glyph_arrays.positions[:, 1], 50)
+        assert np.allclose(glyph_arrays.rotations, 0)
+        assert np.allclose(glyph_arrays.extents[:, 0], 0)
+        assert np.allclose(
+            glyph_arrays.extents[:, 1:],
+            expected_extents[:, 1:]
+        )
+        assert np.array_equal(
+            glyph_arrays.cluster_indices,
+            np.arange(len(expected_extents))
+        )
+
+    def test_resolve_text_path(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[0, 0], [100, 0]])
+        text_path = TextPath(line_string, layout)
+        text_path.side = Side.RIGHT
+        text_path.vertical_offset = 3
+        assert text_path.resolve_text_path() is text_path
+        assert text_path.text == 'Hi from Παν語'
+        modified_path = text_path.compute_modified_path()
+        assert np.allclose(modified_path.to_coords(), [[100, 3], [0, 3]])
+        # The modified path is only computed again if its settings change
+        text_path.start_offset = 10
+        assert text_path.compute_modified_path() is modified_path
+
     def test_side(self):
         surface, cairo_context = self._create_real_surface('side.svg')
         layout = pangocairocffi.create_layout(cairo_context)
@@ -225,6 +483,65 @@ class TestTextPath(unittest.TestCase):
 
         surface.finish()
 
+    def test_truncation(self):
+        surface, cairo_context = self._create_real_surface('truncation.svg')
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_text('Very Long Street Name')
+        cluster_count = len(layout.get_text())
+
+        line_string = LineString([[10, 30], [90, 30]])
+        text_path = TextPath(line_string, layout)
+        assert text_path.truncation == Truncation.CLIP
+        text_path.truncation = Truncation.ELLIPSIS
+        glyph_arrays = text_path.compute_glyph_arrays()
+
+        # The clusters that fit are followed by the ellipsis
+        kept_indices = glyph_arrays.cluster_indices[:-1].tolist()
+        assert kept_indices == list(range(len(kept_indices)))
+        assert glyph_arrays.cluster_indices[-1] == cluster_count
+        cluster_texts = text_path.layout_clusters.get_cluster_texts()
+        assert not cluster_texts[kept_indices[-1]].isspace()
+        end = glyph_arrays.positions[-1, 0] + glyph_arrays.extents[-1, 2]
+        assert end <= 90 + 1e-6
+        assert not text_path.text_fits()
+
+        placement = text_path.compute_placement()
+        assert placement.text == 'Very Long Street Name\u2026'
+        ellipsis_cluster = placement.clusters[-1]
+        assert placement.text.encode('utf-8')[
+            ellipsis_cluster.start_index:ellipsis_cluster.end_index
+        ].decode('utf-8') == '\u2026'
+
+        text_path.draw(cairo_context)
+        debug.draw_line_string(cairo_context, line_string)
+        cairo_context.stroke()
+
+        line_string = translate(line_string, 0, 25)
+        text_path = TextPath(line_string, layout)
+        text_path.truncation = Truncation.ELLIPSIS
+        text_path.alignment = Alignment.CENTER
+        glyph_arrays = text_path.compute_glyph_arrays()
+        assert glyph_arrays.positions[0, 0] >= 10 - 1e-6
+        assert glyph_arrays.positions[-1, 0] + \
+            glyph_arrays.extents[-1, 2] <= 90 + 1e-6
+        text_path.draw(cairo_context)
+        debug.draw_line_string(cairo_context, line_string)
+        cairo_context.stroke()
+
+        surface.finish()
+
+    def test_truncation_when_text_fits(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_text('Street')
+
+        line_string = LineString([[0, 0], [600, 0]])
+        text_path = TextPath(line_string, layout)
+        text_path.truncation = Truncation.ELLIPSIS
+        assert text_path.text_fits()
+        glyph_arrays = text_path.compute_glyph_arrays()
+        assert glyph_arrays.cluster_indices.tolist() == list(range(6))
+
     def test_vertical_offset_works(self):
         surface, cairo_context = self._create_real_surface(
             'vertical_offset_works.svg'
@@ -253,6 +570,119 @@ class TestTextPath(unittest.TestCase):
 
         surface.finish()
 
+    def test_vertical_offset_on_gentle_turns(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        # Shapely's offset of this line does not start with the same angle as
+        # the line, so its direction could not be established.
+        line_string = LineString([[0, 10], [50, 20], [100, 10]])
+        for vertical_offset in [-3, 3]:
+            text_path = TextPath(line_string, layout)
+            text_path.vertical_offset = vertical_offset
+            glyph_arrays = text_path.compute_glyph_arrays()
+            assert len(glyph_arrays) > 0
+            assert glyph_arrays.positions[0, 0] < glyph_arrays.positions[-1, 0]
+
+    def test_settings_changed_after_placement(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[5, 40], [95, 40]])
+        text_path = TextPath(line_string, layout)
+        positions = text_path.compute_glyph_arrays().positions
+        assert np.allclose(positions[:, 1], 40)
+
+        text_path.vertical_offset = 4
+        positions = text_path.compute_glyph_arrays().positions
+        assert np.allclose(positions[:, 1], 36)
+
+        text_path.start_offset = 10
+        shifted_positions = text_path.compute_glyph_arrays().positions
+        assert np.allclose(shifted_positions[:, 0], positions[:, 0] + 10)
+
+    def test_vertical_offsets_are_cached(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[5, 40], [45, 40], [90, 80]])
+        offset_cache = OffsetCache()
+        for _ in range(3):
+            text_path = TextPath(line_string, layout)
+            text_path.offset_cache = offset_cache
+            text_path.vertical_offset = 4
+            text_path.compute_glyph_arrays()
+
+        assert offset_cache.misses == 1
+        assert offset_cache.hits == 2
+        assert len(offset_cache) == 1
+
+    def test_transform(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        world_line_string = LineString([[1, 10], [10, 10], [19, 20]])
+        offset_cache = OffsetCache()
+        for transform in [
+            (5, 0, 0, 5, 0, -40),
+            (0, -5, 5, 0, 100, 0),
+            (5, 0, 0, -5, 0, 100),
+            (5, 1, 0, 4, 0, -40)
+        ]:
+            text_path = TextPath(world_line_string, layout)
+            text_path.transform = transform
+            text_path.vertical_offset = 4
+            text_path.offset_cache = offset_cache
+            glyph_arrays = text_path.compute_glyph_arrays()
+
+            expected_text_path = TextPath(
+                affine_transform(world_line_string, transform),
+                layout
+            )
+            expected_text_path.vertical_offset = 4
+            expected_glyph_arrays = expected_text_path.compute_glyph_arrays()
+
+            assert np.allclose(
+                glyph_arrays.positions,
+                expected_glyph_arrays.positions,
+                atol=1e-2
+            )
+            assert np.allclose(
+                np.cos(glyph_arrays.rotations),
+                np.cos(expected_glyph_arrays.rotations),
+                atol=1e-3
+            )
+
+        # The offset of the world line string is shared by the similarities
+        # with the same scale, while reflections offset it to the other side.
+        assert offset_cache.hits == 1
+        assert offset_cache.misses == 3
+
+    def test_simplification(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        # A line with a small zigzag at every unit
+        coords = np.column_stack((
+            np.arange(101, dtype=float),
+            50 + np.tile([0, 0.2], 51)[:101]
+        ))
+        text_path = TextPath(coords, layout)
+        assert text_path.simplification == 0
+        rotations = text_path.compute_glyph_arrays().rotations
+        assert not np.allclose(rotations, 0)
+
+        text_path = TextPath(coords, layout)
+        text_path.simplification = 0.1
+        assert isinstance(text_path.simplification, float)
+        rotations = text_path.compute_glyph_arrays().rotations
+        assert np.allclose(rotations, 0, atol=1e-2)
+
     def test_vertical_offset_fails_on_uncertain_direction(self):
         surface, cairo_context = self._create_void_surface()
         layout = pangocairocffi.create_layout(cairo_context)
@@ -265,6 +695,22 @@ class TestTextPath(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             text_path.draw(cairo_context)
 
+    def test_vertical_offset_fails_on_self_intersecting_offset(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        # The offset into the hook breaks into several parts
+        line_string = LineString(
+            [[0, 0], [20, 0], [20, 10], [14, 10], [14, 1]]
+        )
+        text_path = TextPath(line_string, layout)
+        text_path.offset_cache = OffsetCache()
+        text_path.vertical_offset = -2.5
+
+        with self.assertRaises(RuntimeError):
+            text_path.draw(cairo_context)
+
     def test_vertical_offset_fails_on_invalid_offset_shape(self):
         surface, cairo_context = self._create_void_surface()
         layout = pangocairocffi.create_layout(cairo_context)
@@ -0,0 +1,87 @@
+import itertools
+from typing import Tuple
+
+from cairocffi import Context, SVGSurface, Surface
+import numpy as np
+import pangocairocffi
+from pangocffi import Alignment
+from shapely.geometry import LineString
+import unittest
+
+from pangocairohelpers.offset_cache import OffsetCache
+from pangocairohelpers.text_path import TextPath, TextPathAnimation, \
+    UprightTextPath
+
+
+class TestTextPathAnimation(unittest.TestCase):
+
+    line_string = LineString([[10, 50], [50, 50], [90, 90], [190, 90]])
+
+    def _create_void_surface(self) -> Tuple[Surface, Context]:
+        surface = SVGSurface(None, 200, 100)
+        cairo_context = Context(surface)
+        return surface, cairo_context
+
+    def test_frames_match_text_path(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        text_path = TextPath(self.line_string, layout)
+        text_path.alignment = Alignment.CENTER
+        text_path.vertical_offset = 3
+        animation = TextPathAnimation(text_path)
+
+        start_offsets = [-40, -10, 0, 25, 60]
+        frames = animation.generate_frames(start_offsets)
+        for start_offset, glyph_arrays in zip(start_offsets, frames):
+            text_path.start_offset = start_offset
+            expected = text_path.compute_glyph_arrays()
+            assert np.allclose(glyph_arrays.positions, expected.positions)
+            assert np.allclose(glyph_arrays.rotations, expected.rotations)
+            assert np.array_equal(
+                glyph_arrays.cluster_indices,
+                expected.cluster_indices
+            )
+
+    def test_path_is_offset_once(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        offset_cache = OffsetCache()
+        text_path = TextPath(self.line_string, layout)
+        text_path.offset_cache = offset_cache
+        text_path.vertical_offset = 3
+        animation = TextPathAnimation(text_path)
+
+        # Frames are generated lazily, so animations can be endless.
+        frames = animation.generate_frames(itertools.count(0, 0.5))
+        for glyph_arrays in itertools.islice(frames, 100):
+            assert len(glyph_arrays) > 0
+        assert offset_cache.misses == 1
+        assert offset_cache.hits == 0
+
+    def test_upright_text_path(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[190, 50], [10, 50]])
+        animation = TextPathAnimation(UprightTextPath(line_string, layout))
+        glyph_arrays = animation.compute_glyph_arrays(10)
+        # The text is not upside down
+        assert np.allclose(glyph_arrays.rotations, 0)
+
+        with self.assertRaises(TypeError):
+            TextPathAnimation(None)
+
+    def test_draw(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        animation = TextPathAnimation(TextPath(self.line_string, layout))
+        for glyph_arrays in animation.generate_frames(range(0, 100, 10)):
+            animation.draw(cairo_context, glyph_arrays)
+        surface.finish()
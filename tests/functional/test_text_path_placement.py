@@ -0,0 +1,86 @@
+import json
+import pickle
+import unittest
+
+from cairocffi import Context, SVGSurface, Matrix
+import pangocairocffi
+from shapely.geometry import LineString
+
+from pangocairohelpers.text_path import TextPath, TextPathPlacement, \
+    UprightTextPath
+
+
+class TestTextPathPlacement(unittest.TestCase):
+
+    def test_compute_placement(self):
+        surface = SVGSurface(None, 100, 100)
+        cairo_context = Context(surface)
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from <b>Παν語</b>')
+
+        line_string = LineString([[10, 50], [50, 50], [90, 90]])
+        text_path = TextPath(line_string, layout)
+        placement = text_path.compute_placement()
+
+        assert placement.text == 'Hi from Παν語'
+        assert len(placement.fonts) >= 2
+        assert len(placement.clusters) > 0
+        assert placement.clusters[0].cluster_index == 0
+        assert placement.clusters[0].start_index == 0
+        assert placement.clusters[0].end_index == 1
+        assert placement.compute_bounding_extent() is not None
+
+        upright_placement = UprightTextPath(line_string, layout)\
+            .compute_placement()
+        assert len(upright_placement.clusters) > 0
+
+    def test_draw(self):
+        surface = SVGSurface('tests/output/text_path_placement.svg', 200, 100)
+        cairo_context = Context(surface)
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        line_string = LineString([[10, 50], [50, 50], [90, 90]])
+        text_path = TextPath(line_string, layout)
+        placement = text_path.compute_placement()
+
+        data = json.dumps(placement.to_dict())
+        restored_placement = TextPathPlacement.from_dict(json.loads(data))
+        restored_placement.draw(cairo_context)
+
+        pickled_placement = pickle.loads(pickle.dumps(placement))
+        font_cache = {}
+        pickled_placement.draw(cairo_context, Matrix(x0=100), font_cache)
+        assert sorted(font_cache.keys()) == sorted(placement.fonts)
+
+        surface.finish()
+
+    def test_transformed(self):
+        surface = SVGSurface(None, 100, 100)
+        cairo_context = Context(surface)
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from <b>Παν語</b>')
+
+        line_string = LineString([[10, 50], [50, 50], [90, 90]])
+        placement = TextPath(line_string, layout).compute_placement()
+        transformed_placement = placement.transformed((2, 0, 0, 2, 0, -50))
+
+        for font, transformed_font in zip(
+                placement.fonts,
+                transformed_placement.fonts
+        ):
+            # Descriptions end in the size of the font
+            family, size = font.rsplit(' ', 1)
+            transformed_family, transformed_size = \
+                transformed_font.rsplit(' ', 1)
+            assert transformed_family == family
+            assert float(transformed_size) == float(size) * 2
+
+        cluster = placement.clusters[1]
+        transformed_cluster = transformed_placement.clusters[1]
+        assert transformed_cluster.x == cluster.x * 2
+        assert transformed_cluster.y == cluster.y * 2 - 50
+        assert transformed_cluster.logical_extent.width == \
+            cluster.logical_extent.width * 2
+
+        transformed_placement.draw(cairo_context)
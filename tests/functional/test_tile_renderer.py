@@ -0,0 +1,76 @@
+from pangocffi import Alignment
+
+from pangocairohelpers import TileRenderer
+from pangocairohelpers.text_path import LabelSpec
+from pangocairohelpers.text_path.batch_placement import compute_placement
+
+
+def _create_placements():
+    return [
+        compute_placement(LabelSpec(
+            'Label %d' % i,
+            'Sans 10',
+            [(10 + i * 30, 20 + i * 25), (110 + i * 30, 40 + i * 25)],
+            alignment=Alignment.CENTER
+        ))
+        for i in range(8)
+    ]
+
+
+def test_placements_are_indexed_by_tile():
+    placements = _create_placements()
+    renderer = TileRenderer(placements + [None], tile_size=64)
+
+    tiles = renderer.get_tiles()
+    assert len(tiles) > 1
+    assert (0, 0) in tiles
+    assert placements[0] in renderer.get_placements((0, 0))
+    assert placements[-1] not in renderer.get_placements((0, 0))
+    assert renderer.get_placements((100, 100)) == []
+    for placement in placements:
+        assert any(
+            placement in renderer.get_placements(tile) for tile in tiles
+        )
+
+
+def test_render_tiles_matches_render_tile():
+    placements = _create_placements()
+    renderer = TileRenderer(placements, tile_size=64, max_workers=4)
+
+    rendered = list(renderer.render_tiles())
+    assert [tile for tile, _ in rendered] == renderer.get_tiles()
+    for tile, surface in rendered:
+        assert surface.get_width() == 64
+        assert surface.get_height() == 64
+        expected = renderer.render_tile(tile)
+        assert bytes(surface.get_data()) == bytes(expected.get_data())
+
+    assert any(
+        any(bytes(surface.get_data())) for _, surface in rendered
+    )
+    surface.write_to_png('tests/output/tile_renderer.png')
+
+
+def test_render_tiles_reads_tiles_as_they_are_consumed():
+    renderer = TileRenderer(_create_placements(), tile_size=64, max_workers=2)
+    tiles = renderer.get_tiles()
+    read_tiles = []
+
+    def read(tiles):
+        for tile in tiles:
+            read_tiles.append(tile)
+            yield tile
+
+    rendered = renderer.render_tiles(read(tiles), max_pending_tiles=2)
+    assert next(rendered)[0] == tiles[0]
+    assert len(read_tiles) == 2
+    assert next(rendered)[0] == tiles[1]
+    assert len(read_tiles) == 3
+    assert [tile for tile, _ in rendered] == tiles[2:]
+    assert read_tiles == tiles
+
+
+def test_render_empty_tile():
+    renderer = TileRenderer(_create_placements(), tile_size=64)
+    surface = renderer.render_tile((-10, -10))
+    assert not any(bytes(surface.get_data()))
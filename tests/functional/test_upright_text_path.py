@@ -8,7 +8,7 @@ from shapely.geometry import LineString
 import unittest
 
 from pangocairohelpers import Side
-from pangocairohelpers.text_path import UprightTextPath
+from pangocairohelpers.text_path import TextPath, UprightTextPath
 from . import debug
 
 
@@ -48,6 +48,19 @@ class TestUprightTextPath(unittest.TestCase):
         text_path = UprightTextPath(line_string, layout)
         assert not text_path.text_fits()
 
+    def test_resolve_text_path(self):
+        surface, cairo_context = self._create_void_surface()
+        layout = pangocairocffi.create_layout(cairo_context)
+        layout.set_markup('Hi from Παν語')
+
+        # The text would be upside down on the left side of this path
+        line_string = LineString([[100, 50], [0, 50]])
+        text_path = UprightTextPath(line_string, layout)
+        resolved_text_path = text_path.resolve_text_path()
+        assert isinstance(resolved_text_path, TextPath)
+        assert resolved_text_path.side == Side.RIGHT
+        assert resolved_text_path.text == text_path.text
+
     def test_compute_baseline(self):
         surface, cairo_context = self._create_real_surface(
             'upright_text_path_compute_baseline.svg'
@@ -0,0 +1,93 @@
+from benchmarks import baselines, harness
+from benchmarks.harness import Benchmark, BenchmarkResult
+
+
+def _result(
+        seconds_per_call: float,
+        peak_memory: int,
+        retained_blocks: int = 0
+) -> BenchmarkResult:
+    benchmark = Benchmark('example', lambda: (lambda: None, 1))
+    return BenchmarkResult(
+        benchmark,
+        1,
+        seconds_per_call,
+        1,
+        peak_memory,
+        retained_blocks
+    )
+
+
+def test_compare_within_tolerance():
+    baseline = {'relative_time': 10, 'peak_memory': 100000}
+    result = _result(0.019, 120000)
+    assert baselines.compare(result, baseline, 0.001, 1.0, 0.25) == []
+
+
+def test_compare_detects_slowdown():
+    baseline = {'relative_time': 10, 'peak_memory': 100000}
+    result = _result(0.021, 100000)
+    regressions = baselines.compare(result, baseline, 0.001, 1.0, 0.25)
+    assert len(regressions) == 1
+    assert 'as long as its baseline' in regressions[0]
+
+
+def test_compare_detects_memory_growth():
+    baseline = {'relative_time': 10, 'peak_memory': 100000}
+    result = _result(0.01, 130000)
+    regressions = baselines.compare(result, baseline, 0.001, 1.0, 0.25)
+    assert len(regressions) == 1
+    assert 'allocates' in regressions[0]
+
+
+def test_compare_uses_tolerance_of_baseline():
+    baseline = {
+        'relative_time': 10,
+        'peak_memory': 100000,
+        'time_tolerance': 3.0
+    }
+    result = _result(0.03, 100000)
+    assert baselines.compare(result, baseline, 0.001, 1.0, 0.25) == []
+
+
+def test_save_and_load_baselines(tmpdir):
+    path = str(tmpdir.join('baselines.json'))
+    assert baselines.load_baselines(path) == {}
+    baselines.save_baselines([_result(0.02, 2048, 300)], 0.001, path)
+    loaded = baselines.load_baselines(path)
+    assert loaded['example']['peak_memory'] == 2048
+    assert loaded['example']['retained_blocks'] == 300
+    assert abs(loaded['example']['relative_time'] - 20) < 1e-9
+
+
+def test_compare_detects_retained_block_growth():
+    baseline = {
+        'relative_time': 10,
+        'peak_memory': 100000,
+        'retained_blocks': 1000
+    }
+    assert baselines.compare(
+        _result(0.01, 100000, 1200),
+        baseline,
+        0.001,
+        1.0,
+        0.25
+    ) == []
+    regressions = baselines.compare(
+        _result(0.01, 100000, 1300),
+        baseline,
+        0.001,
+        1.0,
+        0.25
+    )
+    assert len(regressions) == 1
+    assert 'blocks allocated' in regressions[0]
+
+
+def test_measure_memory_counts_retained_blocks():
+    def allocate():
+        return [object() for _ in range(1000)]
+
+    peak_memory, retained_blocks = harness.measure_memory(allocate)
+    assert peak_memory > 0
+    assert 1000 <= retained_blocks < 1100
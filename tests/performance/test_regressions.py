@@ -0,0 +1,64 @@
+"""
+    Compares the regression benchmarks against the baselines stored in
+    ``benchmarks/baselines.json``.
+
+    Timings are too noisy on shared CI machines, so these tests are skipped
+    when the ``CI`` environment variable is set. The tolerances can be
+    changed with the ``PANGOCAIROHELPERS_TIME_TOLERANCE`` and
+    ``PANGOCAIROHELPERS_MEMORY_TOLERANCE`` environment variables.
+"""
+import os
+
+import pytest
+
+from benchmarks import baselines, harness
+from benchmarks.suite import get_benchmarks, REGRESSION_BENCHMARKS
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get('CI') is not None,
+    reason='timings are not reliable on CI machines'
+)
+
+MIN_TIME = 0.1
+REPEAT = 3
+
+
+@pytest.fixture(scope='module')
+def calibration_time():
+    return baselines.measure_calibration_time(MIN_TIME, REPEAT)
+
+
+@pytest.fixture(scope='module')
+def stored_baselines():
+    return baselines.load_baselines()
+
+
+@pytest.mark.parametrize(
+    "benchmark",
+    [
+        benchmark for benchmark in get_benchmarks()
+        if benchmark.name in REGRESSION_BENCHMARKS
+    ],
+    ids=lambda benchmark: benchmark.name
+)
+def test_no_regression(benchmark, calibration_time, stored_baselines):
+    # A missing baseline fails, so that the gate cannot pass without
+    # protecting every entry point it lists.
+    assert benchmark.name in stored_baselines, \
+        'no baseline is stored for %s, record one with ' \
+        '"make benchmark-baselines"' % benchmark.name
+    result = harness.run([benchmark], MIN_TIME, REPEAT)[0]
+    regressions = baselines.compare(
+        result,
+        stored_baselines[benchmark.name],
+        calibration_time,
+        baselines.get_tolerance(
+            'PANGOCAIROHELPERS_TIME_TOLERANCE',
+            baselines.DEFAULT_TIME_TOLERANCE
+        ),
+        baselines.get_tolerance(
+            'PANGOCAIROHELPERS_MEMORY_TOLERANCE',
+            baselines.DEFAULT_MEMORY_TOLERANCE
+        )
+    )
+    assert regressions == []
@@ -0,0 +1,94 @@
+import math
+import unittest
+
+import numpy as np
+from shapely.geometry import LineString, Point
+
+from pangocairohelpers import polyline_helper
+from pangocairohelpers.path import ArcPath
+
+
+class TestArcPath(unittest.TestCase):
+
+    def test_clockwise_arc(self):
+        path = ArcPath((10, 20), 5, 0, math.pi / 2)
+        assert math.isclose(path.length, 5 * math.pi / 2)
+        positions = path.interpolate([0, path.length / 2, path.length])
+        assert np.allclose(positions, [
+            [15, 20],
+            [10 + 5 / math.sqrt(2), 20 + 5 / math.sqrt(2)],
+            [10, 25]
+        ])
+        angles = path.angles_at([0, path.length])
+        assert np.allclose(angles, [math.pi / 2, math.pi])
+
+    def test_anticlockwise_arc(self):
+        path = ArcPath((0, 0), 5, 0, -math.pi / 2)
+        assert math.isclose(path.sweep, -math.pi / 2)
+        assert math.isclose(path.length, 5 * math.pi / 2)
+        assert np.allclose(path.interpolate([path.length]), [[0, -5]])
+        assert np.allclose(path.angles_at([0]), [-math.pi / 2])
+
+    def test_offsets_are_clamped(self):
+        path = ArcPath((0, 0), 5, 0, math.pi)
+        assert np.allclose(
+            path.interpolate([-1, path.length + 1]),
+            [[5, 0], [-5, 0]]
+        )
+
+    def test_circle(self):
+        path = ArcPath.circle((0, 0), 10)
+        assert math.isclose(path.length, 20 * math.pi)
+        assert np.allclose(path.interpolate([0]), [[0, -10]])
+        assert np.allclose(path.angles_at([0]), [0])
+
+        path = ArcPath.circle((0, 0), 10, clockwise=False)
+        angle = path.angles_at([0])[0]
+        assert np.isclose(math.cos(angle), -1)
+
+    def test_invalid_radius(self):
+        with self.assertRaises(ValueError):
+            ArcPath((0, 0), 0, 0, math.pi)
+
+    def test_project(self):
+        path = ArcPath((0, 0), 10, 0, math.pi)
+        assert math.isclose(path.project([5, 5]), 10 * math.pi / 4)
+        assert math.isclose(path.project([-3, 8]), 10 * math.atan2(8, -3))
+        # Points beyond the ends project onto the nearest end
+        assert path.project([20, -1]) == 0
+        assert path.project([1, -20]) == 0
+        assert path.project([-20, -1]) == path.length
+
+        line_string = LineString(path.to_coords())
+        assert math.isclose(
+            path.project([-8, 6]),
+            line_string.project(Point(-8, 6)),
+            rel_tol=1e-3
+        )
+
+    def test_reversed(self):
+        path = ArcPath((0, 0), 10, 0, math.pi / 2).reversed()
+        assert np.allclose(path.interpolate([0]), [[0, 10]])
+        assert np.allclose(path.angles_at([0]), [0])
+
+    def test_substring(self):
+        path = ArcPath((0, 0), 10, -math.pi, math.pi)
+        substring = path.substring(10 * math.pi / 2, 10 * math.pi)
+        assert math.isclose(substring.start_angle, -math.pi / 2)
+        assert math.isclose(substring.end_angle, 0)
+
+    def test_offset(self):
+        path = ArcPath((0, 0), 10, 0, math.pi)
+        assert path.offset(3).radius == 13
+        assert path.offset(-3).radius == 7
+        assert path.reversed().offset(3).radius == 7
+        assert path.offset(-10) is None
+
+        # The offset matches the offset of the polyline
+        offset_coords = polyline_helper.parallel_offset(path.to_coords(), 3)
+        assert np.allclose(np.hypot(*offset_coords.T), 13, atol=0.02)
+
+    def test_to_coords(self):
+        coords = ArcPath((0, 0), 10, 0, math.pi, resolution=4).to_coords()
+        assert len(coords) == 9
+        assert np.allclose(np.hypot(coords[:, 0], coords[:, 1]), 10)
@@ -0,0 +1,164 @@
+import math
+import unittest
+
+import numpy as np
+
+from pangocairohelpers.path import BezierPath, PolylinePath
+
+# The distance of the control points of a cubic curve approximating a
+# quarter of a unit circle
+KAPPA = 0.5522847498
+
+
+class TestBezierPath(unittest.TestCase):
+
+    quarter_circle = [
+        [100, 0],
+        [100, KAPPA * 100],
+        [KAPPA * 100, 100],
+        [0, 100]
+    ]
+
+    def test_lines_match_polyline(self):
+        coords = [[0, 0], [10, 0], [10, 10]]
+        path = BezierPath([coords[0:2], coords[1:3]])
+        polyline_path = PolylinePath(coords)
+        offsets = np.linspace(0, 20, 11)
+        assert math.isclose(path.length, 20)
+        assert np.allclose(
+            path.interpolate(offsets),
+            polyline_path.interpolate(offsets)
+        )
+        assert np.allclose(path.angles_at([1, 19]), [0, math.pi / 2])
+
+    def test_curves_are_evaluated_exactly(self):
+        path = BezierPath([self.quarter_circle])
+        assert math.isclose(path.length, math.pi * 50, rel_tol=1e-3)
+
+        offsets = np.linspace(0, path.length, 9)
+        positions = path.interpolate(offsets)
+        radii = np.hypot(positions[:, 0], positions[:, 1])
+        assert np.allclose(radii, 100, atol=0.03)
+
+        # The tangent of a circle is perpendicular to its radius
+        angles = path.angles_at(offsets)
+        position_angles = np.arctan2(positions[:, 1], positions[:, 0])
+        assert np.allclose(angles, position_angles + math.pi / 2, atol=2e-3)
+
+    def test_more_samples_are_more_accurate(self):
+        coarse_path = BezierPath([self.quarter_circle], samples_per_curve=2)
+        fine_path = BezierPath([self.quarter_circle], samples_per_curve=64)
+        assert len(coarse_path.to_coords()) == 3
+        assert len(fine_path.to_coords()) == 65
+        expected_length = 157.0796
+        assert abs(fine_path.length - expected_length) < \
+            abs(coarse_path.length - expected_length)
+
+    def test_quadratic_curves(self):
+        path = BezierPath([[[0, 0], [5, 10], [10, 0]]])
+        assert np.allclose(path.interpolate([path.length / 2]), [[5, 5]])
+        assert np.isclose(path.angles_at([0])[0], math.atan2(10, 5))
+
+    def test_stationary_control_points(self):
+        path = BezierPath([[[0, 0], [0, 0], [10, 0], [10, 0]]])
+        assert np.allclose(path.angles_at([0, path.length]), [0, 0])
+
+    def test_invalid_curves(self):
+        with self.assertRaises(ValueError):
+            BezierPath([])
+        with self.assertRaises(ValueError):
+            BezierPath([[[0, 0]]])
+        with self.assertRaises(ValueError):
+            BezierPath([[[0, 0], [1, 1], [2, 2], [3, 3], [4, 4]]])
+
+    def test_from_cairo_path(self):
+        path = BezierPath.from_cairo_path([
+            (0, (0, 0)),
+            (1, (10, 0)),
+            (2, (20, 0, 20, 10, 10, 10)),
+            (3, ()),
+        ])
+        assert len(path.curves) == 3
+        assert np.allclose(
+            path.interpolate([0, 5, path.length]),
+            [[0, 0], [5, 0], [0, 0]]
+        )
+
+        with self.assertRaises(ValueError):
+            BezierPath.from_cairo_path([
+                (0, (0, 0)),
+                (1, (10, 0)),
+                (0, (0, 10)),
+                (1, (10, 10)),
+            ])
+
+    def test_from_closed_cairo_path(self):
+        # The result of ``copy_path()`` after ``rectangle(0, 0, 10, 10)``,
+        # which moves back to the start after closing the path.
+        rectangle = [
+            (0, (0, 0)),
+            (1, (10, 0)),
+            (1, (10, 10)),
+            (1, (0, 10)),
+            (3, ()),
+            (0, (0, 0)),
+        ]
+        path = BezierPath.from_cairo_path(rectangle)
+        assert len(path.curves) == 4
+        assert math.isclose(path.length, 40)
+        assert np.allclose(path.interpolate([35]), [[0, 5]])
+
+        # A move to at the end does not start a sub-path
+        path = BezierPath.from_cairo_path([
+            (0, (0, 0)),
+            (1, (10, 0)),
+            (0, (50, 50)),
+        ])
+        assert len(path.curves) == 1
+
+        # Nor does drawing on from the start of a closed path
+        path = BezierPath.from_cairo_path(rectangle + [(1, (0, -10))])
+        assert len(path.curves) == 5
+
+        # Moving elsewhere after closing the path starts a sub-path
+        with self.assertRaises(ValueError):
+            BezierPath.from_cairo_path(rectangle[:-1] + [
+                (0, (5, 5)),
+                (1, (10, 10)),
+            ])
+
+    def test_project(self):
+        path = BezierPath([self.quarter_circle])
+        assert math.isclose(path.project(np.array([80, 80])), path.length / 2)
+
+    def test_reversed(self):
+        path = BezierPath([self.quarter_circle])
+        reversed_path = path.reversed()
+        assert math.isclose(reversed_path.length, path.length)
+        assert np.allclose(reversed_path.interpolate([0]), [[0, 100]])
+
+    def test_substring(self):
+        path = BezierPath([self.quarter_circle, [[0, 100], [-50, 100]]])
+        substring = path.substring(10, 170)
+        assert len(substring.curves) == 2
+        assert math.isclose(substring.length, 160, rel_tol=1e-3)
+        assert np.allclose(
+            substring.interpolate([0, substring.length]),
+            path.interpolate([10, 170]),
+            atol=1e-2
+        )
+
+        substring = path.substring(10, 100)
+        assert len(substring.curves) == 1
+        assert np.allclose(
+            substring.interpolate([0, substring.length]),
+            path.interpolate([10, 100]),
+            atol=1e-2
+        )
+
+    def test_substring_ending_between_curves(self):
+        path = BezierPath([[[0, 0], [0, 10]], [[0, 10], [10, 10]]])
+        substring = path.substring(2, 10)
+        assert len(substring.curves) == 1
+        assert math.isclose(substring.length, 8)
+        assert np.allclose(substring.angles_at([8]), [math.pi / 2])
@@ -0,0 +1,29 @@
+from pangocairohelpers import Extent, CollisionIndex
+
+
+def test_intersects():
+    index = CollisionIndex(cell_size=10)
+    assert len(index) == 0
+    assert not index.intersects(Extent(0, 0, 5, 5))
+
+    index.insert(Extent(0, 0, 25, 5))
+    assert len(index) == 1
+    assert index.intersects(Extent(20, 2, 1, 1))
+    assert index.intersects(Extent(-5, -5, 5, 5))
+    assert not index.intersects(Extent(26, 0, 5, 5))
+    assert not index.intersects(Extent(0, 6, 40, 5))
+
+
+def test_negative_coordinates():
+    index = CollisionIndex(cell_size=10)
+    index.insert(Extent(-35, -35, 10, 10))
+    assert index.intersects(Extent(-30, -30, 1, 1))
+    assert not index.intersects(Extent(30, 30, 1, 1))
+
+
+def test_clear():
+    index = CollisionIndex()
+    index.insert(Extent(0, 0, 5, 5))
+    index.clear()
+    assert len(index) == 0
+    assert not index.intersects(Extent(0, 0, 5, 5))
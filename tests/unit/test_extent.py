@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from pangocairohelpers import Extent
@@ -11,3 +12,37 @@ class TestExtent(unittest.TestCase):
         assert extent.y == 20
         assert extent.width == 30
         assert extent.height == 40
+
+    def test_intersects(self):
+        extent = Extent(0, 0, 10, 10)
+        assert extent.intersects(Extent(5, 5, 10, 10))
+        assert extent.intersects(Extent(10, 10, 10, 10))
+        assert extent.intersects(Extent(2, 2, 1, 1))
+        assert not extent.intersects(Extent(11, 0, 10, 10))
+        assert not extent.intersects(Extent(0, -11, 10, 10))
+
+    def test_union(self):
+        extent = Extent(0, 0, 10, 10).union(Extent(5, -5, 10, 10))
+        assert extent.x == 0
+        assert extent.y == -5
+        assert extent.width == 15
+        assert extent.height == 15
+
+        extent = Extent(1, 2, 3, 4).union(None)
+        assert (extent.x, extent.y, extent.width, extent.height) == \
+            (1, 2, 3, 4)
+
+    def test_is_immutable(self):
+        extent = Extent(10, 20, 30, 40)
+        with self.assertRaises(AttributeError):
+            extent.x = 5
+        with self.assertRaises(AttributeError):
+            extent.foo = 5
+        assert not hasattr(extent, '__dict__')
+
+    def test_equality_and_pickle(self):
+        extent = Extent(10, 20, 30, 40)
+        assert extent == Extent(10, 20, 30, 40)
+        assert extent != Extent(10, 20, 30, 41)
+        assert hash(extent) == hash(Extent(10, 20, 30, 40))
+        assert pickle.loads(pickle.dumps(extent)) == extent
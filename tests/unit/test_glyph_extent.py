@@ -1,6 +1,7 @@
+import pickle
 import unittest
 
-from pangocairohelpers import GlyphExtent
+from pangocairohelpers import GlyphExtent, Extent
 
 
 class TestGlyphExtent(unittest.TestCase):
@@ -12,3 +13,16 @@ class TestGlyphExtent(unittest.TestCase):
         assert glyph_extent.width == 30
         assert glyph_extent.height == 40
         assert glyph_extent.baseline == 50
+
+    def test_is_immutable(self):
+        glyph_extent = GlyphExtent(10, 20, 30, 40, 50)
+        with self.assertRaises(AttributeError):
+            glyph_extent.baseline = 5
+        assert not hasattr(glyph_extent, '__dict__')
+
+    def test_equality_and_pickle(self):
+        glyph_extent = GlyphExtent(10, 20, 30, 40, 50)
+        assert glyph_extent == GlyphExtent(10, 20, 30, 40, 50)
+        assert glyph_extent != GlyphExtent(10, 20, 30, 40, 51)
+        assert glyph_extent != Extent(10, 20, 30, 40)
+        assert pickle.loads(pickle.dumps(glyph_extent)) == glyph_extent
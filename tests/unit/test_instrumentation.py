@@ -0,0 +1,78 @@
+import threading
+
+from pangocairohelpers import instrumentation
+
+
+class _TextPath:
+
+    @instrumentation.text_path_method
+    def run(self, inner=None):
+        instrumentation.count('calls')
+        with instrumentation.stage('stage'):
+            pass
+        if inner is not None:
+            inner.run()
+        return 'result'
+
+
+def test_disabled_by_default():
+    assert instrumentation.get_recorder() is None
+    instrumentation.count('calls')
+    with instrumentation.stage('stage'):
+        pass
+    assert _TextPath().run() == 'result'
+
+
+def test_recording():
+    with instrumentation.recording() as recorder:
+        assert instrumentation.get_recorder() is recorder
+        instrumentation.count('calls')
+        instrumentation.count('calls', 2)
+        with instrumentation.stage('stage'):
+            pass
+    assert instrumentation.get_recorder() is None
+    assert recorder.counters == {'calls': 3}
+    assert list(recorder.stage_times.keys()) == ['stage']
+    assert recorder.stage_times['stage'] >= 0
+
+
+def test_recording_is_restored_after_nested_recording():
+    with instrumentation.recording() as outer:
+        with instrumentation.recording() as inner:
+            instrumentation.count('calls')
+        instrumentation.count('calls')
+    assert inner.counters == {'calls': 1}
+    assert outer.counters == {'calls': 1}
+
+
+def test_callback_receives_statistics_of_each_text_path():
+    calls = []
+    text_path_a = _TextPath()
+    text_path_b = _TextPath()
+    with instrumentation.recording(
+        lambda text_path, statistics: calls.append((text_path, statistics))
+    ) as recorder:
+        assert text_path_a.run(inner=text_path_b) == 'result'
+        text_path_b.run()
+
+    assert len(calls) == 2
+    # Calls made by a text path to another are attributed to the outer one
+    assert calls[0][0] is text_path_a
+    assert calls[0][1].counters == {'calls': 2}
+    assert calls[1][0] is text_path_b
+    assert calls[1][1].counters == {'calls': 1}
+    assert recorder.counters == {'calls': 3}
+
+
+def test_recorder_is_shared_by_threads():
+    def run():
+        for _ in range(1000):
+            instrumentation.count('calls')
+
+    with instrumentation.recording() as recorder:
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert recorder.counters == {'calls': 4000}
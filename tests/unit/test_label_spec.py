@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+from pangocffi import Alignment
+
+from pangocairohelpers import Side
+from pangocairohelpers.text_path import LabelSpec
+
+
+def test_defaults():
+    label = LabelSpec('Hi', 'Sans 10', [(0, 0), (10, 0)])
+    assert label.alignment == Alignment.LEFT
+    assert label.side == Side.LEFT
+    assert label.start_offset == 0
+    assert label.vertical_offset == 0
+    assert label.upright
+    assert not label.markup
+
+
+def test_immutability():
+    label = LabelSpec('Hi', 'Sans 10', [(0, 0), (10, 0)])
+    with pytest.raises(AttributeError):
+        label.text = 'Bye'
+    with pytest.raises(AttributeError):
+        del label.font
+
+
+def test_pickle_round_trip():
+    label = LabelSpec(
+        'Hi',
+        'Sans 10',
+        [(0, 0), (10, 0)],
+        Alignment.CENTER,
+        Side.RIGHT,
+        1,
+        2,
+        False,
+        True
+    )
+    restored = pickle.loads(pickle.dumps(label))
+    assert repr(restored) == repr(label)
+    assert restored.alignment == Alignment.CENTER
+    assert restored.side == Side.RIGHT
@@ -0,0 +1,36 @@
+import unittest
+
+from pangocairohelpers._lazy import lazy_exports
+
+
+class TestLazyExports(unittest.TestCase):
+
+    def test_attributes_and_submodules(self):
+        package_globals = {'__name__': 'pangocairohelpers'}
+        getattr_function, dir_function = lazy_exports(
+            'pangocairohelpers',
+            package_globals,
+            {'Side': '.side'},
+            ['line_helper']
+        )
+        from pangocairohelpers import line_helper
+        from pangocairohelpers.side import Side
+        assert getattr_function('Side') is Side
+        assert getattr_function('line_helper') is line_helper
+        # Imported values are cached in the globals of the package
+        assert package_globals['Side'] is Side
+        assert package_globals['line_helper'] is line_helper
+
+        with self.assertRaises(AttributeError):
+            getattr_function('does_not_exist')
+        assert 'does_not_exist' not in package_globals
+
+    def test_dir(self):
+        package_globals = {'__name__': 'pangocairohelpers'}
+        _, dir_function = lazy_exports(
+            'pangocairohelpers',
+            package_globals,
+            {'Side': '.side'},
+            ['line_helper']
+        )
+        assert dir_function() == ['Side', '__name__', 'line_helper']
@@ -0,0 +1,49 @@
+import unittest
+
+from pangocairohelpers.lru_cache import LruCache
+
+
+class TestLruCache(unittest.TestCase):
+
+    def test_get_and_put(self):
+        cache = LruCache(2)
+        assert cache.get('a') is None
+        cache.put('a', 1)
+        assert cache.get('a') == 1
+        assert 'a' in cache
+        assert len(cache) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LruCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.size == 2
+
+    def test_size_function(self):
+        cache = LruCache(10, len)
+        cache.put('a', 'aaaa')
+        cache.put('b', 'bbbb')
+        assert cache.size == 8
+        cache.put('c', 'cccc')
+        assert 'a' not in cache
+        assert cache.size == 8
+        cache.put('d', 'd' * 11)
+        assert 'd' not in cache
+        cache.put('b', 'b')
+        assert cache.size == 5
+
+    def test_get_or_compute(self):
+        cache = LruCache(2)
+        assert cache.get_or_compute('a', lambda: 1) == 1
+        assert cache.get_or_compute('a', lambda: 2) == 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+        assert cache.get_or_compute('a', lambda: 2) == 2
@@ -0,0 +1,109 @@
+import math
+
+import numpy as np
+from shapely.affinity import rotate, translate
+from shapely.geometry import Point, box
+
+from pangocairohelpers import Extent, GlyphExtent, PickIndex
+from pangocairohelpers.text_path import TextPathPlacement, PlacedCluster
+
+
+def _create_placement() -> TextPathPlacement:
+    return TextPathPlacement('Hi', ['Sans 10'], [
+        PlacedCluster(
+            0, 0, 1, 0, [(43, 0, 0)], 10, 20, 0,
+            GlyphExtent(0, 0, 8, 12, 9)
+        ),
+        PlacedCluster(
+            1, 1, 2, 0, [(76, 0, 0)], 18, 20, math.pi / 2,
+            GlyphExtent(8, 0, 4, 12, 9)
+        ),
+    ])
+
+
+def _create_random_placement(count: int, seed: int) -> TextPathPlacement:
+    generator = np.random.default_rng(seed)
+    return TextPathPlacement('', ['Sans 10'], [
+        PlacedCluster(
+            i, i, i + 1, 0, [],
+            generator.uniform(-100, 100),
+            generator.uniform(-100, 100),
+            generator.uniform(-math.pi, math.pi),
+            GlyphExtent(0, 0, generator.uniform(1, 10), 12, 9)
+        )
+        for i in range(count)
+    ])
+
+
+def _to_polygon(cluster: PlacedCluster):
+    extent = cluster.logical_extent
+    top = extent.y - extent.baseline
+    polygon = box(0, top, extent.width, top + extent.height)
+    polygon = rotate(
+        polygon,
+        cluster.rotation,
+        origin=(0, 0),
+        use_radians=True
+    )
+    return translate(polygon, cluster.x, cluster.y)
+
+
+def test_query_point():
+    index = PickIndex([_create_placement()], cell_size=10)
+    assert len(index) == 2
+    assert index.query_point(12, 15) == [(0, 0, 0, 1)]
+    assert index.query_point(25, 22) == [(0, 1, 1, 2)]
+    assert index.query_point(25, 15) == []
+    assert index.pick(12, 15) == (0, 0, 0, 1)
+    assert index.pick(100, 100) is None
+
+
+def test_none_placements_keep_their_index():
+    placement = _create_placement()
+    index = PickIndex([None, placement, placement])
+    assert index.query_point(12, 15) == [(1, 0, 0, 1), (2, 0, 0, 1)]
+    # The placement that is drawn last is on top
+    assert index.pick(12, 15) == (2, 0, 0, 1)
+
+
+def test_empty_index():
+    index = PickIndex([])
+    assert len(index) == 0
+    assert index.pick(0, 0) is None
+    assert index.query_extent(Extent(0, 0, 10, 10)) == []
+
+
+def test_query_extent():
+    index = PickIndex([_create_placement()], cell_size=10)
+    assert index.query_extent(Extent(0, 0, 11, 12)) == [(0, 0, 0, 1)]
+    assert index.query_extent(Extent(0, 0, 100, 100)) == [
+        (0, 0, 0, 1),
+        (0, 1, 1, 2)
+    ]
+    assert index.query_extent(Extent(30, 0, 10, 10)) == []
+
+
+def test_matches_shapely():
+    placement = _create_random_placement(500, 0)
+    index = PickIndex([placement], cell_size=16)
+    polygons = [_to_polygon(cluster) for cluster in placement.clusters]
+
+    generator = np.random.default_rng(1)
+    for x, y in generator.uniform(-110, 110, (200, 2)):
+        expected = [
+            i for i, polygon in enumerate(polygons)
+            if polygon.intersects(Point(x, y))
+        ]
+        assert [pick[1] for pick in index.query_point(x, y)] == expected
+
+    for x, y, width, height in np.column_stack((
+            generator.uniform(-110, 110, (50, 2)),
+            generator.uniform(0, 30, (50, 2))
+    )):
+        query = box(x, y, x + width, y + height)
+        expected = [
+            i for i, polygon in enumerate(polygons)
+            if polygon.intersects(query)
+        ]
+        picks = index.query_extent(Extent(x, y, width, height))
+        assert [pick[1] for pick in picks] == expected
@@ -0,0 +1,120 @@
+import array
+import math
+import unittest
+
+import numpy as np
+from shapely.geometry import LineString, Point
+
+from pangocairohelpers import polyline_helper
+from pangocairohelpers.path import PathAbstract, PolylinePath, as_path
+from pangocairohelpers.path import polyline_path
+
+
+class TestPolylinePath(unittest.TestCase):
+
+    coords = [[0, 0], [10, 0], [10, 10], [0, 10]]
+
+    def test_matches_shapely(self):
+        line_string = LineString(self.coords)
+        path = PolylinePath(self.coords)
+        assert path.length == line_string.length
+
+        offsets = np.linspace(0, line_string.length, 13)
+        for offset, position in zip(offsets, path.interpolate(offsets)):
+            expected = line_string.interpolate(offset)
+            assert math.isclose(position[0], expected.x, abs_tol=1e-9)
+            assert math.isclose(position[1], expected.y, abs_tol=1e-9)
+
+        for coord in [[2, 1], [12, 5], [3, 9], [-1, -1]]:
+            assert math.isclose(
+                path.project(np.array(coord)),
+                line_string.project(Point(coord))
+            )
+
+    def test_angles_at(self):
+        path = PolylinePath(self.coords)
+        angles = path.angles_at([0, 5, 15, 25])
+        assert np.allclose(angles, [0, 0, math.pi / 2, math.pi])
+
+    def test_coords_are_not_copied(self):
+        coords = np.array(self.coords, dtype=float)
+        path = PolylinePath(coords)
+        assert np.shares_memory(path.coords, coords)
+
+    def test_buffer_protocol_input(self):
+        buffer = array.array('d', [0, 0, 3, 4])
+        coords = np.frombuffer(buffer).reshape(-1, 2)
+        path = PolylinePath(coords)
+        assert path.length == 5
+        assert np.shares_memory(path.coords, coords)
+
+    def test_extra_columns_are_ignored(self):
+        path = PolylinePath([[0, 0, 1], [3, 4, 2]])
+        assert path.coords.shape == (2, 2)
+        assert path.length == 5
+
+    def test_invalid_coords(self):
+        with self.assertRaises(ValueError):
+            PolylinePath([[0, 0]])
+        with self.assertRaises(ValueError):
+            PolylinePath([0, 1, 2])
+
+    def test_reversed(self):
+        path = PolylinePath(self.coords).reversed()
+        assert path.coords.tolist() == self.coords[::-1]
+        assert path.length == 30
+
+    def test_reversed_shares_segment_index(self):
+        random = np.random.default_rng(0)
+        count = polyline_path.SEGMENT_INDEX_THRESHOLD + 10
+        coords = np.cumsum(random.normal(size=(count, 2)), axis=0)
+        path = PolylinePath(coords)
+        reversed_path = path.reversed()
+        assert reversed_path.reversed() is path
+        for point in random.uniform(-10, 10, size=(20, 2)) + coords[500]:
+            assert np.isclose(
+                reversed_path.project(point),
+                polyline_helper.project(
+                    reversed_path.coords,
+                    reversed_path.lengths,
+                    point
+                )
+            )
+        assert reversed_path._segment_index is None
+        assert path._segment_index is not None
+
+    def test_substring(self):
+        path = PolylinePath(self.coords).substring(5, 15)
+        assert path.coords.tolist() == [[5, 0], [10, 0], [10, 5]]
+        assert path.length == 10
+
+    def test_simplified(self):
+        path = PolylinePath([[0, 0], [5, 1], [10, 0], [10, 10]])
+        simplified = path.simplified(2)
+        assert simplified.coords.tolist() == [[0, 0], [10, 0], [10, 10]]
+        assert path.simplified(2) is simplified
+        assert path.simplified(0.5) is path
+
+    def test_simplified_paths_are_bounded(self):
+        path = PolylinePath([[0, 0], [5, 1], [10, 0], [10, 10]])
+        simplified = path.simplified(2)
+        for i in range(polyline_path.SIMPLIFIED_CACHE_SIZE):
+            path.simplified(3 + i)
+        # The least recently used simplified path was evicted
+        assert path.simplified(2) is not simplified
+        assert path.simplified(2).coords.tolist() == \
+            simplified.coords.tolist()
+
+    def test_to_line_string(self):
+        line_string = PolylinePath(self.coords).to_line_string()
+        assert isinstance(line_string, LineString)
+        assert list(line_string.coords) == [
+            tuple(coord) for coord in self.coords
+        ]
+
+    def test_as_path(self):
+        path = PolylinePath(self.coords)
+        assert as_path(path) is path
+        assert isinstance(as_path(LineString(self.coords)), PolylinePath)
+        assert isinstance(as_path(self.coords), PathAbstract)
+        assert as_path(self.coords).length == 30
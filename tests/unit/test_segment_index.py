@@ -0,0 +1,114 @@
+import unittest
+
+import numpy as np
+from shapely.geometry import LineString
+
+from pangocairohelpers import Extent, polyline_helper
+from pangocairohelpers.path import PolylinePath, SegmentIndex
+from pangocairohelpers.path import polyline_path
+
+
+class TestSegmentIndex(unittest.TestCase):
+
+    @staticmethod
+    def _random_walk(count: int) -> np.ndarray:
+        random = np.random.default_rng(0)
+        return np.cumsum(random.normal(size=(count, 2)), axis=0)
+
+    def test_nearest_matches_brute_force(self):
+        random = np.random.default_rng(1)
+        for count in [2, 3, 17, 300, 5000]:
+            coords = self._random_walk(count)
+            lengths = polyline_helper.cumulative_lengths(coords)
+            index = SegmentIndex(coords, leaf_size=4, branching=4)
+            assert len(index) == count - 1
+            points = random.uniform(
+                coords.min(axis=0) - 5,
+                coords.max(axis=0) + 5,
+                size=(50, 2)
+            )
+            for point in points:
+                segment, ratio, distance = index.nearest(point)
+                offset = lengths[segment] + \
+                    (lengths[segment + 1] - lengths[segment]) * ratio
+                assert np.isclose(
+                    offset,
+                    polyline_helper.project(coords, lengths, point)
+                )
+                nearest = coords[segment] + \
+                    (coords[segment + 1] - coords[segment]) * ratio
+                assert np.isclose(distance, np.hypot(*(nearest - point)))
+
+    def test_nearest_returns_first_of_equal_segments(self):
+        coords = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=float)
+        index = SegmentIndex(coords, leaf_size=1, branching=2)
+        assert index.nearest([5, 5]) == (0, 0.5, 5)
+
+    def test_query(self):
+        coords = self._random_walk(2000)
+        index = SegmentIndex(coords)
+        extent = Extent(coords[100, 0] - 3, coords[100, 1] - 3, 6, 6)
+        mins = np.minimum(coords[:-1], coords[1:])
+        maxs = np.maximum(coords[:-1], coords[1:])
+        expected = np.flatnonzero(
+            (mins[:, 0] <= extent.x + extent.width) &
+            (maxs[:, 0] >= extent.x) &
+            (mins[:, 1] <= extent.y + extent.height) &
+            (maxs[:, 1] >= extent.y)
+        )
+        result = index.query(extent)
+        assert 99 in result
+        assert result.tolist() == expected.tolist()
+        assert len(index.query(Extent(1e6, 1e6, 1, 1))) == 0
+
+    def test_polyline_path_projects_with_index(self):
+        coords = self._random_walk(polyline_path.SEGMENT_INDEX_THRESHOLD + 10)
+        path = PolylinePath(coords)
+        point = coords[500] + 0.25
+        assert np.isclose(
+            path.project(point),
+            polyline_helper.project(coords, path.lengths, point)
+        )
+        assert isinstance(path.segment_index, SegmentIndex)
+        assert path.segment_index is path.segment_index
+
+    def test_find_crossings_matches_brute_force(self):
+        for count in [2, 3, 4, 17, 300]:
+            coords = self._random_walk(count)
+            index = SegmentIndex(coords, leaf_size=4, branching=4)
+            expected = [
+                [i, j]
+                for i in range(count - 1)
+                for j in range(i + 2, count - 1)
+                if LineString(coords[i:i + 2]).intersects(
+                    LineString(coords[j:j + 2])
+                )
+            ]
+            crossings = index.find_crossings()
+            assert sorted(crossings.tolist()) == expected
+
+    def test_find_crossings_of_simple_polyline(self):
+        coords = np.array([[0, 0], [20, 0], [20, 10], [14, 10], [14, 1]])
+        assert len(SegmentIndex(coords).find_crossings()) == 0
+
+        coords = np.array([[0, 0], [20, 0], [20, 10], [14, 10], [14, -1]])
+        assert SegmentIndex(coords).find_crossings().tolist() == [[0, 3]]
+
+    def test_query_extents_matches_query(self):
+        coords = self._random_walk(2000)
+        index = SegmentIndex(coords, leaf_size=4, branching=4)
+        mins = coords[::100] - [[3, 1]]
+        maxs = coords[::100] + [[1, 3]]
+        # Extents can be infinite, like rays.
+        mins[-1] = [coords[-1, 0], coords[-1, 1]]
+        maxs[-1] = [np.inf, coords[-1, 1]]
+        pairs = index.query_extents(mins, maxs)
+        for i, (extent_min, extent_max) in enumerate(zip(mins, maxs)):
+            width, height = np.minimum(extent_max - extent_min, 1e6)
+            expected = index.query(
+                Extent(extent_min[0], extent_min[1], width, height)
+            )
+            assert sorted(pairs[pairs[:, 0] == i, 1].tolist()) == \
+                expected.tolist()
+        assert len(index.query_extents(np.empty((0, 2)), np.empty((0, 2)))) \
+            == 0
@@ -0,0 +1,44 @@
+import math
+import unittest
+
+import numpy as np
+from shapely.geometry import Point
+
+from pangocairohelpers import GlyphExtent
+from pangocairohelpers.text_path import TextPathGlyphArrays, \
+    TextPathGlyphItem
+
+
+class TestTextPathGlyphArrays(unittest.TestCase):
+
+    def test_from_text_path_glyph_items(self):
+        glyph_arrays = TextPathGlyphArrays.from_text_path_glyph_items([
+            TextPathGlyphItem(
+                None, Point(1, 2), 0.5, GlyphExtent(0, 0, 10, 20, 15), 3
+            ),
+            TextPathGlyphItem(
+                None, Point(3, 4), 0.25, GlyphExtent(10, 0, 5, 20, 15), 4
+            ),
+        ])
+        assert len(glyph_arrays) == 2
+        assert glyph_arrays.positions.tolist() == [[1, 2], [3, 4]]
+        assert glyph_arrays.rotations.tolist() == [0.5, 0.25]
+        assert glyph_arrays.extents.tolist() == [
+            [0, -15, 10, 20],
+            [0, -15, 5, 20]
+        ]
+        assert glyph_arrays.cluster_indices.tolist() == [3, 4]
+
+    def test_compute_bounding_boxes(self):
+        glyph_arrays = TextPathGlyphArrays(
+            np.array([[100, 100], [100, 100]], dtype=float),
+            np.array([0, math.pi / 2]),
+            np.array([[0, -15, 10, 20], [0, -15, 10, 20]], dtype=float),
+            np.array([0, 1])
+        )
+        boxes = glyph_arrays.compute_bounding_boxes()
+        assert np.allclose(boxes, [
+            [100, 85, 110, 105],
+            [95, 100, 115, 110]
+        ])
+        assert glyph_arrays.compute_corners().shape == (2, 4, 2)
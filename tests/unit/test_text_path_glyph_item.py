@@ -0,0 +1,53 @@
+import math
+import unittest
+
+from shapely.geometry import Point
+
+from pangocairohelpers import GlyphExtent
+from pangocairohelpers.text_path import TextPathGlyphItem
+
+
+class TestTextPathGlyphItem(unittest.TestCase):
+
+    def test_compute_bounding_extent(self):
+        logical_extent = GlyphExtent(0, 0, 10, 20, 15)
+        text_path_glyph_item = TextPathGlyphItem(
+            None,
+            Point(100, 100),
+            0,
+            logical_extent
+        )
+        extent = text_path_glyph_item.compute_bounding_extent()
+        assert math.isclose(extent.x, 100)
+        assert math.isclose(extent.y, 85)
+        assert math.isclose(extent.width, 10)
+        assert math.isclose(extent.height, 20)
+
+    def test_compute_bounding_extent_when_rotated(self):
+        logical_extent = GlyphExtent(0, 0, 10, 20, 15)
+        text_path_glyph_item = TextPathGlyphItem(
+            None,
+            Point(100, 100),
+            math.pi / 2,
+            logical_extent
+        )
+        extent = text_path_glyph_item.compute_bounding_extent()
+        assert math.isclose(extent.x, 95)
+        assert math.isclose(extent.y, 100)
+        assert math.isclose(extent.width, 20)
+        assert math.isclose(extent.height, 10)
+
+    def test_position_from_tuple(self):
+        text_path_glyph_item = TextPathGlyphItem(
+            None,
+            (1.5, 2.5),
+            0,
+            GlyphExtent(0, 0, 10, 20, 15),
+            3
+        )
+        assert text_path_glyph_item.coords == (1.5, 2.5)
+        assert text_path_glyph_item.position.equals(Point(1.5, 2.5))
+        assert text_path_glyph_item.cluster_index == 3
+        with self.assertRaises(AttributeError):
+            text_path_glyph_item.rotation = 1
+        assert not hasattr(text_path_glyph_item, '__dict__')
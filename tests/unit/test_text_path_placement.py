@@ -0,0 +1,80 @@
+import json
+import math
+import pickle
+import unittest
+
+from pangocairohelpers import GlyphExtent
+from pangocairohelpers.text_path import TextPathPlacement, PlacedCluster
+
+
+class TestTextPathPlacement(unittest.TestCase):
+
+    @staticmethod
+    def _create_placement() -> TextPathPlacement:
+        return TextPathPlacement('Hi', ['Sans 10'], [
+            PlacedCluster(
+                0, 0, 1, 0, [(43, 0, 0)], 10, 20, 0,
+                GlyphExtent(0, 0, 8, 12, 9)
+            ),
+            PlacedCluster(
+                1, 1, 2, 0, [(76, 0, 0)], 18, 20, math.pi / 2,
+                GlyphExtent(8, 0, 4, 12, 9)
+            ),
+        ])
+
+    def test_dict_round_trip(self):
+        placement = self._create_placement()
+        data = json.loads(json.dumps(placement.to_dict()))
+        restored = TextPathPlacement.from_dict(data)
+
+        assert restored.text == 'Hi'
+        assert restored.fonts == ['Sans 10']
+        assert len(restored.clusters) == 2
+        cluster = restored.clusters[1]
+        assert cluster.cluster_index == 1
+        assert (cluster.start_index, cluster.end_index) == (1, 2)
+        assert cluster.glyphs == [(76, 0, 0)]
+        assert (cluster.x, cluster.y) == (18, 20)
+        assert cluster.rotation == math.pi / 2
+        assert cluster.logical_extent.width == 4
+        assert cluster.logical_extent.baseline == 9
+
+    def test_pickle(self):
+        placement = pickle.loads(pickle.dumps(self._create_placement()))
+        assert placement.to_dict() == self._create_placement().to_dict()
+
+    def test_compute_bounding_extent(self):
+        extent = self._create_placement().compute_bounding_extent()
+        assert math.isclose(extent.x, 10)
+        assert math.isclose(extent.y, 11)
+        assert math.isclose(extent.width, 17)
+        assert math.isclose(extent.height, 13)
+
+        assert TextPathPlacement('', [], []).compute_bounding_extent() is None
+
+    def test_compute_cluster_extents(self):
+        extents = self._create_placement().compute_cluster_extents()
+        assert len(extents) == 2
+        for extent, expected in zip(extents, [
+            (10, 11, 8, 12),
+            (15, 20, 12, 4)
+        ]):
+            values = (extent.x, extent.y, extent.width, extent.height)
+            assert all(map(math.isclose, values, expected))
+
+    def test_transformed(self):
+        # A quarter turn around the origin, moved down by 100
+        placement = self._create_placement().transformed((0, -1, 1, 0, 0, 100))
+        assert placement.text == 'Hi'
+        assert placement.fonts == ['Sans 10']
+        cluster = placement.clusters[1]
+        assert (cluster.start_index, cluster.end_index) == (1, 2)
+        assert math.isclose(cluster.x, -20)
+        assert math.isclose(cluster.y, 118)
+        assert math.isclose(cluster.rotation, math.pi)
+        assert cluster.logical_extent == GlyphExtent(8, 0, 4, 12, 9)
+
+        with self.assertRaises(ValueError):
+            self._create_placement().transformed((1, 0, 0, -1, 0, 0))
+        with self.assertRaises(ValueError):
+            self._create_placement().transformed((1, 0, 0, 2, 0, 0))
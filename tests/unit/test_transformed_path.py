@@ -0,0 +1,99 @@
+import math
+import unittest
+
+import numpy as np
+
+from pangocairohelpers.path import ArcPath, PolylinePath, TransformedPath
+from pangocairohelpers.path.transformed_path import apply_transform, \
+    get_similarity
+
+
+class TestTransformedPath(unittest.TestCase):
+
+    coords = [[0, 0], [10, 0], [10, 20], [30, 25]]
+
+    # A rotation by a quarter turn, scaled by 2 and moved
+    similarity = (0, -2, 2, 0, 5, 7)
+
+    def _assert_matches_transformed_coords(self, transform):
+        path = TransformedPath(PolylinePath(self.coords), transform)
+        expected = PolylinePath(apply_transform(transform, self.coords))
+        offsets = np.linspace(0, expected.length, 13)
+
+        assert math.isclose(path.length, expected.length)
+        assert np.allclose(
+            path.interpolate(offsets),
+            expected.interpolate(offsets)
+        )
+        assert np.allclose(
+            np.cos(path.angles_at(offsets)),
+            np.cos(expected.angles_at(offsets))
+        )
+        assert np.allclose(
+            np.sin(path.angles_at(offsets)),
+            np.sin(expected.angles_at(offsets))
+        )
+        assert math.isclose(
+            path.project(np.array([40, 20])),
+            expected.project(np.array([40, 20]))
+        )
+        assert np.allclose(path.to_coords(), expected.to_coords())
+        assert np.allclose(
+            path.substring(5, 30).to_coords(),
+            expected.substring(5, 30).to_coords()
+        )
+        assert np.allclose(
+            path.reversed().to_coords(),
+            expected.reversed().to_coords()
+        )
+
+    def test_similarity(self):
+        self._assert_matches_transformed_coords(self.similarity)
+
+    def test_reflection(self):
+        self._assert_matches_transformed_coords((3, 0, 0, -3, 0, 100))
+
+    def test_general_transform(self):
+        self._assert_matches_transformed_coords((1, 0.5, 0, 2, 0, 0))
+
+    def test_get_similarity(self):
+        scale, rotation, reflected = get_similarity(self.similarity)
+        assert math.isclose(scale, 2)
+        assert math.isclose(rotation, math.pi / 2)
+        assert not reflected
+
+        assert get_similarity((1, 0, 0, -1, 0, 0))[2]
+        assert get_similarity((1, 0.5, 0, 2, 0, 0)) is None
+        assert get_similarity((2, 0, 0, 3, 0, 0)) is None
+        assert get_similarity((0, 0, 0, 0, 0, 0)) is None
+
+    def test_offset(self):
+        arc = ArcPath((0, 0), 10, 0, math.pi / 2)
+        for transform in [self.similarity, (3, 0, 0, -3, 0, 100)]:
+            path = TransformedPath(arc, transform)
+            offset_path = path.offset(6)
+            assert isinstance(offset_path, TransformedPath)
+
+            # Offsets to the left of the path stay to its left when the path
+            # is reflected.
+            position = path.interpolate([0])[0]
+            angle = path.angles_at([0])[0]
+            left = position + 6 * np.array([math.sin(angle), -math.cos(angle)])
+            assert np.allclose(offset_path.interpolate([0])[0], left)
+
+        assert TransformedPath(
+            PolylinePath(self.coords),
+            self.similarity
+        ).offset(6) is None
+
+    def test_simplified_shares_the_original_path(self):
+        original = PolylinePath([[0, 0], [10, 0.1], [20, 0]])
+        path = TransformedPath(original, self.similarity)
+        assert path.simplified(0.01) is path
+        simplified_path = path.simplified(1)
+        assert isinstance(simplified_path, TransformedPath)
+        assert len(simplified_path.to_coords()) == 2
+        assert np.allclose(
+            simplified_path.to_coords(),
+            apply_transform(self.similarity, [[0, 0], [20, 0]])
+        )
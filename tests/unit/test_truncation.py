@@ -0,0 +1,37 @@
+import numpy as np
+
+from pangocairohelpers.text_path.truncation import \
+    get_truncated_cluster_count, is_grapheme_boundary
+
+
+def test_is_grapheme_boundary():
+    assert is_grapheme_boundary('a', 'b')
+    assert is_grapheme_boundary('', 'b')
+    # A combining accent belongs to the letter before it
+    assert not is_grapheme_boundary('e', '\u0301')
+    assert not is_grapheme_boundary('\r', '\n')
+    # Emoji sequences joined by a zero width joiner, or with a skin tone
+    assert not is_grapheme_boundary('\U0001f469', '\u200d')
+    assert not is_grapheme_boundary('\u200d', '\U0001f467')
+    assert not is_grapheme_boundary('\U0001f44b', '\U0001f3fd')
+    # Flags are pairs of regional indicators
+    assert not is_grapheme_boundary('\U0001f1ec', '\U0001f1e7')
+    assert is_grapheme_boundary('\U0001f1ec\U0001f1e7', '\U0001f1eb')
+
+
+def test_get_truncated_cluster_count():
+    texts = list('Long Name')
+    widths = np.full(len(texts), 10.0)
+    assert get_truncated_cluster_count(widths, texts, 90) == 9
+    assert get_truncated_cluster_count(widths, texts, 35) == 3
+    assert get_truncated_cluster_count(widths, texts, 5) == 0
+    # Whitespace before the ellipsis is left out
+    assert get_truncated_cluster_count(widths, texts, 55) == 4
+
+
+def test_get_truncated_cluster_count_keeps_grapheme_clusters():
+    texts = ['a', 'e', '\u0301', 'b']
+    widths = np.array([10.0, 10.0, 0.0, 10.0])
+    assert get_truncated_cluster_count(widths, texts, 25) == 3
+    widths = np.array([10.0, 10.0, 5.0, 10.0])
+    assert get_truncated_cluster_count(widths, texts, 22) == 1